@@ -2,14 +2,17 @@ import logging
 import yaml
 import json
 import os
-import shutil
 
 from concurrent.futures import ThreadPoolExecutor
 
 from .load_plugins import load_plugins
 from .load_dashboard import load_dashboard
-from .const import DOMAIN, VERSION
-from .process_yaml import process_yaml, reload_configuration
+from .const import DOMAIN
+from .process_yaml import async_update_more_pages, clear_render_cache, process_yaml, reload_configuration
+from .config_snapshot import ConfigSnapshot
+from .config_store import ConfigStore
+from .yaml_loader import load_yaml_folder
+from .watcher import DashboardWatcher
 from .notifications import notifications
 from datetime import datetime
 
@@ -17,6 +20,7 @@ import voluptuous as vol
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.config import ConfigType
 from homeassistant.components import frontend, websocket_api
+from homeassistant.components.websocket_api.messages import construct_result_message
 from homeassistant.helpers import entity_registry as er
 from homeassistant.util import slugify
 from homeassistant.const import Platform
@@ -38,6 +42,19 @@ entities = OrderedDict()
 devices = OrderedDict()
 homepage_header = OrderedDict()
 
+
+def _has_content(path):
+    """Return True when the file exists and is not empty, run in the executor."""
+    return os.path.exists(path) and os.stat(path).st_size != 0
+
+
+def _load_yaml_config(path):
+    """Read and parse a config file in one executor job, empty when missing."""
+    if not _has_content(path):
+        return OrderedDict()
+    with open(path, "r") as f:
+        return yaml.safe_load(f) or OrderedDict()
+
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     #_LOGGER.warning("async_setup")
 
@@ -50,7 +67,9 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     hass.data[DOMAIN] = {
         "notifications": {},
         "commands": {},
-        'latest_version': ""
+        'latest_version': "",
+        "config_snapshot": ConfigSnapshot(hass),
+        "config_store": ConfigStore(hass),
     }
 
     websocket_api.async_register_command(hass, websocket_get_configuration)
@@ -108,188 +127,22 @@ async def websocket_get_configuration(
     msg: Mapping[str, Any],
 ) -> None:
     """Return a list of configuration."""
-
-    # Initialize all needed variables
-    #areas = OrderedDict()
-    #entities = OrderedDict()
-    #devices = OrderedDict()
-    #homepage_header = OrderedDict()
     global areas
     global entities
     global devices
     global homepage_header
 
-    # These need to be loaded here so any changes are reflected immediately.
-    areas = (
-        await hass.async_add_executor_job(os.path.exists, hass.config.path("dwains-dashboard/configs/areas.yaml"))
-    )
-
-    if areas:
-        areas = await hass.async_add_executor_job(
-            lambda: yaml.safe_load(open(hass.config.path("dwains-dashboard/configs/areas.yaml"), "r"))
-        )
-    else:
-        areas = OrderedDict()
-
-    entities = (
-        await hass.async_add_executor_job(os.path.exists, hass.config.path("dwains-dashboard/configs/entities.yaml"))
-    )
-
-    if entities:
-        entities = await hass.async_add_executor_job(
-            lambda: yaml.safe_load(open(hass.config.path("dwains-dashboard/configs/entities.yaml"), "r"))
-        )
-    else:
-        entities = OrderedDict()
-
-
-    devices = (
-        await hass.async_add_executor_job(os.path.exists, hass.config.path("dwains-dashboard/configs/devices.yaml"))
-    )
-
-    if devices:
-        devices = await hass.async_add_executor_job(
-            lambda: yaml.safe_load(open(hass.config.path("dwains-dashboard/configs/devices.yaml"), "r"))
-        )
-    else:
-        devices = OrderedDict()
-
-    homepage_header = (
-        await hass.async_add_executor_job(os.path.exists, hass.config.path("dwains-dashboard/configs/settings.yaml"))
-    )
-
-    if homepage_header:
-        homepage_header = await hass.async_add_executor_job(
-            lambda: yaml.safe_load(open(hass.config.path("dwains-dashboard/configs/settings.yaml"), "r"))
-        )
-    else:
-        homepage_header = OrderedDict()
-
-    area_cards = {}
-    if os.path.isdir(hass.config.path("dwains-dashboard/configs/cards/areas")):
-        #for subdir in await listdir_async(hass.config.path("dwains-dashboard/configs/cards/areas")):
-        subdirs = await hass.async_add_executor_job(os.listdir, hass.config.path("dwains-dashboard/configs/cards/areas"))
-        for subdir in subdirs:
-            area_cards[subdir] = {}
-            #for fname in sorted(await listdir_async(hass.config.path(f"dwains-dashboard/configs/cards/areas/{subdir}"))):
-            fnames = sorted(await hass.async_add_executor_job(os.listdir, hass.config.path(f"dwains-dashboard/configs/cards/areas/{subdir}")))
-            for fname in fnames:
-                if fname.endswith('.yaml'):
-                    #_LOGGER.warning(f"websocket_get_configuration() area_cards: {fname}")
-                    data = await hass.async_add_executor_job(open, hass.config.path(f"dwains-dashboard/configs/cards/areas/{subdir}/{fname}"), "r")
-                    with data as f:
-                        filecontent = yaml.safe_load(f)
-                        area_cards[subdir].update({fname: filecontent})
-
-    device_cards = {}
-    if os.path.isdir(hass.config.path("dwains-dashboard/configs/cards/devices")):
-        #for subdir in await listdir_async(hass.config.path("dwains-dashboard/configs/cards/devices")):
-        subdirs = await hass.async_add_executor_job(os.listdir, hass.config.path("dwains-dashboard/configs/cards/devices"))
-        for subdir in subdirs:
-            device_cards[subdir] = {}
-            #for fname in sorted(await listdir_async(hass.config.path(f"dwains-dashboard/configs/cards/devices/{subdir}"))):
-            fnames = sorted(await hass.async_add_executor_job(os.listdir, hass.config.path(f"dwains-dashboard/configs/cards/devices/{subdir}")))
-            for fname in fnames:
-                if fname.endswith('.yaml'):
-                    #_LOGGER.warning(f"websocket_get_configuration() device_cards: {fname}")
-                    #file_path = hass.config.path(f"dwains-dashboard/configs/cards/devices/{subdir}/{fname}")
-                    #filecontent = await read_yaml_file(file_path)
-                    data = await hass.async_add_executor_job(open, hass.config.path(f"dwains-dashboard/configs/cards/devices/{subdir}/{fname}"), "r")
-                    with data as f:
-                        filecontent = yaml.safe_load(f)
-                        device_cards[subdir].update({fname: filecontent})
-
-
-    entity_cards = {}
-    if os.path.isdir(hass.config.path("dwains-dashboard/configs/cards/entities")):
-        #for fname in await listdir_async(hass.config.path("dwains-dashboard/configs/cards/entities")):
-        fnames = await hass.async_add_executor_job(os.listdir, hass.config.path("dwains-dashboard/configs/cards/entities"))
-        for fname in fnames:
-            if fname.endswith('.yaml'):
-                #_LOGGER.warning(f"websocket_get_configuration() entity_cards: {fname}")
-                #file_path = hass.config.path(f"dwains-dashboard/configs/cards/entities/{fname}")
-                #filecontent = await read_yaml_file(file_path)
-                data = await hass.async_add_executor_job(open, hass.config.path(f"dwains-dashboard/configs/cards/entities/{fname}"), "r")
-                with data as f:
-                    filecontent = yaml.safe_load(f)
-                    entity_cards.update({fname.replace(".yaml",""): filecontent})
-
-    entities_popup = {}
-    if os.path.isdir(hass.config.path("dwains-dashboard/configs/cards/entities_popup")):
-        #for fname in await listdir_async(hass.config.path("dwains-dashboard/configs/cards/entities_popup")):
-        fnames = await hass.async_add_executor_job(os.listdir, hass.config.path("dwains-dashboard/configs/cards/entities_popup"))
-        for fname in fnames:
-            if fname.endswith('.yaml'):
-                #_LOGGER.warning(f"websocket_get_configuration() entities_popup: {fname}")
-                #file_path = hass.config.path(f"dwains-dashboard/configs/cards/entities_popup/{fname}")
-                #filecontent = await read_yaml_file(file_path)
-                data = await hass.async_add_executor_job(open, hass.config.path(f"dwains-dashboard/configs/cards/entities_popup/{fname}"), "r")
-                with data as f:
-                    filecontent = yaml.safe_load(f)
-                    entities_popup.update({fname.replace(".yaml",""): filecontent})
-
-    devices_card = {}
-    path_devices_card = hass.config.path("dwains-dashboard/configs/cards/devices_card")
-    if os.path.isdir(path_devices_card):
-        #for fname in await listdir_async(hass.config.path("dwains-dashboard/configs/cards/devices_card")):
-        fnames = await hass.async_add_executor_job(os.listdir, hass.config.path("dwains-dashboard/configs/cards/devices_card"))
-        for fname in fnames:
-            if fname.endswith('.yaml'):
-                #_LOGGER.warning(f"websocket_get_configuration() devices_card: {fname}")
-                #file_path = hass.config.path(f"dwains-dashboard/configs/cards/devices_card/{fname}")
-                #filecontent = await read_yaml_file(file_path)
-                data = await hass.async_add_executor_job(open, hass.config.path(f"dwains-dashboard/configs/cards/devices_card/{fname}"), "r")
-                with data as f:
-                    filecontent = yaml.safe_load(f)
-                    devices_card.update({fname.replace(".yaml",""): filecontent})
-
-    devices_popup = {}
-    if os.path.isdir(hass.config.path("dwains-dashboard/configs/cards/devices_popup")):
-        #for fname in await listdir_async(hass.config.path("dwains-dashboard/configs/cards/devices_popup")):
-        fnames = await hass.async_add_executor_job(os.listdir, hass.config.path("dwains-dashboard/configs/cards/devices_popup"))
-        for fname in fnames:
-            if fname.endswith('.yaml'):
-                #_LOGGER.warning(f"websocket_get_configuration() devices_popup: {fname}")
-                #file_path = hass.config.path(f"dwains-dashboard/configs/cards/devices_popup/{fname}")
-                #filecontent = await read_yaml_file(file_path)
-                data = await hass.async_add_executor_job(open, hass.config.path(f"dwains-dashboard/configs/cards/devices_popup/{fname}"), "r")
-                with data as f:
-                    filecontent = yaml.safe_load(f)
-                    devices_popup.update({fname.replace(".yaml",""): filecontent})
-
-    more_pages = {}
-    if os.path.isdir(hass.config.path("dwains-dashboard/configs/more_pages")):
-        #for subdir in await listdir_async(hass.config.path("dwains-dashboard/configs/more_pages")):
-        subdirs = await hass.async_add_executor_job(os.listdir, hass.config.path("dwains-dashboard/configs/more_pages"))
-        for subdir in subdirs:
-            if (os.path.exists(hass.config.path("dwains-dashboard/configs/more_pages/"+subdir+"/page.yaml"))) and (os.path.exists(hass.config.path("dwains-dashboard/configs/more_pages/"+subdir+"/config.yaml"))):
-                if fname.endswith('.yaml'):
-                    #_LOGGER.warning(f"websocket_get_configuration() more_pages: {fname}")
-                    data = await hass.async_add_executor_job(open, hass.config.path(f"dwains-dashboard/configs/more_pages/{subdir}/config.yaml"), "r")
-                    with data as f:
-                        filecontent = yaml.safe_load(f)
-                        more_pages[subdir] = filecontent
-
-    #_LOGGER.warning(f"websocket_get_configuration() {cards}")
+    # Write pending edits first, the snapshot is only rebuilt when files in the configs folder changed.
+    await hass.data[DOMAIN]["config_store"].async_flush()
+    snapshot = hass.data[DOMAIN]["config_snapshot"]
+    payload = await snapshot.async_get()
 
-    connection.send_result(
-        msg["id"],
-        {
-            "areas": areas,
-            "area_cards": area_cards,
-            "device_cards": device_cards,
-            "entity_cards": entity_cards,
-            "entities_popup": entities_popup,
-            "entities": entities,
-            "devices": devices,
-            "homepage_header": homepage_header,
-            "more_pages": more_pages,
-            "installed_version": VERSION,
-            "devices_card": devices_card,
-            "devices_popup": devices_popup,
+    areas = snapshot.data["areas"]
+    entities = snapshot.data["entities"]
+    devices = snapshot.data["devices"]
+    homepage_header = snapshot.data["homepage_header"]
 
-        }
-    )
+    connection.send_message(construct_result_message(msg["id"], payload))
 
 
 #get_blueprints
@@ -303,28 +156,10 @@ async def websocket_get_blueprints(
 ) -> None:
     """Return a list of installed blueprints asynchronously."""
 
-    blueprints = {}
-
-    blueprints_dir = hass.config.path("dwains-dashboard/blueprints")
-
-    #if os.path.isdir(hass.config.path("dwains-dashboard/blueprints")):
-    if await hass.async_add_executor_job(os.path.isdir, blueprints_dir):
-        #for fname in os.listdir(hass.config.path("dwains-dashboard/blueprints")):
-        file_list = await hass.async_add_executor_job(os.listdir, blueprints_dir)
-
-        for fname in file_list:
-            if fname.endswith(".yaml"):
-                file_path = os.path.join(blueprints_dir, fname)
-
-                try:
-                    # Open the file asynchronously by using async_add_executor_job
-                    data = await hass.async_add_executor_job(open, file_path, "r")
-                    with data as f:
-                        filecontent = yaml.safe_load(f)
-                        blueprints[fname] = filecontent
-
-                except Exception as e:
-                    _LOGGER.error(f"Error loading blueprint {fname}: {e}")
+    # All blueprints are loaded in parallel in one executor job, broken files are logged and skipped
+    blueprints = await hass.async_add_executor_job(
+        load_yaml_folder, hass.config.path("dwains-dashboard/blueprints")
+    )
 
     connection.send_result(
         msg["id"],
@@ -378,9 +213,7 @@ async def ws_handle_install_blueprint(
             os.makedirs(hass.config.path("dwains-dashboard/button_card_templates/blueprints"))
         
         #with open(hass.config.path("dwains-dashboard/button_card_templates/blueprints/"+filename), 'w') as f:
-        data = await hass.async_add_executor_job(open, hass.config.path("dwains-dashboard/button_card_templates/blueprints/"+filename), "w")
-        with data as f:
-            yaml.dump(filecontent.get("button_card_templates"), f, default_flow_style=False, sort_keys=False)
+        await hass.data[DOMAIN]["config_store"].async_write_file(hass.config.path("dwains-dashboard/button_card_templates/blueprints/"+filename), filecontent.get("button_card_templates"), sort_keys=False)
 
         filecontent.pop("button_card_templates")
 
@@ -389,9 +222,7 @@ async def ws_handle_install_blueprint(
             os.makedirs(hass.config.path("dwains-dashboard/apexcharts_card_templates/blueprints"))
         
         #with open(hass.config.path("dwains-dashboard/apexcharts_card_templates/blueprints/"+filename), 'w') as f:
-        data = await hass.async_add_executor_job(open, hass.config.path("dwains-dashboard/apexcharts_card_templates/blueprints/"+filename), "w")
-        with data as f:
-            yaml.dump(filecontent.get("apexcharts_card_templates"), f, default_flow_style=False, sort_keys=False)
+        await hass.data[DOMAIN]["config_store"].async_write_file(hass.config.path("dwains-dashboard/apexcharts_card_templates/blueprints/"+filename), filecontent.get("apexcharts_card_templates"), sort_keys=False)
 
         filecontent.pop("apexcharts_card_templates")
 
@@ -399,9 +230,7 @@ async def ws_handle_install_blueprint(
         os.makedirs(hass.config.path("dwains-dashboard/blueprints"))
     
     #with open(hass.config.path("dwains-dashboard/blueprints/"+filename), 'w') as f:
-    data = await hass.async_add_executor_job(open, hass.config.path("dwains-dashboard/blueprints/"+filename), "w")
-    with data as f:
-        yaml.dump(filecontent, f, default_flow_style=False, sort_keys=False)
+    await hass.data[DOMAIN]["config_store"].async_write_file(hass.config.path("dwains-dashboard/blueprints/"+filename), filecontent, sort_keys=False)
 
     connection.send_result(
         msg["id"],
@@ -428,8 +257,7 @@ async def ws_handle_delete_blueprint(
     
     filename = hass.config.path("dwains-dashboard/blueprints/"+msg["blueprint"])
 
-    if os.path.exists(filename):
-        os.remove(filename)
+    await hass.data[DOMAIN]["config_store"].async_remove(filename)
     
     connection.send_result(
         msg["id"],
@@ -460,13 +288,8 @@ async def ws_handle_edit_area_button(
     if(msg["areaId"]):
         #_LOGGER.warning(f"Editing area: {msg["areaId"]}")
 
-        if os.path.exists(hass.config.path("dwains-dashboard/configs/areas.yaml")):
-            #with open(hass.config.path("dwains-dashboard/configs/areas.yaml")) as f:
-            data = await hass.async_add_executor_job(open, "dwains-dashboard/configs/areas.yaml", "r")
-            with data as f:
-                areas = yaml.safe_load(f)
-        else:
-            areas = OrderedDict()
+        store = hass.data[DOMAIN]["config_store"]
+        areas = await store.async_get("areas")
 
         area = areas.get(msg["areaId"])
 
@@ -479,20 +302,9 @@ async def ws_handle_edit_area_button(
             "disabled": msg["disableArea"],
         })
 
-        if not os.path.exists(hass.config.path("dwains-dashboard/configs")):
-            os.makedirs(hass.config.path("dwains-dashboard/configs"))
-
-        #with open(hass.config.path("dwains-dashboard/configs/areas.yaml"), 'w') as f:
-        data = await hass.async_add_executor_job(open, "dwains-dashboard/configs/areas.yaml", "w")
-        with data as f:
-            yaml.dump(areas, f, default_flow_style=False, sort_keys=False)
-
-        if areas:
-            areas = await hass.async_add_executor_job(
-                lambda: yaml.safe_load(open(hass.config.path("dwains-dashboard/configs/areas.yaml"), "r"))
-            )
-        
-    hass.bus.async_fire("dwains_dashboard_homepage_card_reload")
+        store.async_save("areas", reload_events=("dwains_dashboard_homepage_card_reload",))
+    else:
+        hass.bus.async_fire("dwains_dashboard_homepage_card_reload")
 
     connection.send_result(
         msg["id"],
@@ -518,13 +330,8 @@ async def ws_handle_edit_area_bool_value(
 ) -> None:
     """Handle edit area bool value command."""
 
-    if os.path.exists(hass.config.path("dwains-dashboard/configs/areas.yaml")):
-        #with open(hass.config.path("dwains-dashboard/configs/areas.yaml")) as f:
-        data = await hass.async_add_executor_job(open, "dwains-dashboard/configs/areas.yaml", "r")
-        with data as f:
-            areas = yaml.safe_load(f)
-    else:
-        areas = OrderedDict()
+    store = hass.data[DOMAIN]["config_store"]
+    areas = await store.async_get("areas")
 
     area = areas.get(msg["areaId"])
 
@@ -535,17 +342,7 @@ async def ws_handle_edit_area_bool_value(
             msg["key"]: msg["value"]
         })
 
-    if not os.path.exists(hass.config.path("dwains-dashboard/configs")):
-        os.makedirs(hass.config.path("dwains-dashboard/configs"))
-
-    #with open(hass.config.path("dwains-dashboard/configs/areas.yaml"), 'w') as f:
-    data = await hass.async_add_executor_job(open, "dwains-dashboard/configs/areas.yaml", "w")
-    with data as f:
-        yaml.dump(areas, f, default_flow_style=False, sort_keys=False)
-
-
-    hass.bus.async_fire("dwains_dashboard_homepage_card_reload")
-    hass.bus.async_fire("dwains_dashboard_devicespage_card_reload")
+    store.async_save("areas", reload_events=("dwains_dashboard_homepage_card_reload", "dwains_dashboard_devicespage_card_reload"))
 
     connection.send_result(
         msg["id"],
@@ -578,13 +375,8 @@ async def ws_handle_edit_homepage_header(
 ) -> None:
     """Handle saving editing homepage header."""
     
-    if os.path.exists(hass.config.path("dwains-dashboard/configs/settings.yaml")):
-        #with open(hass.config.path("dwains-dashboard/configs/settings.yaml")) as f:
-        data = await hass.async_add_executor_job(open, "dwains-dashboard/configs/settings.yaml", "r")
-        with data as f:
-            homepage_header = yaml.safe_load(f)
-    else:
-        homepage_header = OrderedDict()
+    store = hass.data[DOMAIN]["config_store"]
+    homepage_header = await store.async_get("homepage_header")
 
     homepage_header.update({
         "disable_clock": msg["disableClock"],
@@ -597,15 +389,7 @@ async def ws_handle_edit_homepage_header(
         "alarm_entity": msg["alarmEntity"],
     })
 
-    if not os.path.exists(hass.config.path("dwains-dashboard/configs")):
-        os.makedirs(hass.config.path("dwains-dashboard/configs"))
-
-    #with open(hass.config.path("dwains-dashboard/configs/settings.yaml"), 'w') as f:
-    data = await hass.async_add_executor_job(open, "dwains-dashboard/configs/settings.yaml", "w")
-    with data as f:
-        yaml.dump(homepage_header, f, default_flow_style=False, sort_keys=False)
-
-    hass.bus.async_fire("dwains_dashboard_homepage_card_reload")
+    store.async_save("homepage_header", reload_events=("dwains_dashboard_homepage_card_reload",))
 
     connection.send_result(
         msg["id"],
@@ -631,13 +415,8 @@ async def ws_handle_edit_device_button(
     """Handle saving editing area button."""
     
     if(msg["device"]):
-        if os.path.exists(hass.config.path("dwains-dashboard/configs/devices.yaml")):
-            #with open(hass.config.path("dwains-dashboard/configs/devices.yaml")) as f:
-            data = await hass.async_add_executor_job(open, "dwains-dashboard/configs/devices.yaml", "r")
-            with data as f:
-                devices = yaml.safe_load(f)
-        else:
-            devices = OrderedDict()
+        store = hass.data[DOMAIN]["config_store"]
+        devices = await store.async_get("devices")
 
         device = devices.get(msg["device"])
 
@@ -649,16 +428,10 @@ async def ws_handle_edit_device_button(
             "show_in_navbar": msg["showInNavbar"],
         })
 
-        if not os.path.exists(hass.config.path("dwains-dashboard/configs")):
-            os.makedirs(hass.config.path("dwains-dashboard/configs"))
-
-        #with open(hass.config.path("dwains-dashboard/configs/devices.yaml"), 'w') as f:
-        data = await hass.async_add_executor_job(open, "dwains-dashboard/configs/devices.yaml", "w")
-        with data as f:
-            yaml.dump(devices, f, default_flow_style=False, sort_keys=False)
-
-    hass.bus.async_fire("dwains_dashboard_devicespage_card_reload")
-    hass.bus.async_fire("dwains_dashboard_navigation_card_reload")
+        store.async_save("devices", reload_events=("dwains_dashboard_devicespage_card_reload", "dwains_dashboard_navigation_card_reload"))
+    else:
+        hass.bus.async_fire("dwains_dashboard_devicespage_card_reload")
+        hass.bus.async_fire("dwains_dashboard_navigation_card_reload")
 
     connection.send_result(
         msg["id"],
@@ -689,12 +462,8 @@ async def ws_handle_edit_device_card(
     path = "dwains-dashboard/configs/cards/devices_card/"
     filename = hass.config.path(path+"/"+msg['domain']+".yaml")
 
-    os.makedirs(os.path.dirname(filename), exist_ok=True) # Create the folder if not exists
-
     #ff = open(filename, 'w+')
-    data = await hass.async_add_executor_job(open, filename, "w+")
-    with data as ff:
-        yaml.dump(yaml.safe_load(json.dumps(filecontent)), ff, default_flow_style=False)
+    await hass.data[DOMAIN]["config_store"].async_write_file(filename, yaml.safe_load(json.dumps(filecontent)))
     
     hass.bus.async_fire("dwains_dashboard_devicespage_card_reload")
 
@@ -723,8 +492,7 @@ async def ws_handle_remove_device_card(
     path = "dwains-dashboard/configs/cards/devices_card"
     filename = hass.config.path(path+"/"+msg["domain"]+".yaml")
 
-    if os.path.exists(filename):
-        os.remove(filename)
+    await hass.data[DOMAIN]["config_store"].async_remove(filename)
 
     hass.bus.async_fire("dwains_dashboard_devicespage_card_reload")
     
@@ -755,12 +523,8 @@ async def ws_handle_edit_device_popup(
     path = "dwains-dashboard/configs/cards/devices_popup/"
     filename = hass.config.path(path+"/"+msg['domain']+".yaml")
 
-    os.makedirs(os.path.dirname(filename), exist_ok=True) # Create the folder if not exists
-
     #ff = open(filename, 'w+')
-    data = await hass.async_add_executor_job(open, filename, "w+")
-    with data as ff:
-        yaml.dump(yaml.safe_load(json.dumps(filecontent)), ff, default_flow_style=False)
+    await hass.data[DOMAIN]["config_store"].async_write_file(filename, yaml.safe_load(json.dumps(filecontent)))
     
     hass.bus.async_fire("dwains_dashboard_reload")
 
@@ -789,8 +553,7 @@ async def ws_handle_remove_device_popup(
     path = "dwains-dashboard/configs/cards/devices_popup"
     filename = hass.config.path(path+"/"+msg["domain"]+".yaml")
 
-    if os.path.exists(filename):
-        os.remove(filename)
+    await hass.data[DOMAIN]["config_store"].async_remove(filename)
 
     hass.bus.async_fire("dwains_dashboard_reload")
     
@@ -819,8 +582,7 @@ async def ws_handle_remove_entity_card(
     path = "dwains-dashboard/configs/cards/entities"
     filename = hass.config.path(path+"/"+msg["entityId"]+".yaml")
 
-    if os.path.exists(filename):
-        os.remove(filename)
+    await hass.data[DOMAIN]["config_store"].async_remove(filename)
 
     hass.bus.async_fire("dwains_dashboard_homepage_card_reload")
     hass.bus.async_fire("dwains_dashboard_devicespage_card_reload")
@@ -849,8 +611,7 @@ async def ws_handle_remove_entity_popup(
     path = "dwains-dashboard/configs/cards/entities_popup"
     filename = hass.config.path(path+"/"+msg["entityId"]+".yaml")
 
-    if os.path.exists(filename):
-        os.remove(filename)
+    await hass.data[DOMAIN]["config_store"].async_remove(filename)
 
     hass.bus.async_fire("dwains_dashboard_reload")
 
@@ -888,13 +649,8 @@ async def ws_handle_edit_entity(
 ) -> None:
     """Handle saving editing entity."""
 
-    if os.path.exists(hass.config.path("dwains-dashboard/configs/entities.yaml")) and os.stat(hass.config.path("dwains-dashboard/configs/entities.yaml")).st_size != 0:
-        #with open(hass.config.path("dwains-dashboard/configs/entities.yaml")) as f:
-        data = await hass.async_add_executor_job(open, hass.config.path("dwains-dashboard/configs/entities.yaml"), "r")
-        with data as f:
-            entities = yaml.safe_load(f)
-    else:
-        entities = OrderedDict()
+    store = hass.data[DOMAIN]["config_store"]
+    entities = await store.async_get("entities")
 
     entity = entities.get(msg["entity"])
 
@@ -916,17 +672,7 @@ async def ws_handle_edit_entity(
             "custom_popup": msg["customPopup"],
         })
 
-    if not os.path.exists(hass.config.path("dwains-dashboard/configs")):
-        os.makedirs(hass.config.path("dwains-dashboard/configs"))
-
-    #with open(hass.config.path("dwains-dashboard/configs/entities.yaml"), 'w') as f:
-    data = await hass.async_add_executor_job(open, "dwains-dashboard/configs/entities.yaml", "w")
-    with data as f:
-        yaml.dump(entities, f, default_flow_style=False, sort_keys=False)
-
-
-    hass.bus.async_fire("dwains_dashboard_homepage_card_reload")
-    hass.bus.async_fire("dwains_dashboard_devicespage_card_reload")
+    store.async_save("entities", reload_events=("dwains_dashboard_homepage_card_reload", "dwains_dashboard_devicespage_card_reload"))
 
     connection.send_result(
         msg["id"],
@@ -956,21 +702,13 @@ async def ws_handle_edit_entity_card(
     path = "dwains-dashboard/configs/cards/entities/"
     filename = hass.config.path(path+"/"+msg['entityId']+".yaml")
 
-    os.makedirs(os.path.dirname(filename), exist_ok=True) # Create the folder if not exists
+    store = hass.data[DOMAIN]["config_store"]
 
     #ff = open(filename, 'w+')
-    data = await hass.async_add_executor_job(open, filename, "w+")
-    with data as ff:
-        yaml.dump(yaml.safe_load(json.dumps(filecontent)), ff, default_flow_style=False)
+    await store.async_write_file(filename, yaml.safe_load(json.dumps(filecontent)))
 
     #Enable use custom card for the entity settings by default
-    if os.path.exists(hass.config.path("dwains-dashboard/configs/entities.yaml")) and os.stat(hass.config.path("dwains-dashboard/configs/entities.yaml")).st_size != 0:
-        #with open(hass.config.path("dwains-dashboard/configs/entities.yaml")) as f:
-        data = await hass.async_add_executor_job(open, hass.config.path("dwains-dashboard/configs/entities.yaml"), "r")
-        with data as f:
-            entities = yaml.safe_load(f)
-    else:
-        entities = OrderedDict()
+    entities = await store.async_get("entities")
 
     entity = entities.get(msg["entityId"])
 
@@ -981,16 +719,7 @@ async def ws_handle_edit_entity_card(
             "custom_card": True,
         })
 
-    if not os.path.exists(hass.config.path("dwains-dashboard/configs")):
-        os.makedirs(hass.config.path("dwains-dashboard/configs"))
-
-    #with open(hass.config.path("dwains-dashboard/configs/entities.yaml"), 'w') as f:
-    data = await hass.async_add_executor_job(open, "dwains-dashboard/configs/entities.yaml", "w")
-    with data as f:
-        yaml.dump(entities, f, default_flow_style=False, sort_keys=False)
-
-    hass.bus.async_fire("dwains_dashboard_homepage_card_reload")
-    hass.bus.async_fire("dwains_dashboard_devicespage_card_reload")
+    store.async_save("entities", reload_events=("dwains_dashboard_homepage_card_reload", "dwains_dashboard_devicespage_card_reload"))
 
     connection.send_result(
         msg["id"],
@@ -1019,21 +748,13 @@ async def ws_handle_edit_entity_popup(
     path = "dwains-dashboard/configs/cards/entities_popup/"
     filename = hass.config.path(path+"/"+msg['entityId']+".yaml")
 
-    os.makedirs(os.path.dirname(filename), exist_ok=True) # Create the folder if not exists
+    store = hass.data[DOMAIN]["config_store"]
 
     #ff = open(filename, 'w+')
-    data = await hass.async_add_executor_job(open, filename, "w+")
-    with data as ff:
-        yaml.dump(yaml.safe_load(json.dumps(filecontent)), ff, default_flow_style=False)
+    await store.async_write_file(filename, yaml.safe_load(json.dumps(filecontent)))
 
     #Enable use custom card for the entity settings by default
-    if os.path.exists(hass.config.path("dwains-dashboard/configs/entities.yaml")) and os.stat(hass.config.path("dwains-dashboard/configs/entities.yaml")).st_size != 0:
-        #with open(hass.config.path("dwains-dashboard/configs/entities.yaml")) as f:
-        data = await hass.async_add_executor_job(open, hass.config.path("dwains-dashboard/configs/entities.yaml"), "r")
-        with data as f:
-            entities = yaml.safe_load(f)
-    else:
-        entities = OrderedDict()
+    entities = await store.async_get("entities")
 
     entity = entities.get(msg["entityId"])
 
@@ -1044,15 +765,7 @@ async def ws_handle_edit_entity_popup(
             "custom_popup": True,
         })
 
-    if not os.path.exists(hass.config.path("dwains-dashboard/configs")):
-        os.makedirs(hass.config.path("dwains-dashboard/configs"))
-
-    #with open(hass.config.path("dwains-dashboard/configs/entities.yaml"), 'w') as f:
-    data = await hass.async_add_executor_job(open, "dwains-dashboard/configs/entities.yaml", "w")
-    with data as f:
-        yaml.dump(entities, f, default_flow_style=False, sort_keys=False)
-
-    hass.bus.async_fire("dwains_dashboard_reload")
+    store.async_save("entities", reload_events=("dwains_dashboard_reload",))
 
     connection.send_result(
         msg["id"],
@@ -1077,13 +790,8 @@ async def ws_handle_edit_entity_favorite(
 ) -> None:
     """Handle edit entity favorite command."""
 
-    if os.path.exists(hass.config.path("dwains-dashboard/configs/entities.yaml")) and os.stat(hass.config.path("dwains-dashboard/configs/entities.yaml")).st_size != 0:
-        #with open(hass.config.path("dwains-dashboard/configs/entities.yaml")) as f:
-        data = await hass.async_add_executor_job(open, "dwains-dashboard/configs/entities.yaml", "r")
-        with data as f:
-            entities = yaml.safe_load(f)
-    else:
-        entities = OrderedDict()
+    store = hass.data[DOMAIN]["config_store"]
+    entities = await store.async_get("entities")
 
     entity = entities.get(msg["entityId"])
 
@@ -1094,16 +802,7 @@ async def ws_handle_edit_entity_favorite(
             "favorite": msg["favorite"]
         })
 
-    if not os.path.exists(hass.config.path("dwains-dashboard/configs")):
-        os.makedirs(hass.config.path("dwains-dashboard/configs"))
-
-    #with open(hass.config.path("dwains-dashboard/configs/entities.yaml"), 'w') as f:
-    data = await hass.async_add_executor_job(open, "dwains-dashboard/configs/entities.yaml", "w")
-    with data as f:
-        yaml.dump(entities, f, default_flow_style=False, sort_keys=False)
-
-
-    hass.bus.async_fire("dwains_dashboard_homepage_card_reload")
+    store.async_save("entities", reload_events=("dwains_dashboard_homepage_card_reload",))
 
     connection.send_result(
         msg["id"],
@@ -1128,13 +827,8 @@ async def ws_handle_edit_entity_bool_value(
 ) -> None:
     """Handle edit entity bool value command."""
 
-    if os.path.exists(hass.config.path("dwains-dashboard/configs/entities.yaml")) and os.stat(hass.config.path("dwains-dashboard/configs/entities.yaml")).st_size != 0:
-        #with open(hass.config.path("dwains-dashboard/configs/entities.yaml")) as f:
-        data = await hass.async_add_executor_job(open, "dwains-dashboard/configs/entities.yaml", "r")
-        with data as f:
-            entities = yaml.safe_load(f)
-    else:
-        entities = OrderedDict()
+    store = hass.data[DOMAIN]["config_store"]
+    entities = await store.async_get("entities")
 
     entity = entities.get(msg["entityId"])
 
@@ -1145,17 +839,7 @@ async def ws_handle_edit_entity_bool_value(
             msg["key"]: msg["value"]
         })
 
-    if not os.path.exists(hass.config.path("dwains-dashboard/configs")):
-        os.makedirs(hass.config.path("dwains-dashboard/configs"))
-
-    #with open(hass.config.path("dwains-dashboard/configs/entities.yaml"), 'w') as f:
-    data = await hass.async_add_executor_job(open, "dwains-dashboard/configs/entities.yaml", "w")
-    with data as f:
-        yaml.dump(entities, f, default_flow_style=False, sort_keys=False)
-
-
-    hass.bus.async_fire("dwains_dashboard_homepage_card_reload")
-    hass.bus.async_fire("dwains_dashboard_devicespage_card_reload")
+    store.async_save("entities", reload_events=("dwains_dashboard_homepage_card_reload", "dwains_dashboard_devicespage_card_reload"))
 
     connection.send_result(
         msg["id"],
@@ -1181,13 +865,8 @@ async def ws_handle_edit_entities_bool_value(
 ) -> None:
     """Handle edit entities bool value command."""
 
-    if os.path.exists(hass.config.path("dwains-dashboard/configs/entities.yaml")) and os.stat(hass.config.path("dwains-dashboard/configs/entities.yaml")).st_size != 0:
-        #with open(hass.config.path("dwains-dashboard/configs/entities.yaml")) as f:
-        data = await hass.async_add_executor_job(open, "dwains-dashboard/configs/entities.yaml", "r")
-        with data as f:
-            entities = yaml.safe_load(f)
-    else:
-        entities = OrderedDict()
+    store = hass.data[DOMAIN]["config_store"]
+    entities = await store.async_get("entities")
 
     entitiesInput = json.loads(msg["entities"])
 
@@ -1205,16 +884,7 @@ async def ws_handle_edit_entities_bool_value(
 
     _LOGGER.warning(entities)
 
-    if not os.path.exists(hass.config.path("dwains-dashboard/configs")):
-        os.makedirs(hass.config.path("dwains-dashboard/configs"))
-
-    #with open(hass.config.path("dwains-dashboard/configs/entities.yaml"), 'w') as f:
-    data = await hass.async_add_executor_job(open, "dwains-dashboard/configs/entities.yaml", "w")
-    with data as f:
-        yaml.dump(entities, f, default_flow_style=False, sort_keys=False)
-
-    hass.bus.async_fire("dwains_dashboard_homepage_card_reload")
-    hass.bus.async_fire("dwains_dashboard_devicespage_card_reload")
+    store.async_save("entities", reload_events=("dwains_dashboard_homepage_card_reload", "dwains_dashboard_devicespage_card_reload"))
 
     connection.send_result(
         msg["id"],
@@ -1271,18 +941,13 @@ async def ws_handle_add_card(
             path = "dwains-dashboard/configs/cards/devices/"+msg['domain']
         filename = hass.config.path(path+"/"+type+".yaml")
 
-        os.makedirs(os.path.dirname(filename), exist_ok=True) # Create the folder if not exists
-
         if not msg["filename"]:
-            if os.path.exists(filename) and os.stat(filename).st_size != 0:
+            if await hass.async_add_executor_job(_has_content, filename):
                 filename = hass.config.path(path+"/"+type+datetime.now().strftime("%Y%m%d%H%M%S")+".yaml")
-                os.makedirs(os.path.dirname(filename), exist_ok=True)
 
 
         #ff = open(filename, 'w+')
-        data = await hass.async_add_executor_job(open, filename, "w+")
-        with data as ff:
-            yaml.dump(yaml.safe_load(json.dumps(filecontent)), ff, default_flow_style=False)
+        await hass.data[DOMAIN]["config_store"].async_write_file(filename, yaml.safe_load(json.dumps(filecontent)))
 
         hass.bus.async_fire("dwains_dashboard_homepage_card_reload")
         hass.bus.async_fire("dwains_dashboard_devicespage_card_reload")
@@ -1317,8 +982,7 @@ async def ws_handle_remove_card(
 
     filename = hass.config.path(path+"/"+msg["filename"]+".yaml")
 
-    if os.path.exists(filename):
-        os.remove(filename)
+    await hass.data[DOMAIN]["config_store"].async_remove(filename)
 
     hass.bus.async_fire("dwains_dashboard_homepage_card_reload")
     hass.bus.async_fire("dwains_dashboard_devicespage_card_reload")
@@ -1351,13 +1015,8 @@ async def ws_handle_edit_more_page_button(
     if (msg["more_page"]):
         config_file_path = hass.config.path(f"dwains-dashboard/configs/more_pages/{msg['more_page']}/config.yaml")
 
-        if os.path.exists(config_file_path) and os.stat(config_file_path).st_size != 0:
-            #with open(hass.config.path("dwains-dashboard/configs/more_pages/"+msg["more_page"]+"/config.yaml")) as f:
-            data = await hass.async_add_executor_job(open, config_file_path, "r")
-            with data as f:
-                configFile = yaml.safe_load(f)
-        else:
-            configFile = OrderedDict()
+        #with open(hass.config.path("dwains-dashboard/configs/more_pages/"+msg["more_page"]+"/config.yaml")) as f:
+        configFile = await hass.async_add_executor_job(_load_yaml_config, config_file_path)
 
         configFile.update({
             "name": msg["name"],
@@ -1366,9 +1025,7 @@ async def ws_handle_edit_more_page_button(
         })
 
         #with open(hass.config.path("dwains-dashboard/configs/more_pages/"+msg["more_page"]+"/config.yaml"), 'w') as f:
-        data = await hass.async_add_executor_job(open, config_file_path, "w")
-        with data as f:
-            yaml.dump(configFile, f, default_flow_style=False, sort_keys=False)
+        await hass.data[DOMAIN]["config_store"].async_write_file(config_file_path, configFile, sort_keys=False)
 
     # Trigger a reload event after saving
     hass.bus.async_fire("dwains_dashboard_homepage_card_reload")
@@ -1408,19 +1065,14 @@ async def ws_handle_edit_more_page(
 
     path_to_more_page = hass.config.path("dwains-dashboard/configs/more_pages/"+more_page_folder+"/page.yaml")
 
-    os.makedirs(os.path.dirname(path_to_more_page), exist_ok=True) # Create the folder if not exists
-
     if not msg["foldername"]:
-        if os.path.exists(path_to_more_page) and os.stat(path_to_more_page).st_size != 0:
+        if await hass.async_add_executor_job(_has_content, path_to_more_page):
             more_page_folder = more_page_folder+datetime.now().strftime("%Y%m%d%H%M%S")
             path_to_more_page = hass.config.path("dwains-dashboard/configs/more_pages/"+more_page_folder+"/page.yaml")
-            os.makedirs(os.path.dirname(path_to_more_page), exist_ok=True)
     
 
     #ff = open(path_to_more_page, 'w+')
-    data = await hass.async_add_executor_job(open, path_to_more_page, "w+")
-    with data as ff:
-        yaml.dump(yaml.safe_load(json.dumps(filecontent)), ff, default_flow_style=False)
+    await hass.data[DOMAIN]["config_store"].async_write_file(path_to_more_page, yaml.safe_load(json.dumps(filecontent)))
 
     # Prepare config.yaml content
     configFile = OrderedDict()
@@ -1431,9 +1083,7 @@ async def ws_handle_edit_more_page(
     })
 
     #with open(hass.config.path("dwains-dashboard/configs/more_pages/"+more_page_folder+"/config.yaml"), 'w') as f:
-    data = await hass.async_add_executor_job(open, hass.config.path("dwains-dashboard/configs/more_pages/"+more_page_folder+"/config.yaml"), "w")
-    with data as f:
-        yaml.dump(configFile, f, default_flow_style=False, sort_keys=False)
+    await hass.data[DOMAIN]["config_store"].async_write_file(hass.config.path("dwains-dashboard/configs/more_pages/"+more_page_folder+"/config.yaml"), configFile, sort_keys=False)
     #end config.yaml
 
     # Call reload config to rebuild the yaml for pages too
@@ -1472,7 +1122,7 @@ async def ws_handle_remove_more_page(
     if await hass.async_add_executor_job(os.path.exists, path_to_more_page):
         #remove folder and content
         #shutil.rmtree(hass.config.path("dwains-dashboard/configs/more_pages/"+msg["foldername"]), ignore_errors=True)
-        await hass.async_add_executor_job(shutil.rmtree, hass.config.path("dwains-dashboard/configs/more_pages/"+msg["foldername"]), True)
+        await hass.data[DOMAIN]["config_store"].async_remove(hass.config.path("dwains-dashboard/configs/more_pages/"+msg["foldername"]))
 
     hass.bus.async_fire("dwains_dashboard_navigation_card_reload")
 
@@ -1547,13 +1197,8 @@ async def ws_handle_sort_area_button(
 
     sortType = msg["sortType"]
 
-    if os.path.exists(hass.config.path("dwains-dashboard/configs/areas.yaml")) and os.stat(hass.config.path("dwains-dashboard/configs/areas.yaml")).st_size != 0:
-        #with open(hass.config.path("dwains-dashboard/configs/areas.yaml")) as f:
-        data = await hass.async_add_executor_job(open, hass.config.path("dwains-dashboard/configs/areas.yaml"), "r")
-        with data as f:
-            areas = yaml.safe_load(f)
-    else:
-        areas = OrderedDict()
+    store = hass.data[DOMAIN]["config_store"]
+    areas = await store.async_get("areas")
 
     for num, area_id in enumerate(sortData, start=1):
         if areas.get(area_id):
@@ -1565,13 +1210,7 @@ async def ws_handle_sort_area_button(
                 sortType: num,
             })
 
-    if not os.path.exists(hass.config.path("dwains-dashboard/configs")):
-        os.makedirs(hass.config.path("dwains-dashboard/configs"))
-
-    #with open(hass.config.path("dwains-dashboard/configs/areas.yaml"), 'w') as f:
-    data = await hass.async_add_executor_job(open, hass.config.path("dwains-dashboard/configs/areas.yaml"), "w")
-    with data as f:
-        yaml.dump(areas, f, default_flow_style=False, sort_keys=False)
+    store.async_save("areas")
 
     connection.send_result(
         msg["id"],
@@ -1598,13 +1237,8 @@ async def ws_handle_edit_device_bool_value(
 ) -> None:
     """Handle edit device bool value command."""
 
-    if os.path.exists(hass.config.path("dwains-dashboard/configs/devices.yaml")) and os.stat(hass.config.path("dwains-dashboard/configs/devices.yaml")).st_size != 0:
-        #with open(hass.config.path("dwains-dashboard/configs/devices.yaml")) as f:
-        data = await hass.async_add_executor_job(open, hass.config.path("dwains-dashboard/configs/devices.yaml"), "r")
-        with data as f:
-            devices = yaml.safe_load(f)
-    else:
-        devices = OrderedDict()
+    store = hass.data[DOMAIN]["config_store"]
+    devices = await store.async_get("devices")
 
     entity = devices.get(msg["device"])
 
@@ -1615,15 +1249,7 @@ async def ws_handle_edit_device_bool_value(
             msg["key"]: msg["value"]
         })
 
-    if not os.path.exists(hass.config.path("dwains-dashboard/configs")):
-        os.makedirs(hass.config.path("dwains-dashboard/configs"))
-
-    #with open(hass.config.path("dwains-dashboard/configs/devices.yaml"), 'w') as f:
-    data = await hass.async_add_executor_job(open, hass.config.path("dwains-dashboard/configs/devices.yaml"), "w")
-    with data as f:
-        yaml.dump(devices, f, default_flow_style=False, sort_keys=False)
-
-    hass.bus.async_fire("dwains_dashboard_devicespage_card_reload")
+    store.async_save("devices", reload_events=("dwains_dashboard_devicespage_card_reload",))
 
     connection.send_result(
         msg["id"],
@@ -1649,13 +1275,8 @@ async def ws_handle_sort_device_button(
 
     sortData = json.loads(msg["sortData"])
 
-    if os.path.exists(hass.config.path("dwains-dashboard/configs/devices.yaml")) and os.stat(hass.config.path("dwains-dashboard/configs/devices.yaml")).st_size != 0:
-        #with open(hass.config.path("dwains-dashboard/configs/devices.yaml")) as f:
-        data = await hass.async_add_executor_job(open, hass.config.path("dwains-dashboard/configs/devices.yaml"), "r")
-        with data as f:
-            devices = yaml.safe_load(f)
-    else:
-        devices = OrderedDict()
+    store = hass.data[DOMAIN]["config_store"]
+    devices = await store.async_get("devices")
 
     for num, device_id in enumerate(sortData, start=1):
         if devices.get(device_id):
@@ -1667,13 +1288,7 @@ async def ws_handle_sort_device_button(
                 "sort_order": num,
             })
 
-    if not os.path.exists(hass.config.path("dwains-dashboard/configs")):
-        os.makedirs(hass.config.path("dwains-dashboard/configs"))
-
-    #with open(hass.config.path("dwains-dashboard/configs/devices.yaml"), 'w') as f:
-    data = await hass.async_add_executor_job(open, hass.config.path("dwains-dashboard/configs/devices.yaml"), "w")
-    with data as f:
-        yaml.dump(devices, f, default_flow_style=False, sort_keys=False)
+    store.async_save("devices")
 
     connection.send_result(
         msg["id"],
@@ -1700,13 +1315,8 @@ async def ws_handle_sort_entity(
 
     sortType = msg["sortType"]
 
-    if os.path.exists(hass.config.path("dwains-dashboard/configs/entities.yaml")) and os.stat(hass.config.path("dwains-dashboard/configs/entities.yaml")).st_size != 0:
-        #with open(hass.config.path("dwains-dashboard/configs/entities.yaml")) as f:
-        data = await hass.async_add_executor_job(open, hass.config.path("dwains-dashboard/configs/entities.yaml"), "r")
-        with data as f:
-            entities = yaml.safe_load(f)
-    else:
-        entities = OrderedDict()
+    store = hass.data[DOMAIN]["config_store"]
+    entities = await store.async_get("entities")
 
     for num, entity_id in enumerate(sortData, start=1):
         if entities.get(entity_id):
@@ -1718,13 +1328,7 @@ async def ws_handle_sort_entity(
                 sortType: num,
             })
 
-    if not os.path.exists(hass.config.path("dwains-dashboard/configs")):
-        os.makedirs(hass.config.path("dwains-dashboard/configs"))
-
-    #with open(hass.config.path("dwains-dashboard/configs/entities.yaml"), 'w') as f:
-    data = await hass.async_add_executor_job(open, hass.config.path("dwains-dashboard/configs/entities.yaml"), "w")
-    with data as f:
-        yaml.dump(entities, f, default_flow_style=False, sort_keys=False)
+    store.async_save("entities")
 
     connection.send_result(
         msg["id"],
@@ -1752,22 +1356,20 @@ async def ws_handle_sort_more_page(
 
     for num, more_page in enumerate(sortData, start=1):
         page_link = hass.config.path("dwains-dashboard/configs/more_pages/"+more_page+"/config.yaml")
-        if os.path.exists(page_link) and os.stat(page_link).st_size != 0:
-            #with open(hass.config.path("dwains-dashboard/configs/more_pages/"+more_page+"/config.yaml")) as f:
-            data = await hass.async_add_executor_job(open, page_link, "r")
-            with data as f:
-                configFile = yaml.safe_load(f)
-        else:
-            configFile = OrderedDict()
+        #with open(hass.config.path("dwains-dashboard/configs/more_pages/"+more_page+"/config.yaml")) as f:
+        configFile = await hass.async_add_executor_job(_load_yaml_config, page_link)
 
         configFile.update({
             "sort_order": num,
         })
 
         #with open(hass.config.path("dwains-dashboard/configs/more_pages/"+more_page+"/config.yaml"), 'w') as f:
-        data = await hass.async_add_executor_job(open, page_link, "w")
-        with data as f:
-            yaml.dump(configFile, f, default_flow_style=False, sort_keys=False)
+        await hass.data[DOMAIN]["config_store"].async_write_file(page_link, configFile, sort_keys=False)
+
+    # Apply the new order, the watcher leaves the written files to this handler
+    await async_update_more_pages(hass, sortData)
+    hass.bus.async_fire("dwains_dashboard_reload")
+    hass.bus.async_fire("dwains_dashboard_navigation_card_reload")
 
     connection.send_result(
         msg["id"],
@@ -1782,6 +1384,12 @@ async def async_setup_entry(hass, config_entry):
 
     load_dashboard(hass, config_entry)
 
+    # Reload only what changed when files are edited outside of the dashboard
+    watcher = DashboardWatcher(hass)
+    await watcher.async_start()
+    config_entry.async_on_unload(watcher.async_stop)
+    config_entry.async_on_unload(clear_render_cache)
+
     config_entry.add_update_listener(_update_listener)
 
     #hass.async_add_job( # Deprecated, trying with hass.async_create_task() ...
@@ -0,0 +1,150 @@
+"""In-memory snapshot of the Dwains Dashboard configuration files."""
+import asyncio
+import logging
+import os
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import json_bytes
+
+from .const import VERSION
+from .yaml_loader import list_folders, list_yaml_files, load_yaml_files
+
+_LOGGER = logging.getLogger(__name__)
+
+CONFIGS_PATH = "dwains-dashboard/configs"
+
+# Response key -> file in the configs folder
+CONFIG_FILES = {
+    "areas": "areas.yaml",
+    "entities": "entities.yaml",
+    "devices": "devices.yaml",
+    "homepage_header": "settings.yaml",
+}
+
+# Response key -> folder with a subfolder of card files per area or domain
+NESTED_CARD_FOLDERS = {
+    "area_cards": "cards/areas",
+    "device_cards": "cards/devices",
+}
+
+# Response key -> folder with one card file per entity or domain
+CARD_FOLDERS = {
+    "entity_cards": "cards/entities",
+    "entities_popup": "cards/entities_popup",
+    "devices_card": "cards/devices_card",
+    "devices_popup": "cards/devices_popup",
+}
+
+
+def scan_configs(configs_path):
+    """Return the path, mtime and size of every file below the configs folder."""
+    signature = []
+    pending = [configs_path]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        pending.append(entry.path)
+                    else:
+                        stat = entry.stat()
+                        signature.append((entry.path, stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            continue
+    return tuple(sorted(signature))
+
+
+def build_configuration(configs_path):
+    """Read all configuration files into the dwains_dashboard/configuration/get response.
+
+    The files are found first and then loaded together, a file that fails to
+    load is left out of the response.
+    """
+    paths = {}
+
+    for key, filename in CONFIG_FILES.items():
+        paths[key] = os.path.join(configs_path, filename)
+
+    nested = {}
+    for key, folder in NESTED_CARD_FOLDERS.items():
+        path = os.path.join(configs_path, folder)
+        nested[key] = {
+            subdir: {
+                fname: os.path.join(path, subdir, fname)
+                for fname in list_yaml_files(os.path.join(path, subdir))
+            }
+            for subdir in list_folders(path)
+        }
+
+    cards = {}
+    for key, folder in CARD_FOLDERS.items():
+        path = os.path.join(configs_path, folder)
+        cards[key] = {
+            fname.replace(".yaml", ""): os.path.join(path, fname) for fname in list_yaml_files(path)
+        }
+
+    more_pages = {}
+    more_pages_path = os.path.join(configs_path, "more_pages")
+    for subdir in list_folders(more_pages_path):
+        page_files = list_yaml_files(os.path.join(more_pages_path, subdir))
+        if "page.yaml" in page_files and "config.yaml" in page_files:
+            more_pages[subdir] = os.path.join(more_pages_path, subdir, "config.yaml")
+
+    loaded = load_yaml_files(
+        [path for path in paths.values() if os.path.exists(path)]
+        + [path for files in nested.values() for subdir in files.values() for path in subdir.values()]
+        + [path for files in cards.values() for path in files.values()]
+        + list(more_pages.values())
+    )
+
+    configuration = {key: loaded.get(path, {}) for key, path in paths.items()}
+    for key, files in nested.items():
+        configuration[key] = {
+            subdir: {fname: loaded[path] for fname, path in subdir_files.items() if path in loaded}
+            for subdir, subdir_files in files.items()
+        }
+    for key, files in cards.items():
+        configuration[key] = {name: loaded[path] for name, path in files.items() if path in loaded}
+    configuration["more_pages"] = {
+        subdir: loaded[path] for subdir, path in more_pages.items() if path in loaded
+    }
+
+    configuration["installed_version"] = VERSION
+    return configuration
+
+
+class ConfigSnapshot:
+    """The parsed configuration and its serialised response, rebuilt when files change.
+
+    Checking for changes only stats the files below the configs folder, the
+    files are read and parsed again when any path, mtime or size differs.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        self.hass = hass
+        self.configs_path = hass.config.path(CONFIGS_PATH)
+        self.data = None
+        self.payload = None
+        self._signature = None
+        self._lock = asyncio.Lock()
+
+    def invalidate(self):
+        """Rebuild the snapshot on the next request."""
+        self._signature = None
+
+    def _refresh(self):
+        """Rebuild the snapshot if the files changed, runs in the executor."""
+        signature = scan_configs(self.configs_path)
+        if signature == self._signature:
+            return
+        data = build_configuration(self.configs_path)
+        self.payload = json_bytes(data)
+        self.data = data
+        self._signature = signature
+        _LOGGER.debug("Configuration snapshot rebuilt from %s files", len(signature))
+
+    async def async_get(self):
+        """Return the serialised configuration."""
+        async with self._lock:
+            await self.hass.async_add_executor_job(self._refresh)
+        return self.payload
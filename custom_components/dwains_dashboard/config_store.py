@@ -0,0 +1,170 @@
+"""Write-through store for the areas, entities, devices and settings files."""
+import asyncio
+import copy
+import logging
+import os
+import shutil
+from collections import OrderedDict
+
+import yaml
+
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+from homeassistant.core import HassJob, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util.file import write_utf8_file
+
+from .config_snapshot import CONFIG_FILES, CONFIGS_PATH
+from .yaml_loader import load_yaml_file
+
+_LOGGER = logging.getLogger(__name__)
+
+# Changes made within this many seconds are written, and their reload events fired, together
+SAVE_DELAY = 0.5
+
+
+class ConfigStore:
+    """Keep the configuration files in memory, and write changes to disk in the background.
+
+    Handlers change the documents in place and call async_save. The files are
+    written atomically in the executor once the changes settle, after which the
+    reload events of all changes are fired once each. Documents are read again
+    when their file was changed outside of the store.
+
+    Handlers write and remove their other files through async_write_file and
+    async_remove, so the watcher can tell them apart from outside edits.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        self.hass = hass
+        self.configs_path = hass.config.path(CONFIGS_PATH)
+        self._documents = {}
+        self._mtimes = {}
+        self._files = {}
+        self._dirty = set()
+        self._events = {}
+        self._unsub = None
+        self._lock = asyncio.Lock()
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_FINAL_WRITE, self._async_final_write)
+
+    def _path(self, key):
+        return os.path.join(self.configs_path, CONFIG_FILES[key])
+
+    def _mtime(self, key):
+        try:
+            return os.stat(self._path(key)).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def _load(self, key):
+        """Read a document, runs in the executor."""
+        mtime = self._mtime(key)
+        if mtime is None:
+            return OrderedDict(), None
+        return load_yaml_file(self._path(key)) or OrderedDict(), mtime
+
+    def _write(self, documents):
+        """Write documents atomically, runs in the executor."""
+        os.makedirs(self.configs_path, exist_ok=True)
+        mtimes = {}
+        for key, document in documents.items():
+            write_utf8_file(
+                self._path(key), yaml.dump(document, default_flow_style=False, sort_keys=False)
+            )
+            mtimes[key] = self._mtime(key)
+        return mtimes
+
+    def is_own_write(self, path, mtime):
+        """Return True if the file at path is as the store last read, wrote or removed it."""
+        if path in self._files:
+            return self._files[path] == mtime
+        return any(
+            self._path(key) == path and self._mtimes.get(key) == mtime for key in self._documents
+        )
+
+    def _write_file(self, path, content):
+        """Write a file atomically and return its mtime, runs in the executor."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        write_utf8_file(path, content)
+        return os.stat(path).st_mtime_ns
+
+    async def async_write_file(self, path, data, sort_keys=True):
+        """Write a YAML file for a handler, which fires its own reload events."""
+        content = yaml.dump(data, default_flow_style=False, sort_keys=sort_keys)
+        self._files[path] = await self.hass.async_add_executor_job(self._write_file, path, content)
+
+    def _remove(self, path):
+        """Remove a file or folder and return the removed files, runs in the executor."""
+        if os.path.isdir(path):
+            removed = [os.path.join(root, name) for root, _, names in os.walk(path) for name in names]
+            shutil.rmtree(path, ignore_errors=True)
+            return removed
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            return []
+        return [path]
+
+    async def async_remove(self, path):
+        """Remove a file or folder for a handler, which fires its own reload events."""
+        for removed in await self.hass.async_add_executor_job(self._remove, path):
+            self._files[removed] = None
+
+    async def async_get(self, key):
+        """Return a document, changes to it are kept until async_save is called."""
+        async with self._lock:
+            # Pending changes win over the file, anything else is checked against it
+            if key not in self._dirty:
+                mtime = await self.hass.async_add_executor_job(self._mtime, key)
+                if key not in self._documents or mtime != self._mtimes.get(key):
+                    (
+                        self._documents[key],
+                        self._mtimes[key],
+                    ) = await self.hass.async_add_executor_job(self._load, key)
+        return self._documents[key]
+
+    @callback
+    def async_save(self, key, reload_events=()):
+        """Schedule writing a changed document, and firing its reload events."""
+        self._dirty.add(key)
+        self.async_fire_reload(*reload_events)
+
+    @callback
+    def async_fire_reload(self, *events):
+        """Fire reload events after pending changes are written, once per batch."""
+        for event in events:
+            self._events[event] = None
+        if self._unsub is None:
+            self._unsub = async_call_later(
+                self.hass, SAVE_DELAY, HassJob(self._async_flush_later, cancel_on_shutdown=True)
+            )
+
+    @callback
+    def _async_flush_later(self, _now):
+        self._unsub = None
+        self.hass.async_create_task(self.async_flush())
+
+    async def _async_final_write(self, _event):
+        await self.async_flush()
+
+    async def async_flush(self):
+        """Write pending changes now, and fire the pending reload events."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+
+        async with self._lock:
+            if self._dirty:
+                # Copied so handlers can keep changing the documents during the write
+                pending = {key: copy.deepcopy(self._documents[key]) for key in self._dirty}
+                self._dirty.clear()
+                try:
+                    self._mtimes.update(
+                        await self.hass.async_add_executor_job(self._write, pending)
+                    )
+                except OSError as err:
+                    _LOGGER.error(f"Error saving {', '.join(pending)}: {err}")
+                    self._dirty.update(pending)
+
+        events, self._events = self._events, {}
+        for event in events:
+            self.hass.bus.async_fire(event)
@@ -1,3 +1,4 @@
+import copy
 import logging
 import yaml
 import os
@@ -7,7 +8,9 @@ import io
 import time
 from collections import OrderedDict
 import jinja2
+import jinja2.meta
 import shutil
+import threading
 from concurrent.futures import ThreadPoolExecutor
 import asyncio
 from aiofiles.os import scandir
@@ -20,6 +23,7 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.core import HomeAssistant
 
 from .const import DOMAIN, VERSION
+from .yaml_loader import list_folders, load_yaml_file
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -33,9 +37,167 @@ jinja.filters['fromjson'] = fromjson
 dwains_dashboard_more_pages = {}
 llgen_config = {}
 
+# Bumped whenever dwains_dashboard_more_pages or llgen_config change, rendered templates depend on them
+globals_version = 0
+
+# Most rendered files kept, the least recently used are dropped first
+RENDER_CACHE_SIZE = 256
+
+# (fname, args, secrets) -> (data, {path: mtime_ns} of every file the data was built from, uses globals, globals_version)
+_render_cache = OrderedDict()
+_render_cache_lock = threading.Lock()
+
+# path -> (mtime_ns, files referenced by jinja include/import/extends, or None when a reference is dynamic)
+_template_references = {}
+
+# The files read by the load_yamll calls in progress, per thread
+_tracking = threading.local()
+
+
+def globals_changed():
+    """Mark templates rendered with the old more pages and llgen config as stale."""
+    global globals_version
+    globals_version += 1
+
+
+def clear_render_cache():
+    """Drop all rendered files and template references."""
+    with _render_cache_lock:
+        _render_cache.clear()
+    _template_references.clear()
+
+
+def _cache_get(key):
+    with _render_cache_lock:
+        cached = _render_cache.get(key)
+        if cached is not None:
+            _render_cache.move_to_end(key)
+        return cached
+
+
+def _cache_set(key, value):
+    with _render_cache_lock:
+        _render_cache[key] = value
+        _render_cache.move_to_end(key)
+        while len(_render_cache) > RENDER_CACHE_SIZE:
+            _render_cache.popitem(last=False)
+
+
+def _mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def _args_key(args):
+    try:
+        return json.dumps(args, sort_keys=True, default=str)
+    except (TypeError, ValueError):
+        return None
+
+
+class _RenderFrame:
+    """Dependencies collected while loading one file, including its includes."""
+
+    __slots__ = ("deps", "uses_globals", "cacheable")
+
+    def __init__(self):
+        self.deps = {}
+        self.uses_globals = False
+        self.cacheable = True
+
+    def merge(self, deps, uses_globals, cacheable=True):
+        self.deps.update(deps)
+        self.uses_globals = self.uses_globals or uses_globals
+        self.cacheable = self.cacheable and cacheable
+
+
+def _current_frame():
+    frames = getattr(_tracking, "frames", None)
+    return frames[-1] if frames else None
+
+
+def _template_dependencies(path, deps, seen=None):
+    """Add the mtimes of the templates a template pulls in to deps, return False if any is dynamic."""
+    seen = set() if seen is None else seen
+    if path in seen:
+        return True
+    seen.add(path)
+
+    mtime = _mtime(path)
+    cached = _template_references.get(path)
+    if cached is None or cached[0] != mtime:
+        with open(path, encoding="utf-8") as f:
+            references = list(jinja2.meta.find_referenced_templates(jinja.parse(f.read())))
+        cached = (mtime, None if None in references else [os.path.join("/", name) for name in references])
+        _template_references[path] = cached
+
+    deps[path] = mtime
+    if cached[1] is None:
+        return False
+    return all(_template_dependencies(reference, deps, seen) for reference in cached[1])
+
+
+def _secrets_dependencies(fname, config_dir, deps):
+    """Add the mtimes of the secrets.yaml files a !secret in fname can be looked up in to deps."""
+    config_dir = os.path.abspath(config_dir)
+    secret_dir = os.path.dirname(os.path.abspath(fname))
+    if os.path.commonpath([secret_dir, config_dir]) != config_dir:
+        return
+    while True:
+        secrets_path = os.path.join(secret_dir, "secrets.yaml")
+        deps[secrets_path] = _mtime(secrets_path)
+        if secret_dir == config_dir:
+            return
+        secret_dir = os.path.dirname(secret_dir)
+
+
 def load_yamll(fname, secrets = None, args={}):
+    """Load a YAML file, reusing the result while none of the files it was built from changed.
+
+    Callers get a copy of the cached data, includes annotate and change what they get.
+    """
+    args_key = _args_key(args)
+    key = (fname, args_key, getattr(secrets, "config_dir", None))
+    parent = _current_frame()
+
+    cached = _cache_get(key) if args_key is not None else None
+    if cached is not None:
+        data, deps, uses_globals, version = cached
+        if (not uses_globals or version == globals_version) and all(_mtime(path) == mtime for path, mtime in deps.items()):
+            if parent is not None:
+                parent.merge(deps, uses_globals)
+            return copy.deepcopy(data)
+
+    version = globals_version
+    frame = _RenderFrame()
+    frames = getattr(_tracking, "frames", None)
+    if frames is None:
+        frames = _tracking.frames = []
+    frames.append(frame)
+    try:
+        data = _load_yamll(fname, secrets, args, frame)
+    finally:
+        frames.pop()
+
+    if parent is not None:
+        parent.merge(frame.deps, frame.uses_globals, frame.cacheable)
+    if frame.cacheable and args_key is not None:
+        _cache_set(key, (data, frame.deps, frame.uses_globals, version))
+        return copy.deepcopy(data)
+    with _render_cache_lock:
+        _render_cache.pop(key, None)
+    return data
+
+
+def _load_yamll(fname, secrets, args, frame):
     try:
         process_yaml = False
+        # Taken before reading, so a change during the load invalidates the result
+        frame.deps[fname] = _mtime(fname)
+        if secrets is not None:
+            _secrets_dependencies(fname, secrets.config_dir, frame.deps)
         with open(fname, encoding="utf-8") as f:
             if f.readline().lower().startswith(("# dwains_dashboard", "# dwains_theme", "# lovelace_gen", "#dwains_dashboard")):
                 process_yaml = True
@@ -43,6 +205,9 @@ def load_yamll(fname, secrets = None, args={}):
         #_LOGGER.debug(f"load_yamll() Loading YAML: {fname}, process_yaml={process_yaml}")
 
         if process_yaml:
+            frame.uses_globals = True
+            if not _template_dependencies(fname, frame.deps):
+                frame.cacheable = False
             stream = io.StringIO(jinja.get_template(fname).render({
                 **args,
                 "_dd_more_pages": dwains_dashboard_more_pages,
@@ -103,62 +268,102 @@ def compose_node(self, parent, index):
 yaml.composer.Composer.compose_node = compose_node
 
 
+MORE_PAGES_PATH = "dwains-dashboard/configs/more_pages"
+HKI_CONFIG_PATH = "hki-user/config"
+
+# fname -> data of the HKI config files, merged into llgen_config in this order
+llgen_sources = {}
+
+
+def read_more_page(more_pages_path, subdir):
+    """Return the dwains_dashboard_more_pages entry of a page folder, or None if it has no page. Runs in the executor."""
+    page_path = os.path.join(more_pages_path, subdir)
+    #Lets check if there is a page.yaml in the more_pages folder
+    if not os.path.exists(os.path.join(page_path, "page.yaml")):
+        return None
+
+    page = {"path": "dwains-dashboard/configs/more_pages/"+subdir+"/page.yaml"}
+    config_path = os.path.join(page_path, "config.yaml")
+    # Page.yaml exists now check if there is a config.yaml otherwise create it
+    if not os.path.exists(config_path):
+        with open(config_path, "w") as f:
+            yaml.safe_dump({"name": subdir, "icon": "mdi:puzzle"}, f, default_flow_style=False)
+        return {"name": subdir, "icon": "mdi:puzzle", **page}
+
+    try:
+        filecontent = load_yaml_file(config_path)
+    except Exception as e:
+        _LOGGER.error(f"Failed to read config.yaml in {subdir}: {e}")
+        return None
+
+    if not isinstance(filecontent, dict) or "name" not in filecontent or "icon" not in filecontent:
+        _LOGGER.warning(f"Invalid config.yaml in {subdir}: Missing 'name' or 'icon'")
+        return None
+
+    return {"name": filecontent["name"], "icon": filecontent["icon"], **page}
+
+
+def read_more_pages(more_pages_path, subdirs=None):
+    """Return the entries of the given page folders, all of them by default. Runs in the executor."""
+    if subdirs is None:
+        subdirs = list_folders(more_pages_path)
+    return {subdir: read_more_page(more_pages_path, subdir) for subdir in subdirs}
+
+
+async def async_update_more_pages(hass: HomeAssistant, subdirs=None):
+    """Update dwains_dashboard_more_pages for the given page folders, or rebuild it."""
+    pages = await hass.async_add_executor_job(read_more_pages, hass.config.path(MORE_PAGES_PATH), subdirs)
+    if subdirs is None:
+        dwains_dashboard_more_pages.clear()
+    for subdir, page in pages.items():
+        if page is None:
+            dwains_dashboard_more_pages.pop(subdir, None)
+        else:
+            dwains_dashboard_more_pages[subdir] = page
+    globals_changed()
+
+
+def read_llgen_sources(fnames):
+    """Load HKI config files, None for files that are gone or hold no mapping. Runs in the executor."""
+    sources = {}
+    for fname in fnames:
+        loaded_yaml = load_yamll(fname) if os.path.exists(fname) else None
+        sources[fname] = loaded_yaml if isinstance(loaded_yaml, dict) else None
+    return sources
+
+
+async def async_update_llgen_config(hass: HomeAssistant, fnames=None):
+    """Update llgen_config from the given HKI config files, or from all of them."""
+    if fnames is None:
+        hki_path = hass.config.path(HKI_CONFIG_PATH)
+        if not await hass.async_add_executor_job(os.path.exists, hki_path):
+            return
+        fnames = await hass.async_add_executor_job(lambda: list(loader._find_files(hki_path, "*.yaml")))
+
+    for fname, data in (await hass.async_add_executor_job(read_llgen_sources, fnames)).items():
+        if data is None:
+            llgen_sources.pop(fname, None)
+        else:
+            llgen_sources[fname] = data
+
+    llgen_config.clear()
+    for data in llgen_sources.values():
+        llgen_config.update(data)
+    globals_changed()
+
+
 async def process_yaml(hass: HomeAssistant, config_entry):
     """Process all YAML files for Dwains Dashboard."""
     #_LOGGER.warning('Start of function to process all yaml files!')
 
+    # Rendered files are kept per entry, a setup or options update starts empty
+    clear_render_cache()
+
     # Check for HKI installation
-    if os.path.exists(hass.config.path("hki-user/config")):
-        #_LOGGER.warning("HKI Installed!")
-        for fname in loader._find_files(hass.config.path("hki-user/config"), "*.yaml"):
-            loaded_yaml = load_yamll(fname)
-            if isinstance(loaded_yaml, dict):
-                llgen_config.update(loaded_yaml)
-
-    if os.path.exists(hass.config.path("dwains-dashboard/configs")):
-        if os.path.isdir(hass.config.path("dwains-dashboard/configs/more_pages")):
-            #for subdir in os.listdir(hass.config.path("dwains-dashboard/configs/more_pages")):
-            more_pages_path = hass.config.path("dwains-dashboard/configs/more_pages")
-            subdirs = await hass.async_add_executor_job(os.listdir, more_pages_path)
-            for subdir in subdirs:
-                #Lets check if there is a page.yaml in the more_pages folder
-                if os.path.exists(hass.config.path("dwains-dashboard/configs/more_pages/"+subdir+"/page.yaml")):
-                    # Page.yaml exists now check if there is a config.yaml otherwise create it
-                    if not os.path.exists(hass.config.path("dwains-dashboard/configs/more_pages/"+subdir+"/config.yaml")):
-                        #_LOGGER.warning(f"process_yaml() config.yaml does not exist, {subdir}")
-                        #with open(hass.config.path("dwains-dashboard/configs/more_pages/"+subdir+"/config.yaml"), 'w') as f:
-                        file_content = await hass.async_add_executor_job(open, hass.config.path("dwains-dashboard/configs/more_pages/"+subdir+"/config.yaml"), "w")
-                        with file_content as f:
-                            page_config = OrderedDict()
-                            page_config.update({
-                                "name": subdir,
-                                "icon": "mdi:puzzle"
-                            })
-                            yaml.safe_dump(page_config, f, default_flow_style=False)
-                            dwains_dashboard_more_pages[subdir] = {
-                                "name": subdir,
-                                "icon": "mdi:puzzle",
-                                "path": "dwains-dashboard/configs/more_pages/"+subdir+"/page.yaml",
-                            }
-                    else:
-                        #_LOGGER.warning(f"process_yaml() config.yaml exists, {subdir}")
-                        try:
-                            #with open(hass.config.path("dwains-dashboard/configs/more_pages/"+subdir+"/config.yaml")) as f:
-                            data = await hass.async_add_executor_job(open, hass.config.path("dwains-dashboard/configs/more_pages/"+subdir+"/config.yaml"), "r")
-                            with data as f:
-                                filecontent = yaml.safe_load(f)
-
-                                #_LOGGER.warning(f"FILE CONTENT: {filecontent}")
-                                if "name" in filecontent and "icon" in filecontent:
-                                    dwains_dashboard_more_pages[subdir] = {
-                                        "name": filecontent["name"],
-                                        "icon": filecontent["icon"],
-                                        "path": "dwains-dashboard/configs/more_pages/"+subdir+"/page.yaml",
-                                    }
-                                else:
-                                    _LOGGER.warning(f"Invalid config.yaml in {subdir}: Missing 'name' or 'icon'")
-                        except Exception as e:
-                            _LOGGER.error(f"Failed to read config.yaml in {subdir}: {e}")
+    await async_update_llgen_config(hass)
+
+    if await hass.async_add_executor_job(os.path.exists, hass.config.path("dwains-dashboard/configs")):
+        await async_update_more_pages(hass)
 
         hass.bus.async_fire("dwains_dashboard_reload")
 
@@ -176,38 +381,7 @@ async def process_yaml(hass: HomeAssistant, config_entry):
 async def reload_configuration(hass):
     _LOGGER.warning('Reload YAML configuration files...!')
 
-    if os.path.exists(hass.config.path("dwains-dashboard/configs")):
-        if os.path.isdir(hass.config.path("dwains-dashboard/configs/more_pages")):
-            #for subdir in os.listdir(hass.config.path("dwains-dashboard/configs/more_pages")):
-            more_pages_path = hass.config.path("dwains-dashboard/configs/more_pages")
-            subdirs = await hass.async_add_executor_job(os.listdir, more_pages_path)
-            for subdir in subdirs:
-                #Lets check if there is a page.yaml in the more_pages folder
-                if os.path.exists(hass.config.path("dwains-dashboard/configs/more_pages/"+subdir+"/page.yaml")):
-                    page_config = hass.config.path("dwains-dashboard/configs/more_pages/"+subdir+"/config.yaml")
-                    #Page.yaml exists now check if there is a config.yaml otherwise create it
-                    if not os.path.exists(page_config):
-                        data = await hass.async_add_executor_job(open, page_config, "w")
-                        with data as f:
-                            page_config = OrderedDict()
-                            page_config.update({
-                                "name": subdir,
-                                "icon": "mdi:puzzle"
-                            })
-                            yaml.safe_dump(page_config, f, default_flow_style=False)
-                            dwains_dashboard_more_pages[subdir] = {
-                                "name": subdir,
-                                "icon": "mdi:puzzle",
-                                "path": "dwains-dashboard/configs/more_pages/"+subdir+"/page.yaml",
-                            }
-                    else:
-                        data = await hass.async_add_executor_job(open, page_config, "r")
-                        with data as f:
-                            filecontent = yaml.safe_load(f)
-                            dwains_dashboard_more_pages[subdir] = {
-                                "name": filecontent["name"],
-                                "icon": filecontent["icon"],
-                                "path": "dwains-dashboard/configs/more_pages/"+subdir+"/page.yaml",
-                            }
-
-    hass.bus.async_fire("dwains_dashboard_reload")
\ No newline at end of file
+    clear_render_cache()
+    await async_update_more_pages(hass)
+
+    hass.bus.async_fire("dwains_dashboard_reload")
@@ -0,0 +1,169 @@
+"""Watch the Dwains Dashboard files, and reload only what changed."""
+import logging
+import os
+
+from homeassistant.core import HassJob, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import DOMAIN
+from .process_yaml import (
+    HKI_CONFIG_PATH,
+    async_update_llgen_config,
+    async_update_more_pages,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Seconds between scans of the watched folders
+POLL_INTERVAL = 3
+
+# Seconds to wait for more changes after a scan found some, files saved together are handled together
+SETTLE_DELAY = 1
+
+DASHBOARD_RELOAD = "dwains_dashboard_reload"
+HOMEPAGE_RELOAD = "dwains_dashboard_homepage_card_reload"
+DEVICESPAGE_RELOAD = "dwains_dashboard_devicespage_card_reload"
+NAVIGATION_RELOAD = "dwains_dashboard_navigation_card_reload"
+MORE_PAGES_RELOAD = "dwains_dashboard_more_pages_reload"
+
+# File or card folder below dwains-dashboard/configs -> reload events, anything else reloads the dashboard
+CONFIG_RELOAD_EVENTS = {
+    "areas.yaml": (HOMEPAGE_RELOAD, DEVICESPAGE_RELOAD),
+    "entities.yaml": (HOMEPAGE_RELOAD, DEVICESPAGE_RELOAD),
+    "devices.yaml": (DEVICESPAGE_RELOAD, NAVIGATION_RELOAD),
+    "settings.yaml": (HOMEPAGE_RELOAD,),
+    "cards/areas": (HOMEPAGE_RELOAD,),
+    "cards/devices": (DEVICESPAGE_RELOAD,),
+    "cards/entities": (HOMEPAGE_RELOAD, DEVICESPAGE_RELOAD),
+    "cards/devices_card": (DEVICESPAGE_RELOAD,),
+    "cards/entities_popup": (DASHBOARD_RELOAD,),
+    "cards/devices_popup": (DASHBOARD_RELOAD,),
+}
+
+
+def scan_files(*roots):
+    """Return the mtime and size of every file below the roots. Runs in the executor."""
+    files = {}
+    pending = list(roots)
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        pending.append(entry.path)
+                    else:
+                        stat = entry.stat()
+                        files[entry.path] = (stat.st_mtime_ns, stat.st_size)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+    return files
+
+
+class DashboardWatcher:
+    """Poll dwains-dashboard and the HKI config for changed files.
+
+    Only the more pages and HKI config files that changed are read again, and
+    only the reload events for the changed files are fired. Files written or
+    removed through the config store are left to the reload events of the
+    handlers that changed them.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        self.hass = hass
+        self.root = hass.config.path("dwains-dashboard")
+        self.hki_path = hass.config.path(HKI_CONFIG_PATH)
+        self._files = {}
+        self._pending = set()
+        self._unsub = None
+        self._running = False
+
+    async def async_start(self):
+        """Take the current state of the files, and start polling."""
+        self._files = await self.hass.async_add_executor_job(scan_files, self.root, self.hki_path)
+        self._running = True
+        self._async_schedule(POLL_INTERVAL)
+
+    @callback
+    def async_stop(self):
+        """Stop polling."""
+        self._running = False
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+
+    @callback
+    def _async_schedule(self, delay):
+        if not self._running:
+            return
+
+        @callback
+        def _async_poll(_now):
+            self._unsub = None
+            self.hass.async_create_background_task(self._async_poll(), "dwains_dashboard_watcher")
+
+        self._unsub = async_call_later(self.hass, delay, HassJob(_async_poll, cancel_on_shutdown=True))
+
+    async def _async_poll(self):
+        try:
+            files = await self.hass.async_add_executor_job(scan_files, self.root, self.hki_path)
+            changed = {
+                path for path in files.keys() | self._files.keys() if files.get(path) != self._files.get(path)
+            }
+            self._files = files
+
+            if changed:
+                self._pending |= changed
+                self._async_schedule(SETTLE_DELAY)
+                return
+
+            if self._pending:
+                pending, self._pending = self._pending, set()
+                await self._async_apply(pending)
+        except Exception as e:
+            _LOGGER.error(f"Error handling changed files: {e}")
+
+        self._async_schedule(POLL_INTERVAL)
+
+    async def _async_apply(self, changed):
+        """Update the state for the changed files, and fire their reload events."""
+        store = self.hass.data[DOMAIN]["config_store"]
+        events = set()
+        more_pages = set()
+        hki_files = set()
+
+        for path in changed:
+            if os.path.commonpath([path, self.hki_path]) == self.hki_path:
+                if path.endswith(".yaml"):
+                    hki_files.add(path)
+                continue
+
+            if store.is_own_write(path, self._files.get(path, (None,))[0]):
+                continue
+
+            parts = os.path.relpath(path, self.root).split(os.sep)
+            if parts[:2] == ["configs", "more_pages"] and len(parts) > 3:
+                more_pages.add(parts[2])
+            elif parts[0] == "configs" and len(parts) > 1:
+                folder = "/".join(parts[1:3]) if len(parts) > 2 else parts[1]
+                events.update(CONFIG_RELOAD_EVENTS.get(folder, (DASHBOARD_RELOAD,)))
+            else:
+                events.add(DASHBOARD_RELOAD)
+
+        if more_pages:
+            _LOGGER.debug(f"More pages changed: {', '.join(sorted(more_pages))}")
+            await async_update_more_pages(self.hass, more_pages)
+            # Missing config.yaml files were just created, they are not a change of their own
+            self._files.update(
+                await self.hass.async_add_executor_job(
+                    scan_files,
+                    *(os.path.join(self.root, "configs", "more_pages", subdir) for subdir in more_pages),
+                )
+            )
+            events.update((DASHBOARD_RELOAD, NAVIGATION_RELOAD, MORE_PAGES_RELOAD))
+
+        if hki_files:
+            _LOGGER.debug(f"HKI config changed: {', '.join(sorted(hki_files))}")
+            await async_update_llgen_config(self.hass, hki_files)
+            events.add(DASHBOARD_RELOAD)
+
+        store.async_fire_reload(*sorted(events))
@@ -0,0 +1,70 @@
+"""Bulk loading of YAML files."""
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import yaml
+
+_LOGGER = logging.getLogger(__name__)
+
+# libyaml is a lot faster, fall back to the pure Python loader when it is not available
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Files are read and parsed by at most this many threads at once
+MAX_WORKERS = 4
+
+# Shared by all bulk loads, its threads are started on first use and kept
+_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="dwains_dashboard_yaml")
+
+
+def load_yaml_file(path):
+    """Load a YAML file with the fastest safe loader."""
+    with open(path, encoding="utf-8") as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+
+def list_yaml_files(path):
+    """Return the sorted names of the YAML files in a folder, or nothing if it does not exist."""
+    try:
+        with os.scandir(path) as it:
+            return sorted(entry.name for entry in it if entry.is_file() and entry.name.endswith(".yaml"))
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
+def list_folders(path):
+    """Return the names of the subfolders of a folder, or nothing if it does not exist."""
+    try:
+        with os.scandir(path) as it:
+            return [entry.name for entry in it if entry.is_dir()]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
+def _load_isolated(path):
+    try:
+        return True, load_yaml_file(path)
+    except (OSError, UnicodeDecodeError, yaml.YAMLError) as err:
+        _LOGGER.error(f"Error loading {path}: {err}")
+        return False, None
+
+
+def load_yaml_files(paths):
+    """Load YAML files in parallel, return a dict of path to data.
+
+    Files that can not be read or parsed are logged and left out, so one
+    broken file does not fail the rest. Runs in the executor.
+    """
+    paths = list(paths)
+    if len(paths) > 1:
+        results = list(_executor.map(_load_isolated, paths))
+    else:
+        results = [_load_isolated(path) for path in paths]
+
+    return {path: data for path, (loaded, data) in zip(paths, results) if loaded}
+
+
+def load_yaml_folder(path):
+    """Load the YAML files in a folder, return a dict of file name to data. Runs in the executor."""
+    loaded = load_yaml_files(os.path.join(path, fname) for fname in list_yaml_files(path))
+    return {os.path.basename(file_path): data for file_path, data in loaded.items()}
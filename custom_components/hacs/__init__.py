@@ -71,6 +71,7 @@ async def _async_initialize_integration(
     hacs.data_client = HacsDataClient(
         session=clientsession,
         client_name=f"HACS/{integration.version}",
+        cache=hacs.http_cache,
     )
     hacs.system.running = True
     hacs.session = clientsession
@@ -132,7 +133,9 @@ async def _async_initialize_integration(
             hacs.disable_hacs(HacsDisabledReason.CONSTRAINS)
             return False
 
-        if not await hacs.data.restore():
+        with hacs.telemetry.startup_stage("restore"):
+            restored = await hacs.data.restore()
+        if not restored:
             hacs.disable_hacs(HacsDisabledReason.RESTORE)
             return False
 
@@ -202,6 +205,9 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
         # Cancel all pending tasks
         task()
 
+    # Apply pending dashboard resource changes
+    await hacs.dashboard_resources.async_flush()
+
     # Store data
     await hacs.data.async_write(force=True)
 
@@ -3,14 +3,14 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterator
 from dataclasses import asdict, dataclass, field
 from datetime import timedelta
+from functools import partial
 import gzip
 import math
 import os
 import pathlib
-import shutil
 from typing import TYPE_CHECKING, Any
 
 from aiogithubapi import (
@@ -32,16 +32,23 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE, Platform
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_send
-from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.issue_registry import IssueSeverity, async_create_issue
 from homeassistant.loader import Integration
 from homeassistant.util import dt
-
-from .const import DOMAIN, TV, URL_BASE
+from yarl import URL
+
+from .const import (
+    DEFAULT_CONCURRENT_DOWNLOADS_PER_HOST,
+    DOMAIN,
+    DOWNLOAD_CHUNK_SIZE,
+    DOWNLOAD_FLUSH_SIZE,
+    TV,
+)
 from .coordinator import HacsUpdateCoordinator
 from .data_client import HacsDataClient
 from .enums import (
     HacsCategory,
+    HacsConcurrencyResource,
     HacsDisabledReason,
     HacsDispatchEvent,
     HacsGitHubRepo,
@@ -58,20 +65,41 @@ from .exceptions import (
     HacsRepositoryExistException,
     HomeAssistantCoreRepositoryException,
 )
+from .frontend import HacsFilesView
 from .repositories import REPOSITORY_CLASSES
-from .repositories.base import HACS_MANIFEST_KEYS_TO_EXPORT, REPOSITORY_KEYS_TO_EXPORT
+from .repositories.base import (
+    HACS_MANIFEST_KEYS_TO_EXPORT,
+    INDEXED_DATA_ATTRIBUTES,
+    REPOSITORY_KEYS_TO_EXPORT,
+    HacsManifest,
+    RepositoryStub,
+)
+from .utils.backup import remove_backups
+from .utils.concurrency import get_concurrency_controller
+from .utils.dashboard_resources import DashboardResourceSync
+from .utils.dispatch import repository_signal
+from .utils.download import FileDownloadWriter, MemoryDownloadWriter
 from .utils.file_system import async_exists
+from .utils.github_graphql_query import REPOSITORIES_STATUS_BATCH_SIZE, get_repositories_status
+from .utils.http_cache import HacsHttpCache
 from .utils.json import json_loads
 from .utils.logger import LOGGER
+from .utils.path import is_safe
 from .utils.queue_manager import QueueManager
+from .utils.release_notes import HacsReleaseNotesCache
+from .utils.scheduler import HacsScheduler
 from .utils.store import async_load_from_store, async_save_to_store
-from .utils.workarounds import async_register_static_path
+from .utils.telemetry import HacsTelemetry
+from .websocket.repositories import RepositoryListCache
 
 if TYPE_CHECKING:
     from .repositories.base import HacsRepository
     from .utils.data import HacsData
     from .validate.manager import ValidationManager
 
+# Time out stalled downloads rather than slow ones, they are resumed with a range request
+DOWNLOAD_TIMEOUT = ClientTimeout(total=None, sock_connect=60, sock_read=60)
+
 
 @dataclass
 class RemovedRepository:
@@ -197,16 +225,47 @@ class HacsRepositories:
     """HACS Repositories."""
 
     _default_repositories: set[str] = field(default_factory=set)
-    _repositories: set[HacsRepository] = field(default_factory=set)
-    _repositories_by_full_name: dict[str, HacsRepository] = field(default_factory=dict)
-    _repositories_by_id: dict[str, HacsRepository] = field(default_factory=dict)
+    _repositories: set[HacsRepository | RepositoryStub] = field(default_factory=set)
+    _repositories_by_full_name: dict[str, HacsRepository | RepositoryStub] = field(
+        default_factory=dict
+    )
+    _repositories_by_id: dict[str, HacsRepository | RepositoryStub] = field(default_factory=dict)
     _removed_repositories_by_full_name: dict[str, RemovedRepository] = field(default_factory=dict)
+    _repositories_by_category: dict[str, set[HacsRepository | RepositoryStub]] = field(
+        default_factory=dict
+    )
+    _downloaded_repositories: set[HacsRepository] = field(default_factory=set)
+    _new_repositories: set[HacsRepository | RepositoryStub] = field(default_factory=set)
+    _generation: int = 0
+    _category_generations: dict[str, int] = field(default_factory=dict)
 
     @property
-    def list_all(self) -> list[HacsRepository]:
+    def list_all(self) -> list[HacsRepository | RepositoryStub]:
         """Return a list of repositories."""
         return list(self._repositories)
 
+    def iter_all(self) -> Iterator[HacsRepository | RepositoryStub]:
+        """Iterate over all repositories without copying them."""
+        return iter(self._repositories)
+
+    def iter_category(self, category: str) -> Iterator[HacsRepository | RepositoryStub]:
+        """Iterate over the repositories in a category."""
+        return iter(self._repositories_by_category.get(category, ()))
+
+    def iter_downloaded(self) -> Iterator[HacsRepository]:
+        """Iterate over downloaded repositories."""
+        return iter(self._downloaded_repositories)
+
+    def iter_new(self) -> Iterator[HacsRepository | RepositoryStub]:
+        """Iterate over repositories flagged as new."""
+        return iter(self._new_repositories)
+
+    def iter_default(self) -> Iterator[HacsRepository | RepositoryStub]:
+        """Iterate over registered default repositories."""
+        for repository_id in self._default_repositories:
+            if (repository := self._repositories_by_id.get(repository_id)) is not None:
+                yield repository
+
     @property
     def list_removed(self) -> list[RemovedRepository]:
         """Return a list of removed repositories."""
@@ -215,16 +274,44 @@ class HacsRepositories:
     @property
     def list_downloaded(self) -> list[HacsRepository]:
         """Return a list of downloaded repositories."""
-        return [repo for repo in self._repositories if repo.data.installed]
+        return list(self._downloaded_repositories)
 
     def category_downloaded(self, category: HacsCategory) -> bool:
         """Check if a given category has been downloaded."""
-        for repository in self.list_downloaded:
-            if repository.data.category == category:
-                return True
-        return False
+        return any(
+            repository.data.category == category for repository in self._downloaded_repositories
+        )
+
+    def generation(self, category: str) -> int:
+        """Return a counter that changes whenever a repository in the category changes."""
+        return self._generation + self._category_generations.get(category, 0)
 
-    def register(self, repository: HacsRepository, default: bool = False) -> None:
+    def bump_generation(self, category: str | None = None) -> None:
+        """Count a change to the repositories of a category, or of all categories."""
+        if category is None:
+            self._generation += 1
+        else:
+            self._category_generations[category] = self._category_generations.get(category, 0) + 1
+
+    def _repository_changed(self, repository: HacsRepository | RepositoryStub, name: str) -> None:
+        """Follow a change to an attribute of a registered repository."""
+        if name in INDEXED_DATA_ATTRIBUTES:
+            self._update_indexes(repository)
+        self.bump_generation(repository.data.category)
+
+    def _update_indexes(self, repository: HacsRepository | RepositoryStub) -> None:
+        """Update the installed and new indexes for a repository."""
+        if repository.data.installed:
+            self._downloaded_repositories.add(repository)
+        else:
+            self._downloaded_repositories.discard(repository)
+
+        if repository.data.new:
+            self._new_repositories.add(repository)
+        else:
+            self._new_repositories.discard(repository)
+
+    def register(self, repository: HacsRepository | RepositoryStub, default: bool = False) -> None:
         """Register a repository."""
         repo_id = str(repository.data.id)
 
@@ -246,11 +333,15 @@ class HacsRepositories:
 
         self._repositories_by_id[repo_id] = repository
         self._repositories_by_full_name[repository.data.full_name_lower] = repository
+        self._repositories_by_category.setdefault(repository.data.category, set()).add(repository)
+        self._update_indexes(repository)
+        self.bump_generation(repository.data.category)
+        repository.data.change_listener = partial(self._repository_changed, repository)
 
         if default:
             self.mark_default(repository)
 
-    def unregister(self, repository: HacsRepository) -> None:
+    def unregister(self, repository: HacsRepository | RepositoryStub) -> None:
         """Unregister a repository."""
         repo_id = str(repository.data.id)
 
@@ -268,20 +359,27 @@ class HacsRepositories:
 
         self._repositories_by_id.pop(repo_id, None)
         self._repositories_by_full_name.pop(repository.data.full_name_lower, None)
-
-    def mark_default(self, repository: HacsRepository) -> None:
+        if (category := self._repositories_by_category.get(repository.data.category)) is not None:
+            category.discard(repository)
+        self._downloaded_repositories.discard(repository)
+        self._new_repositories.discard(repository)
+        self.bump_generation(repository.data.category)
+        repository.data.change_listener = None
+
+    def mark_default(self, repository: HacsRepository | RepositoryStub) -> None:
         """Mark a repository as default."""
         repo_id = str(repository.data.id)
 
         if repo_id == "0":
             return
 
-        if not self.is_registered(repository_id=repo_id):
+        if not self.is_registered(repository_id=repo_id) or repo_id in self._default_repositories:
             return
 
         self._default_repositories.add(repo_id)
+        self.bump_generation(repository.data.category)
 
-    def set_repository_id(self, repository: HacsRepository, repo_id: str):
+    def set_repository_id(self, repository: HacsRepository | RepositoryStub, repo_id: str):
         """Update a repository id."""
         existing_repo_id = str(repository.data.id)
         if existing_repo_id == repo_id:
@@ -326,17 +424,51 @@ class HacsRepositories:
             return False
         return repo.data.installed
 
-    def get_by_id(self, repository_id: str | None) -> HacsRepository | None:
+    def get_by_id(
+        self,
+        repository_id: str | None,
+        *,
+        promote: bool = False,
+    ) -> HacsRepository | RepositoryStub | None:
         """Get repository by id."""
         if not repository_id:
             return None
-        return self._repositories_by_id.get(str(repository_id))
+        repository = self._repositories_by_id.get(str(repository_id))
+        if promote and repository is not None:
+            return self.promote(repository)
+        return repository
 
-    def get_by_full_name(self, repository_full_name: str | None) -> HacsRepository | None:
+    def get_by_full_name(
+        self,
+        repository_full_name: str | None,
+        *,
+        promote: bool = False,
+    ) -> HacsRepository | RepositoryStub | None:
         """Get repository by full name."""
         if not repository_full_name:
             return None
-        return self._repositories_by_full_name.get(repository_full_name.lower())
+        repository = self._repositories_by_full_name.get(repository_full_name.lower())
+        if promote and repository is not None:
+            return self.promote(repository)
+        return repository
+
+    def promote(self, repository: HacsRepository | RepositoryStub) -> HacsRepository:
+        """Replace a catalogue stub with a full repository object."""
+        if not isinstance(repository, RepositoryStub):
+            return repository
+
+        full: HacsRepository = REPOSITORY_CLASSES[repository.category](
+            repository.hacs, repository.full_name
+        )
+        full.data.update_data(repository.to_dict())
+        full.repository_manifest = HacsManifest.from_dict(repository.manifest)
+        if full.localpath is not None and is_safe(repository.hacs, full.localpath):
+            full.content.path.local = full.localpath
+
+        default = self.is_default(str(repository.id))
+        self.unregister(repository)
+        self.register(full, default)
+        return full
 
     def is_removed(self, repository_full_name: str) -> bool:
         """Check if a repository is removed."""
@@ -377,7 +509,14 @@ class HacsBase:
         self.core = HacsCore()
         self.log = LOGGER
         self.recurring_tasks: list[Callable[[], None]] = []
+        self._download_semaphores: dict[str, asyncio.Semaphore] = {}
         self.repositories = HacsRepositories()
+        self.repositories_list_cache = RepositoryListCache(self)
+        self.http_cache = HacsHttpCache()
+        self.release_notes = HacsReleaseNotesCache()
+        self.scheduler = HacsScheduler(self)
+        self.dashboard_resources = DashboardResourceSync(self)
+        self.telemetry = HacsTelemetry()
         self.status = HacsStatus()
         self.system = HacsSystem()
 
@@ -428,6 +567,17 @@ class HacsBase:
             self.common.categories.pop(category)
             self.coordinators.pop(category)
 
+    def _remove_legacy_theme_file(self, file_path: str) -> None:
+        """Remove a theme file stored in the legacy location."""
+        # LEGACY! Remove with 2.0
+        if "themes" in file_path and file_path.endswith(".yaml"):
+            filename = file_path.split("/")[-1]
+            base = file_path.split("/themes/")[0]
+            combined = f"{base}/themes/{filename}"
+            if os.path.exists(combined):
+                self.log.info("Removing old theme file %s", combined)
+                os.remove(combined)
+
     async def async_save_file(self, file_path: str, content: Any) -> bool:
         """Save a file."""
 
@@ -440,24 +590,16 @@ class HacsBase:
             ) as file_handler:
                 file_handler.write(content)
 
-            # Create gz for .js files
-            if os.path.isfile(file_path):
-                if file_path.endswith(".js"):
-                    with open(file_path, "rb") as f_in:
-                        with gzip.open(file_path + ".gz", "wb") as f_out:
-                            shutil.copyfileobj(f_in, f_out)
-
-            # LEGACY! Remove with 2.0
-            if "themes" in file_path and file_path.endswith(".yaml"):
-                filename = file_path.split("/")[-1]
-                base = file_path.split("/themes/")[0]
-                combined = f"{base}/themes/{filename}"
-                if os.path.exists(combined):
-                    self.log.info("Removing old theme file %s", combined)
-                    os.remove(combined)
+            # Create gz for .js files from the content we already have
+            if file_path.endswith(".js"):
+                with gzip.open(file_path + ".gz", "wb") as f_out:
+                    f_out.write(content.encode("utf-8") if isinstance(content, str) else content)
+
+            self._remove_legacy_theme_file(file_path)
 
         try:
-            await self.hass.async_add_executor_job(_write_file)
+            async with get_concurrency_controller(HacsConcurrencyResource.FILESYSTEM).slot():
+                await self.hass.async_add_executor_job(_write_file)
         except (
             # lgtm [py/catch-base-exception] pylint: disable=broad-except
             BaseException
@@ -471,6 +613,9 @@ class HacsBase:
         """Helper to calculate the number of repositories we can fetch data for."""
         try:
             response = await self.async_github_api_method(self.githubapi.rate_limit)
+            self.queue.rate_limit.update(
+                response.data.resources.core.remaining, response.data.resources.core.reset
+            )
             if ((limit := response.data.resources.core.remaining or 0) - 1000) >= 10:
                 return math.floor((limit - 1000) / 10)
             reset = dt.as_local(dt.utc_from_timestamp(response.data.resources.core.reset))
@@ -493,20 +638,39 @@ class HacsBase:
         method: Callable[[], Awaitable[TV]],
         *args,
         raise_exception: bool = True,
+        cache_key: str | None = None,
         **kwargs,
     ) -> TV | None:
-        """Call a GitHub API method"""
+        """Call a GitHub API method.
+
+        With a cache_key the request is conditional, and a cached response is
+        replayed when GitHub reports it as not modified.
+        """
         _exception = None
 
+        if cache_key is not None and (etag := self.http_cache.github_etag(cache_key)):
+            kwargs["etag"] = etag
+
+        self.telemetry.github_call(getattr(method, "__qualname__", str(method)))
         try:
-            return await method(*args, **kwargs)
+            response = await method(*args, **kwargs)
+            if cache_key is not None:
+                self.http_cache.github_store(cache_key, response)
+            if (headers := getattr(response, "headers", None)) is not None and (
+                remaining := getattr(headers, "x_ratelimit_remaining", None)
+            ) is not None:
+                self.queue.rate_limit.update(remaining, headers.x_ratelimit_reset)
+            return response
         except GitHubAuthenticationException as exception:
             self.disable_hacs(HacsDisabledReason.INVALID_TOKEN)
             _exception = exception
         except GitHubRatelimitException as exception:
+            get_concurrency_controller(HacsConcurrencyResource.GITHUB).throttled()
             self.disable_hacs(HacsDisabledReason.RATE_LIMIT)
             _exception = exception
         except GitHubNotModifiedException as exception:
+            if cache_key is not None and (cached := self.http_cache.github_replay(cache_key)):
+                return cached
             raise exception
         except GitHubException as exception:
             _exception = exception
@@ -530,8 +694,13 @@ class HacsBase:
         ref: str | None = None,
         repository_id: str | None = None,
         default: bool = False,
+        stub: bool = False,
     ) -> None:
-        """Register a repository."""
+        """Register a repository.
+
+        With stub=True (only used together with check=False) a lightweight
+        RepositoryStub is registered instead of a full repository object.
+        """
         if repository_full_name in self.common.skip:
             if repository_full_name != HacsGitHubRepo.INTEGRATION:
                 raise HacsExpectedException(f"Skipping {repository_full_name}")
@@ -555,7 +724,10 @@ class HacsBase:
         if (renamed := self.common.renamed_repositories.get(repository_full_name)) is not None:
             repository_full_name = renamed
 
-        repository: HacsRepository = REPOSITORY_CLASSES[category](self, repository_full_name)
+        if stub and not check:
+            repository = RepositoryStub(self, repository_full_name, category)
+        else:
+            repository = REPOSITORY_CLASSES[category](self, repository_full_name)
         if check:
             try:
                 await repository.async_registration(ref)
@@ -608,7 +780,33 @@ class HacsBase:
     async def startup_tasks(self, _=None) -> None:
         """Tasks that are started after setup."""
         self.set_stage(HacsStage.STARTUP)
-        await self.async_load_hacs_from_github()
+        # Backups only live for the duration of an upgrade
+        await self.hass.async_add_executor_job(remove_backups, self)
+        self.scheduler.async_add("hacs", self.async_load_hacs_from_github, timedelta(hours=48))
+        self.scheduler.async_add(
+            "custom", self.async_update_downloaded_custom_repositories, timedelta(hours=48)
+        )
+        self.scheduler.async_add(
+            "removed", self.async_handle_removed_repositories, timedelta(hours=48), startup=True
+        )
+        self.scheduler.async_add(
+            "categories",
+            self.async_get_all_category_repositories,
+            timedelta(hours=6),
+            startup=True,
+        )
+        self.scheduler.async_add("rate_limit", self.async_check_rate_limit, timedelta(minutes=5))
+        self.scheduler.async_add(
+            "queue", self.async_process_queue, timedelta(minutes=10), startup=True
+        )
+        self.scheduler.async_add(
+            "critical", self.async_handle_critical_repositories, timedelta(hours=6), startup=True
+        )
+        await self.scheduler.async_start()
+        self.recurring_tasks.append(self.scheduler.async_stop)
+
+        with self.telemetry.startup_stage("register"):
+            await self.scheduler.async_run("hacs")
 
         if critical := await async_load_from_store(self.hass, "critical"):
             for repo in critical:
@@ -619,62 +817,126 @@ class HacsBase:
                     )
                     break
 
-        self.recurring_tasks.append(
-            async_track_time_interval(
-                self.hass,
-                self.async_load_hacs_from_github,
-                timedelta(hours=48),
-            )
-        )
-
-        self.recurring_tasks.append(
-            async_track_time_interval(
-                self.hass, self.async_update_downloaded_custom_repositories, timedelta(hours=48)
-            )
-        )
-
-        self.recurring_tasks.append(
-            async_track_time_interval(
-                self.hass, self.async_get_all_category_repositories, timedelta(hours=6)
-            )
-        )
-
-        self.recurring_tasks.append(
-            async_track_time_interval(self.hass, self.async_check_rate_limit, timedelta(minutes=5))
-        )
-        self.recurring_tasks.append(
-            async_track_time_interval(self.hass, self.async_process_queue, timedelta(minutes=10))
-        )
-
-        self.recurring_tasks.append(
-            async_track_time_interval(
-                self.hass, self.async_handle_critical_repositories, timedelta(hours=6)
-            )
-        )
-
         unsub = self.hass.bus.async_listen_once(
             EVENT_HOMEASSISTANT_FINAL_WRITE, self.data.async_force_write
         )
         if config_entry := self.configuration.config_entry:
             config_entry.async_on_unload(unsub)
 
-        self.log.debug("There are %s scheduled recurring tasks", len(self.recurring_tasks))
+        self.log.debug("There are %s scheduled recurring tasks", len(self.scheduler.tasks))
 
         self.status.startup = False
         self.async_dispatch(HacsDispatchEvent.STATUS, {})
 
-        await self.async_handle_removed_repositories()
-        await self.async_get_all_category_repositories()
+        # Critical repositories are handled right away, even if they were checked recently
+        with self.telemetry.startup_stage("critical"):
+            await self.scheduler.async_run("critical")
+
+        if config_entry := self.configuration.config_entry:
+            config_entry.async_create_background_task(
+                self.hass, self.async_deferred_startup_tasks(), "hacs_deferred_startup_tasks"
+            )
+        else:
+            self.hass.async_create_background_task(
+                self.async_deferred_startup_tasks(), "hacs_deferred_startup_tasks"
+            )
+
+    async def async_deferred_startup_tasks(self) -> None:
+        """Run the startup work that is due once the event loop is idle."""
+        await self.scheduler.async_wait_for_idle()
+
+        with self.telemetry.startup_stage("removed"):
+            await self.scheduler.async_run_if_due("removed")
+        with self.telemetry.startup_stage("categories"):
+            if not await self.scheduler.async_run_if_due("categories"):
+                await self.async_restore_category_repositories()
 
         self.set_stage(HacsStage.RUNNING)
 
         self.async_dispatch(HacsDispatchEvent.RELOAD, {"force": True})
 
-        await self.async_handle_critical_repositories()
-        await self.async_process_queue()
+        with self.telemetry.startup_stage("queue"):
+            await self.scheduler.async_run_if_due("queue")
 
         self.async_dispatch(HacsDispatchEvent.STATUS, {})
 
+    def _download_semaphore(self, url: str) -> asyncio.Semaphore:
+        """Return the semaphore limiting concurrent downloads from the host of the URL."""
+        host = URL(url).host or ""
+        if (semaphore := self._download_semaphores.get(host)) is None:
+            semaphore = self._download_semaphores[host] = asyncio.Semaphore(
+                DEFAULT_CONCURRENT_DOWNLOADS_PER_HOST
+            )
+        return semaphore
+
+    async def _async_stream_download(
+        self,
+        url: str,
+        writer: FileDownloadWriter | MemoryDownloadWriter,
+        *,
+        headers: dict | None = None,
+        in_executor: bool = False,
+    ) -> None:
+        """Stream a download to the writer, resuming with a range request after a timeout."""
+
+        async def _call(func: Callable[..., None], *args: Any) -> None:
+            if in_executor:
+                await self.hass.async_add_executor_job(func, *args)
+            else:
+                func(*args)
+
+        buffer = bytearray()
+        received = 0
+        timeouts = 0
+
+        async def _flush() -> None:
+            nonlocal received
+            if buffer:
+                await _call(writer.write, bytes(buffer))
+                received += len(buffer)
+                buffer.clear()
+
+        while True:
+            request_headers = dict(headers or {})
+            if received:
+                request_headers["Range"] = f"bytes={received}-"
+            try:
+                async with self.session.get(
+                    url=url,
+                    timeout=DOWNLOAD_TIMEOUT,
+                    headers=request_headers,
+                ) as request:
+                    if request.status == 200 and received:
+                        # The server ignored the range, start over
+                        await _call(writer.reset)
+                        received = 0
+                    elif request.status not in (200, 206) or (request.status == 206 and not received):
+                        raise HacsException(
+                            f"Got status code {request.status} when trying to download {url}"
+                        )
+
+                    async for chunk in request.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                        buffer.extend(chunk)
+                        if len(buffer) >= DOWNLOAD_FLUSH_SIZE:
+                            await _flush()
+                    await _flush()
+                    self.telemetry.download(received)
+                    return
+
+            except TimeoutError:
+                timeouts += 1
+                if timeouts >= 5:
+                    raise
+                await _flush()
+                self.log.warning(
+                    "A timeout was encountered while downloading %s, "
+                    "resuming from byte %s. Tries left %s",
+                    url,
+                    received,
+                    (5 - timeouts),
+                )
+                await asyncio.sleep(timeouts)
+
     async def async_download_file(
         self,
         url: str,
@@ -692,47 +954,59 @@ class HacsBase:
             url = url.replace("tags/", "")
 
         self.log.debug("Trying to download %s", url)
-        timeouts = 0
+        writer = MemoryDownloadWriter()
 
-        while timeouts < 5:
-            try:
-                request = await self.session.get(
-                    url=url,
-                    timeout=ClientTimeout(total=60),
-                    headers=headers,
-                )
+        try:
+            async with self._download_semaphore(url):
+                await self._async_stream_download(url, writer, headers=headers)
+        except (
+            # lgtm [py/catch-base-exception] pylint: disable=broad-except
+            BaseException
+        ) as exception:
+            if not nolog:
+                self.log.exception("Download failed - %s", exception)
+            return None
 
-                # Make sure that we got a valid result
-                if request.status == 200:
-                    return await request.read()
+        return writer.getvalue()
 
-                raise HacsException(
-                    f"Got status code {
-                        request.status} when trying to download {url}"
-                )
-            except TimeoutError:
-                self.log.warning(
-                    "A timeout of 60! seconds was encountered while downloading %s, "
-                    "using over 60 seconds to download a single file is not normal. "
-                    "This is not a problem with HACS but how your host communicates with GitHub. "
-                    "Retrying up to 5 times to mask/hide your host/network problems to "
-                    "stop the flow of issues opened about it. "
-                    "Tries left %s",
-                    url,
-                    (4 - timeouts),
-                )
-                timeouts += 1
-                await asyncio.sleep(1)
-                continue
+    async def async_download_to_file(
+        self,
+        url: str,
+        file_path: str,
+        *,
+        headers: dict | None = None,
+        keep_url: bool = False,
+        nolog: bool = False,
+    ) -> bool:
+        """Stream a download to a file, return True if the file was written.
 
-            except (
-                # lgtm [py/catch-base-exception] pylint: disable=broad-except
-                BaseException
-            ) as exception:
-                if not nolog:
-                    self.log.exception("Download failed - %s", exception)
+        .js files get a .gz copy compressed while the chunks are written.
+        """
+        if url is None:
+            return False
 
-            return None
+        if not keep_url and "tags/" in url:
+            url = url.replace("tags/", "")
+
+        self.log.debug("Trying to download %s to %s", url, file_path)
+        writer = FileDownloadWriter(file_path, gzip_copy=file_path.endswith(".js"))
+
+        try:
+            async with self._download_semaphore(url):
+                await self.hass.async_add_executor_job(writer.open)
+                await self._async_stream_download(url, writer, headers=headers, in_executor=True)
+            await self.hass.async_add_executor_job(writer.commit)
+            await self.hass.async_add_executor_job(self._remove_legacy_theme_file, file_path)
+        except (
+            # lgtm [py/catch-base-exception] pylint: disable=broad-except
+            BaseException
+        ) as exception:
+            await self.hass.async_add_executor_job(writer.abort)
+            if not nolog:
+                self.log.exception("Download failed - %s", exception)
+            return False
+
+        return True
 
     async def async_recreate_entities(self) -> None:
         """Recreate entities."""
@@ -761,7 +1035,17 @@ class HacsBase:
     @callback
     def async_dispatch(self, signal: HacsDispatchEvent, data: dict | None = None) -> None:
         """Dispatch a signal with data."""
+        if signal == HacsDispatchEvent.REPOSITORY:
+            repository = None
+            if data:
+                repository = self.repositories.get_by_id(data.get("repository_id"))
+                repository = repository or self.repositories.get_by_full_name(
+                    data.get("repository")
+                )
+            self.repositories.bump_generation(repository.data.category if repository else None)
         async_dispatcher_send(self.hass, signal, data)
+        if data and (repository_id := data.get("repository_id")) is not None:
+            async_dispatcher_send(self.hass, repository_signal(signal, repository_id), data)
 
     def set_active_categories(self) -> None:
         """Set the active categories."""
@@ -789,7 +1073,9 @@ class HacsBase:
             return
 
         try:
-            repository = self.repositories.get_by_full_name(HacsGitHubRepo.INTEGRATION)
+            repository = self.repositories.get_by_full_name(
+                HacsGitHubRepo.INTEGRATION, promote=True
+            )
             should_recreate_entities = False
             if repository is None:
                 should_recreate_entities = True
@@ -840,16 +1126,88 @@ class HacsBase:
         """Update all category repositories."""
         self.log.debug("Fetching updated content for %s", category)
         try:
-            category_data = await self.data_client.get_data(category, validate=True)
+            category_data = await self.data_client.get_data(
+                category,
+                validate=True,
+                last_fetched={
+                    str(repository.data.id): repository.data.last_fetched.timestamp()
+                    for repository in self.repositories.iter_category(category)
+                    if repository.data.last_fetched is not None
+                },
+            )
         except HacsNotModifiedException:
             self.log.debug("No updates for %s", category)
-            return
+            if not self._mark_known_default_repositories(category):
+                # The restored repositories are out of step with the validator
+                self.data_client.forget(category)
+                await self.async_get_category_repositories_experimental(category)
+                return
         except HacsException as exception:
             self.log.error("Could not update %s - %s", category, exception)
             return
+        else:
+            await self.async_apply_category_repositories(category, category_data)
+
+        self._async_category_repositories_loaded(category)
+
+    async def async_restore_category_repositories(self) -> None:
+        """Mark the default repositories stored with the category validators.
+
+        Used when the catalogues were fetched recently, categories without a
+        usable validator are fetched.
+        """
+        for category in self.common.categories or []:
+            if self._mark_known_default_repositories(category):
+                self._async_category_repositories_loaded(category)
+            else:
+                await self.async_get_category_repositories_experimental(category)
+
+    def _mark_known_default_repositories(self, category: str) -> bool:
+        """Mark the default repositories stored with a category validator.
+
+        Return False if there are none, or if any of them is not registered.
+        """
+        known = self.data_client.known_repositories(category)
+        if known is None or not all(
+            self.repositories.is_registered(repository_id=repo_id) for repo_id in known
+        ):
+            return False
+        for repo_id in known:
+            repository = self.repositories.get_by_id(repo_id)
+            if (
+                not self.repositories.is_removed(repository.data.full_name)
+                and repository.data.full_name not in self.common.archived_repositories
+            ):
+                self.repositories.mark_default(repository)
+        return True
+
+    @callback
+    def _async_category_repositories_loaded(self, category: str) -> None:
+        """Finish loading the repositories of a category."""
+        if category == "integration":
+            self.status.inital_fetch_done = True
 
+        if self.stage == HacsStage.STARTUP:
+            for repository in list(self.repositories.iter_category(category)):
+                if (
+                    not repository.data.installed
+                    and not self.repositories.is_default(repository.data.id)
+                ):
+                    repository.logger.debug(
+                        "%s Unregister stale custom repository", repository.string
+                    )
+                    self.repositories.unregister(repository)
+
+        self.async_dispatch(HacsDispatchEvent.REPOSITORY, {})
+        self.coordinators[category].async_update_listeners()
+
+    async def async_apply_category_repositories(
+        self, category: str, category_data: dict[str, dict[str, Any]]
+    ) -> None:
+        """Apply fetched category data, and mark its repositories as default."""
         await self.data.register_unknown_repositories(category_data, category)
 
+        default = []
         for repo_id, repo_data in category_data.items():
             repo_name = repo_data["full_name"]
             if self.common.renamed_repositories.get(repo_name):
@@ -861,6 +1219,7 @@ class HacsBase:
             if repository := self.repositories.get_by_full_name(repo_name):
                 self.repositories.set_repository_id(repository, repo_id)
                 self.repositories.mark_default(repository)
+                default.append(repo_id)
                 if repository.data.last_fetched is None or (
                     repository.data.last_fetched.timestamp() < repo_data["last_fetched"]
                 ):
@@ -870,23 +1229,7 @@ class HacsBase:
                             {**dict(HACS_MANIFEST_KEYS_TO_EXPORT), **manifest}
                         )
 
-        if category == "integration":
-            self.status.inital_fetch_done = True
-
-        if self.stage == HacsStage.STARTUP:
-            for repository in self.repositories.list_all:
-                if (
-                    repository.data.category == category
-                    and not repository.data.installed
-                    and not self.repositories.is_default(repository.data.id)
-                ):
-                    repository.logger.debug(
-                        "%s Unregister stale custom repository", repository.string
-                    )
-                    self.repositories.unregister(repository)
-
-        self.async_dispatch(HacsDispatchEvent.REPOSITORY, {})
-        self.coordinators[category].async_update_listeners()
+        self.data_client.confirm(category, repositories=default)
 
     async def async_check_rate_limit(self, _=None) -> None:
         """Check rate limit."""
@@ -912,25 +1255,24 @@ class HacsBase:
             self.log.debug("Queue is already running")
             return
 
-        async def _handle_queue():
-            if not self.queue.has_pending_tasks:
-                await self.data.async_write()
-                return
+        while self.queue.has_pending_tasks:
             can_update = await self.async_can_update()
             self.log.debug(
                 "Can update %s repositories, items in queue %s",
                 can_update,
                 self.queue.pending_tasks,
             )
-            if can_update != 0:
-                try:
-                    await self.queue.execute(can_update)
-                except HacsExecutionStillInProgress:
-                    return
-
-                await _handle_queue()
+            if can_update == 0:
+                return
+            pending = self.queue.pending_tasks
+            try:
+                await self.queue.execute(can_update)
+            except HacsExecutionStillInProgress:
+                return
+            if self.queue.pending_tasks == pending:
+                return
 
-        await _handle_queue()
+        await self.data.async_write()
 
     async def async_handle_removed_repositories(self, _=None) -> None:
         """Handle removed repositories."""
@@ -983,6 +1325,8 @@ class HacsBase:
         if need_to_save:
             await self.data.async_write()
 
+        self.data_client.confirm("removed")
+
     async def async_update_downloaded_custom_repositories(self, _=None) -> None:
         """Execute the task."""
         if self.system.disabled:
@@ -1000,13 +1344,18 @@ class HacsBase:
             if not repositories_to_update:
                 repositories_updated.set()
 
-        for repository in self.repositories.list_downloaded:
-            if (
-                repository.data.category in self.common.categories
-                and not self.repositories.is_default(repository.data.id)
-            ):
-                repositories_to_update += 1
-                self.queue.add(update_repository(repository))
+        repositories = [
+            repository
+            for repository in self.repositories.iter_downloaded()
+            if repository.data.category in self.common.categories
+            and not self.repositories.is_default(repository.data.id)
+        ]
+        for repository in await self.async_get_changed_repositories(repositories):
+            repositories_to_update += 1
+            self.queue.add(update_repository(repository))
+
+        if not repositories_to_update:
+            repositories_updated.set()
 
         async def update_coordinators() -> None:
             """Update all coordinators."""
@@ -1023,6 +1372,58 @@ class HacsBase:
 
         self.log.debug("Recurring background task for downloaded custom repositories done")
 
+    async def async_get_changed_repositories(
+        self, repositories: list[HacsRepository]
+    ) -> list[HacsRepository]:
+        """Check repositories in batched GraphQL queries, return those needing a full update."""
+        changed = []
+        for start in range(0, len(repositories), REPOSITORIES_STATUS_BATCH_SIZE):
+            changed.extend(
+                await self._async_get_changed_in_batch(
+                    repositories[start : start + REPOSITORIES_STATUS_BATCH_SIZE]
+                )
+            )
+
+        self.log.debug(
+            "%s of %s repositories changed since the last check", len(changed), len(repositories)
+        )
+        return changed
+
+    async def _async_get_changed_in_batch(
+        self, batch: list[HacsRepository]
+    ) -> list[HacsRepository]:
+        """Check a batch of repositories in one GraphQL query.
+
+        Any error in the response fails the whole query, so a failing batch is
+        split in halves until only the repositories that cannot be resolved
+        fall back to a full update.
+        """
+        query, variables = get_repositories_status(
+            [repository.data.full_name for repository in batch]
+        )
+        response = await self.async_github_api_method(
+            method=self.githubapi.graphql,
+            query=query,
+            variables=variables,
+            raise_exception=False,
+        )
+        if response is None:
+            if len(batch) == 1 or self.system.disabled:
+                return batch
+            middle = len(batch) // 2
+            return [
+                *await self._async_get_changed_in_batch(batch[:middle]),
+                *await self._async_get_changed_in_batch(batch[middle:]),
+            ]
+
+        statuses = response.data.get("data") or {}
+        return [
+            repository
+            for index, repository in enumerate(batch)
+            if (status := statuses.get(f"r{index}")) is None
+            or repository.update_from_status(status)
+        ]
+
     async def async_handle_critical_repositories(self, _=None) -> None:
         """Handle critical repositories."""
         critical_queue = QueueManager(hass=self.hass)
@@ -1039,6 +1440,7 @@ class HacsBase:
 
         if not critical:
             self.log.debug("No critical repositories")
+            self.data_client.confirm("critical")
             return
 
         stored_critical = await async_load_from_store(self.hass, "critical")
@@ -1079,6 +1481,7 @@ class HacsBase:
 
         # Save to FS
         await async_save_to_store(self.hass, "critical", stored_critical)
+        self.data_client.confirm("critical")
 
         # Restart HASS
         if was_installed:
@@ -1093,18 +1496,8 @@ class HacsBase:
             return
 
         self.log.info("Setting up plugin endpoint")
-        use_cache = self.core.lovelace_mode == "storage"
-        self.log.info(
-            "<HacsFrontend> %s mode, cache for /hacsfiles/: %s",
-            self.core.lovelace_mode,
-            use_cache,
-        )
-
-        await async_register_static_path(
-            self.hass,
-            URL_BASE,
-            self.hass.config.path("www/community"),
-            cache_headers=use_cache,
+        self.hass.http.register_view(
+            HacsFilesView(self, self.hass.config.path("www/community"))
         )
 
         self.status.active_frontend_endpoint_plugin = True
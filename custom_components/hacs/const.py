@@ -16,7 +16,17 @@ TV = TypeVar("TV")
 PACKAGE_NAME = "custom_components.hacs"
 
 DEFAULT_CONCURRENT_TASKS = 15
-DEFAULT_CONCURRENT_BACKOFF_TIME = 1
+
+# Initial and maximum concurrency per resource, the adaptive limit moves between 1 and maximum
+CONCURRENCY_LIMITS = {
+    "download": (6, 20),
+    "filesystem": (4, 8),
+    "github": (10, 25),
+}
+DEFAULT_CONCURRENT_DOWNLOADS_PER_HOST = 6
+
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+DOWNLOAD_FLUSH_SIZE = 1024 * 1024
 
 HACS_REPOSITORY_ID = "172733314"
 
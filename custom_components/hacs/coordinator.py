@@ -2,37 +2,89 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
-from typing import Any
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.core import CALLBACK_TYPE, callback
 from homeassistant.helpers.update_coordinator import BaseDataUpdateCoordinatorProtocol
 
+if TYPE_CHECKING:
+    from .repositories.base import HacsRepository
+
+
+def repository_entity_state(repository: HacsRepository) -> tuple[Any, ...]:
+    """Return the repository values entity states are based on."""
+    return (
+        repository.data.installed,
+        repository.display_installed_version,
+        repository.display_available_version,
+        repository.pending_update,
+        repository.data.show_beta,
+        repository.data.last_fetched,
+    )
+
 
 class HacsUpdateCoordinator(BaseDataUpdateCoordinatorProtocol):
-    """Dispatch updates to update entities."""
+    """Dispatch updates to update entities.
+
+    Listeners registered with a repository as context are only called when
+    the values their state is based on changed for that repository.
+    """
 
     def __init__(self) -> None:
         """Initialize."""
         self._listeners: dict[CALLBACK_TYPE, tuple[CALLBACK_TYPE, object | None]] = {}
+        self._repository_listeners: dict[str, dict[CALLBACK_TYPE, CALLBACK_TYPE]] = {}
+        self._repositories: dict[str, HacsRepository] = {}
+        self._repository_states: dict[str, tuple[Any, ...]] = {}
 
     @callback
     def async_add_listener(
         self, update_callback: CALLBACK_TYPE, context: Any = None
     ) -> Callable[[], None]:
         """Listen for data updates."""
+        repository_id = str(context.data.id) if context is not None else None
 
         @callback
         def remove_listener() -> None:
             """Remove update listener."""
             self._listeners.pop(remove_listener)
+            if repository_id is None:
+                return
+            listeners = self._repository_listeners[repository_id]
+            listeners.pop(remove_listener)
+            if not listeners:
+                del self._repository_listeners[repository_id]
+                self._repositories.pop(repository_id, None)
+                self._repository_states.pop(repository_id, None)
 
         self._listeners[remove_listener] = (update_callback, context)
+        if repository_id is not None:
+            self._repository_listeners.setdefault(repository_id, {})[remove_listener] = (
+                update_callback
+            )
+            self._repositories[repository_id] = context
+            self._repository_states.setdefault(repository_id, repository_entity_state(context))
 
         return remove_listener
 
     @callback
     def async_update_listeners(self) -> None:
-        """Update all registered listeners."""
-        for update_callback, _ in list(self._listeners.values()):
-            update_callback()
+        """Update listeners without a repository, and listeners of changed repositories."""
+        for update_callback, context in list(self._listeners.values()):
+            if context is None:
+                update_callback()
+        self.async_update_repository_listeners(list(self._repository_listeners))
+
+    @callback
+    def async_update_repository_listeners(self, repository_ids: Iterable[str | int]) -> None:
+        """Update listeners of the given repositories if they changed."""
+        for repository_id in map(str, repository_ids):
+            if (listeners := self._repository_listeners.get(repository_id)) is None:
+                continue
+            state = repository_entity_state(self._repositories[repository_id])
+            if self._repository_states.get(repository_id) == state:
+                continue
+            self._repository_states[repository_id] = state
+            for update_callback in list(listeners.values()):
+                update_callback()
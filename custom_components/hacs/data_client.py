@@ -3,14 +3,18 @@
 from __future__ import annotations
 
 import asyncio
+from hashlib import sha256
 from typing import Any
 
 from aiohttp import ClientSession, ClientTimeout
 import voluptuous as vol
 
 from .exceptions import HacsException, HacsNotModifiedException
+from .utils.http_cache import HacsHttpCache
+from .utils.json import json_loads
 from .utils.logger import LOGGER
 from .utils.validate import (
+    FAST_CHECK_FETCHED_V2_REPO_DATA,
     VALIDATE_FETCHED_V2_CRITICAL_REPO_SCHEMA,
     VALIDATE_FETCHED_V2_REMOVED_REPO_SCHEMA,
     VALIDATE_FETCHED_V2_REPO_DATA,
@@ -25,31 +29,39 @@ CRITICAL_REMOVED_VALIDATORS = {
 class HacsDataClient:
     """HACS Data client."""
 
-    def __init__(self, session: ClientSession, client_name: str) -> None:
+    def __init__(
+        self,
+        session: ClientSession,
+        client_name: str,
+        cache: HacsHttpCache | None = None,
+    ) -> None:
         """Initialize."""
         self._client_name = client_name
-        self._etags = {}
+        self._cache = cache or HacsHttpCache()
         self._session = session
+        self._pending: dict[str, dict[str, str]] = {}
 
     async def _do_request(
         self,
         filename: str,
         section: str | None = None,
-    ) -> dict[str, dict[str, Any]] | list[str]:
-        """Do request."""
+    ) -> bytes:
+        """Do request, and return the body."""
         endpoint = "/".join([v for v in [section, filename] if v is not None])
+        validator = self._cache.data_v2.get(endpoint, {})
         try:
             response = await self._session.get(
                 f"https://data-v2.hacs.xyz/{endpoint}",
                 timeout=ClientTimeout(total=60),
                 headers={
                     "User-Agent": self._client_name,
-                    "If-None-Match": self._etags.get(endpoint, ""),
+                    "If-None-Match": validator.get("etag") or "",
                 },
             )
             if response.status == 304:
                 raise HacsNotModifiedException() from None
             response.raise_for_status()
+            body = await response.read()
         except HacsNotModifiedException:
             raise
         except TimeoutError:
@@ -57,42 +69,111 @@ class HacsDataClient:
         except Exception as exception:
             raise HacsException(f"Error fetching data from HACS: {exception}") from exception
 
-        self._etags[endpoint] = response.headers.get("etag")
+        body_hash = sha256(body).hexdigest()
+        if body_hash == validator.get("hash"):
+            # New ETag, same content
+            self._cache.data_v2[endpoint] = {**validator, "etag": response.headers.get("etag")}
+            raise HacsNotModifiedException()
 
-        return await response.json()
+        # Recorded by confirm once the caller has applied the content
+        self._pending[endpoint] = {"etag": response.headers.get("etag"), "hash": body_hash}
+        return body
 
-    async def get_data(self, section: str | None, *, validate: bool) -> dict[str, dict[str, Any]]:
-        """Get data."""
-        data = await self._do_request(filename="data.json", section=section)
-        if not validate:
-            return data
+    def confirm(
+        self,
+        section: str | None,
+        filename: str = "data.json",
+        repositories: list[str] | None = None,
+    ) -> None:
+        """Record the validator of a fetched body after its content was applied.
+
+        Until then the next fetch of the endpoint is a full one. The IDs in
+        repositories are stored with the validator, and are what a later
+        not modified response for the endpoint stands for.
+        """
+        endpoint = "/".join([v for v in [section, filename] if v is not None])
+        if (validator := self._pending.pop(endpoint, None)) is None:
+            return
+        if repositories is not None:
+            validator["repositories"] = repositories
+        self._cache.data_v2[endpoint] = validator
 
-        if section in VALIDATE_FETCHED_V2_REPO_DATA:
-            validated = {}
-            for key, repo_data in data.items():
-                try:
-                    validated[key] = VALIDATE_FETCHED_V2_REPO_DATA[section](repo_data)
-                except vol.Invalid as exception:
-                    LOGGER.info(
-                        "Got invalid data for %s (%s)", repo_data.get("full_name", key), exception
-                    )
-                    continue
+    def known_repositories(self, section: str, filename: str = "data.json") -> list[str] | None:
+        """Return the repository IDs stored with the validator of an endpoint."""
+        return self._cache.data_v2.get(f"{section}/{filename}", {}).get("repositories")
 
-            return validated
+    def forget(self, section: str, filename: str = "data.json") -> None:
+        """Drop the validator of an endpoint, the next fetch of it is a full one."""
+        self._cache.data_v2.pop(f"{section}/{filename}", None)
 
-        if not (validator := CRITICAL_REMOVED_VALIDATORS.get(section)):
-            raise ValueError(f"Do not know how to validate {section}")
+    async def get_data(
+        self,
+        section: str | None,
+        *,
+        validate: bool,
+        last_fetched: dict[str, float] | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Get data.
+
+        Decoding and validation run in the executor. Repository entries whose
+        last_fetched is not newer than in last_fetched are known already,
+        and are passed on without validation.
+        """
+        body = await self._do_request(filename="data.json", section=section)
+        return await asyncio.get_running_loop().run_in_executor(
+            None, _decode_and_validate, body, section, validate, last_fetched or {}
+        )
 
-        validated = []
-        for repo_data in data:
+    async def get_repositories(self, section: str) -> list[str]:
+        """Get repositories."""
+        body = await self._do_request(filename="repositories.json", section=section)
+        return await asyncio.get_running_loop().run_in_executor(None, json_loads, body)
+
+
+def _decode_and_validate(
+    body: bytes,
+    section: str | None,
+    validate: bool,
+    last_fetched: dict[str, float],
+) -> dict[str, dict[str, Any]] | list[dict[str, Any]]:
+    """Decode and validate a data.json body."""
+    data = json_loads(body)
+    if not validate:
+        return data
+
+    if section in VALIDATE_FETCHED_V2_REPO_DATA:
+        fast_check = FAST_CHECK_FETCHED_V2_REPO_DATA[section]
+        validator = VALIDATE_FETCHED_V2_REPO_DATA[section]
+        validated = {}
+        for key, repo_data in data.items():
+            if (
+                (stored := last_fetched.get(key)) is not None
+                and isinstance(repo_data, dict)
+                and isinstance(fetched := repo_data.get("last_fetched"), (int, float))
+                and fetched <= stored
+                and isinstance(repo_data.get("full_name"), str)
+            ) or fast_check(repo_data):
+                validated[key] = repo_data
+                continue
             try:
-                validated.append(validator(repo_data))
+                validated[key] = validator(repo_data)
             except vol.Invalid as exception:
-                LOGGER.info("Got invalid data for %s (%s)", section, exception)
+                LOGGER.info(
+                    "Got invalid data for %s (%s)", repo_data.get("full_name", key), exception
+                )
                 continue
 
         return validated
 
-    async def get_repositories(self, section: str) -> list[str]:
-        """Get repositories."""
-        return await self._do_request(filename="repositories.json", section=section)
+    if not (validator := CRITICAL_REMOVED_VALIDATORS.get(section)):
+        raise ValueError(f"Do not know how to validate {section}")
+
+    validated = []
+    for repo_data in data:
+        try:
+            validated.append(validator(repo_data))
+        except vol.Invalid as exception:
+            LOGGER.info("Got invalid data for %s (%s)", section, exception)
+            continue
+
+    return validated
@@ -11,6 +11,7 @@ from homeassistant.core import HomeAssistant
 
 from .base import HacsBase
 from .const import DOMAIN
+from .utils.concurrency import concurrency_metrics
 
 
 async def async_get_config_entry_diagnostics(
@@ -34,6 +35,10 @@ async def async_get_config_entry_diagnostics(
             "ignored_repositories": hacs.common.ignored_repositories,
             "lovelace_mode": hacs.core.lovelace_mode,
             "configuration": {},
+            "queue": hacs.queue.metrics,
+            "concurrency": concurrency_metrics(),
+            "telemetry": hacs.telemetry.metrics,
+            "scheduler": hacs.scheduler.metrics,
         },
         "custom_repositories": [
             repo.data.full_name
@@ -1,7 +1,7 @@
 """Helper constants."""
 
 # pylint: disable=missing-class-docstring
-from enum import StrEnum
+from enum import IntEnum, StrEnum
 
 
 class HacsGitHubRepo(StrEnum):
@@ -25,6 +25,21 @@ class HacsCategory(StrEnum):
         return str(self.value)
 
 
+class HacsConcurrencyResource(StrEnum):
+    """HacsConcurrencyResource."""
+
+    DOWNLOAD = "download"
+    FILESYSTEM = "filesystem"
+    GITHUB = "github"
+
+
+class HacsQueuePriority(IntEnum):
+    """HacsQueuePriority, lower values are executed first."""
+
+    USER = 0
+    BACKGROUND = 1
+
+
 class HacsDispatchEvent(StrEnum):
     """HacsDispatchEvent."""
 
@@ -3,14 +3,18 @@
 from __future__ import annotations
 
 import os
+import pathlib
 from typing import TYPE_CHECKING
 
+from aiohttp import web
 from homeassistant.components.frontend import (
     add_extra_js_url,
     async_register_built_in_panel,
 )
+from homeassistant.components.http import HomeAssistantView
 
 from .const import DOMAIN, URL_BASE
+from .enums import HacsCategory
 from .hacs_frontend import VERSION as FE_VERSION, locate_dir
 from .utils.workarounds import async_register_static_path
 
@@ -19,6 +23,65 @@ if TYPE_CHECKING:
 
     from .base import HacsBase
 
+# Plugin files requested with their current hacstag are never revalidated
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class HacsFilesView(HomeAssistantView):
+    """Serve the files of plugins downloaded with HACS.
+
+    Precompressed .br and .gz variants are served to clients that accept them.
+    Only requests with the current hacstag of the plugin are cached for good.
+    Other requests, like resources added by hand in YAML mode with a fixed or
+    no hacstag, are revalidated with the ETag instead.
+    """
+
+    requires_auth = False
+    url = f"{URL_BASE}/{{requested_file:.+}}"
+    name = "hacs:files"
+
+    def __init__(self, hacs: HacsBase, directory: str) -> None:
+        """Initialize."""
+        self.hacs = hacs
+        self.hass = hacs.hass
+        self.directory = directory
+
+    def _is_current_hacstag(self, requested_file: str, hacstag: str | None) -> bool:
+        """Return True if the hacstag is the current one of the plugin the file belongs to."""
+        if not hacstag:
+            return False
+        folder = requested_file.split("/", 1)[0]
+        return any(
+            repository.data.category == HacsCategory.PLUGIN
+            and repository.data.full_name.split("/")[-1] == folder
+            and repository.generate_dashboard_resource_hacstag() == hacstag
+            for repository in self.hacs.repositories.iter_downloaded()
+        )
+
+    def _resolve(self, requested_file: str) -> pathlib.Path | None:
+        """Return the path of a file inside the directory."""
+        directory = pathlib.Path(self.directory).resolve()
+        path = (directory / requested_file).resolve()
+        if not path.is_relative_to(directory) or not path.is_file():
+            return None
+        return path
+
+    async def get(self, request: web.Request, requested_file: str) -> web.FileResponse:
+        """Return a file."""
+        if (path := await self.hass.async_add_executor_job(self._resolve, requested_file)) is None:
+            raise web.HTTPNotFound
+
+        return web.FileResponse(
+            path,
+            headers={
+                "Cache-Control": (
+                    IMMUTABLE_CACHE_CONTROL
+                    if self._is_current_hacstag(requested_file, request.query.get("hacstag"))
+                    else "no-cache"
+                )
+            },
+        )
+
 
 async def async_register_frontend(hass: HomeAssistant, hacs: HacsBase) -> None:
     """Register the frontend."""
@@ -59,7 +59,7 @@ class HacsAppdaemonRepository(HacsRepository):
                     self.logger.error("%s %s", self.string, error)
         return self.validate.success
 
-    @concurrent(concurrenttasks=10, backoff_time=5)
+    @concurrent()
     async def update_repository(self, ignore_issues=False, force=False):
         """Update."""
         if not await self.common_update(ignore_issues, force) and not force:
@@ -3,25 +3,28 @@
 from __future__ import annotations
 
 from asyncio import sleep
+from collections.abc import Callable
 from datetime import UTC, datetime
-import os
+from io import BytesIO
 import pathlib
-import shutil
-import tempfile
 from typing import TYPE_CHECKING, Any
 import zipfile
 
 from aiogithubapi import (
     AIOGitHubAPIException,
     AIOGitHubAPINotModifiedException,
+    GitHubNotFoundException,
     GitHubReleaseModel,
 )
-from aiogithubapi.objects.repository import AIOGitHubAPIRepository
+from aiogithubapi.objects.repository import (
+    AIOGitHubAPIRepository,
+    AIOGitHubAPIRepositoryTreeContent,
+)
 import attr
 from homeassistant.helpers import device_registry as dr, issue_registry as ir
 
 from ..const import DOMAIN
-from ..enums import HacsDispatchEvent, RepositoryFile
+from ..enums import HacsConcurrencyResource, HacsDispatchEvent, RepositoryFile
 from ..exceptions import (
     HacsException,
     HacsNotModifiedException,
@@ -29,8 +32,9 @@ from ..exceptions import (
     HacsRepositoryExistException,
 )
 from ..types import DownloadableContent
-from ..utils.backup import Backup
+from ..utils.backup import Backup, backup_root
 from ..utils.decode import decode_content
+from ..utils.concurrency import user_initiated
 from ..utils.decorator import concurrent
 from ..utils.file_system import async_exists, async_remove, async_remove_directory
 from ..utils.filters import filter_content_return_one_of_type
@@ -40,6 +44,7 @@ from ..utils.logger import LOGGER
 from ..utils.path import is_safe
 from ..utils.queue_manager import QueueManager
 from ..utils.store import async_remove_store
+from ..utils.tree import RepositoryTreeIndex
 from ..utils.url import github_archive, github_release_asset
 from ..utils.validate import Validate
 from ..utils.version import (
@@ -136,6 +141,13 @@ class FileInformation:
         self.name = name
 
 
+# Data attributes HacsRepositories keeps secondary indexes for
+INDEXED_DATA_ATTRIBUTES = ("installed", "new")
+
+# Repository attributes that are listed next to the repository data
+LISTED_REPOSITORY_ATTRIBUTES = ("pending_restart", "repository_manifest", "state")
+
+
 @attr.s(auto_attribs=True)
 class RepositoryData:
     """RepositoryData class."""
@@ -144,6 +156,7 @@ class RepositoryData:
     authors: list[str] = []
     category: str = ""
     config_flow: bool = False
+    content_hash: str = None
     default_branch: str = None
     description: str = ""
     domain: str = None
@@ -174,6 +187,17 @@ class RepositoryData:
     stargazers_count: int = 0
     topics: list[str] = []
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, and let HacsRepositories follow the change."""
+        old = self.__dict__.get(name)
+        object.__setattr__(self, name, value)
+        if (
+            old != value
+            and name != "change_listener"
+            and (listener := self.__dict__.get("change_listener")) is not None
+        ):
+            listener(name)
+
     @property
     def name(self):
         """Return the name."""
@@ -195,7 +219,7 @@ class RepositoryData:
     def update_data(self, data: dict, action: bool = False) -> None:
         """Update data of the repository."""
         for key, value in data.items():
-            if key not in self.__dict__:
+            if key not in self.__dict__ or key == "change_listener":
                 continue
 
             if key == "last_fetched" and isinstance(value, float):
@@ -296,9 +320,234 @@ class RepositoryContent:
     single = False
 
 
+NOT_DOWNLOADED_CONTENT = RepositoryContent()
+NOT_DOWNLOADED_CONTENT.path = RepositoryPath()
+
+MANIFEST_DEFAULTS = {
+    key: value for key, value in HacsManifest().to_dict().items() if key != "manifest"
+}
+
+
+class RepositoryStub:
+    """Catalogue record for a repository that is not downloaded.
+
+    This holds only what is needed to list and store the repository, and
+    acts as both its own `data` and `repository_manifest`, so it can be
+    used where a not downloaded HacsRepository is expected.
+    HacsRepositories.promote replaces it with a full HacsRepository
+    when it is needed for install, update or the detail view.
+    """
+
+    __slots__ = (
+        "authors",
+        "category",
+        "description",
+        "domain",
+        "downloads",
+        "etag_releases",
+        "etag_repository",
+        "full_name_lower",
+        "full_name",
+        "hacs",
+        "id",
+        "change_listener",
+        "last_commit",
+        "last_fetched",
+        "last_updated",
+        "last_version",
+        "manifest_name",
+        "manifest",
+        "new",
+        "open_issues",
+        "prerelease",
+        "releases",
+        "stargazers_count",
+        "topics",
+    )
+
+    # Static values for attributes a not downloaded repository does not use
+    config_flow = False
+    content = NOT_DOWNLOADED_CONTENT
+    file_name = ""
+    hide = False
+    installed = False
+    installed_commit = None
+    installed_version = None
+    logger = LOGGER
+    pending_restart = False
+    pending_update = False
+    selected_tag = None
+    show_beta = False
+    state = None
+
+    def __init__(self, hacs: HacsBase, full_name: str, category: str) -> None:
+        """Initialize."""
+        self.change_listener: Callable[[str], None] | None = None
+        self.hacs = hacs
+        self.authors: list[str] = []
+        self.category = category
+        self.description = ""
+        self.domain: str | None = None
+        self.downloads = 0
+        self.etag_releases: str | None = None
+        self.etag_repository: str | None = None
+        self.full_name = full_name
+        self.full_name_lower = full_name.lower()
+        self.id = 0
+        self.last_commit: str | None = None
+        self.last_fetched: datetime | None = None
+        self.last_updated = 0
+        self.last_version: str | None = None
+        self.manifest_name: str | None = None
+        self.manifest: dict[str, Any] = {}
+        self.new = True
+        self.open_issues = 0
+        self.prerelease: str | None = None
+        self.releases = False
+        self.stargazers_count = 0
+        self.topics: list[str] = []
+
+    def __str__(self) -> str:
+        """Return a string representation of the repository."""
+        return self.string
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, and let HacsRepositories follow the change."""
+        old = getattr(self, name, None)
+        object.__setattr__(self, name, value)
+        if (
+            old != value
+            and name != "change_listener"
+            and (listener := self.change_listener) is not None
+        ):
+            listener(name)
+
+    @property
+    def data(self) -> RepositoryStub:
+        """Return the repository data."""
+        return self
+
+    @property
+    def repository_manifest(self) -> RepositoryStub:
+        """Return the repository manifest."""
+        return self
+
+    @property
+    def country(self) -> list[str]:
+        """Return the countries from the manifest."""
+        country = self.manifest.get("country") or []
+        return [country] if isinstance(country, str) else country
+
+    @property
+    def homeassistant(self) -> str | None:
+        """Return the minimum Home Assistant version from the manifest."""
+        return self.manifest.get("homeassistant")
+
+    @property
+    def name(self) -> str | None:
+        """Return the name from the manifest."""
+        return self.manifest.get("name")
+
+    @property
+    def string(self) -> str:
+        """Return a string representation of the repository."""
+        return f"<{self.category.title()} {self.full_name}>"
+
+    @property
+    def display_name(self) -> str:
+        """Return display name."""
+        if self.name is not None:
+            return self.name
+        if self.category == "integration" and self.manifest_name is not None:
+            return self.manifest_name
+        return self.full_name.split("/")[-1].replace("-", " ").replace("_", " ").title()
+
+    @property
+    def ignored_by_country_configuration(self) -> bool:
+        """Return True if hidden by country."""
+        configuration = self.hacs.configuration.country.lower()
+        if configuration == "all" or not (country := self.country):
+            return False
+        return configuration not in [entry.lower() for entry in country]
+
+    @property
+    def display_status(self) -> str:
+        """Return display_status."""
+        return "new" if self.new else "default"
+
+    @property
+    def display_installed_version(self) -> str:
+        """Return display_installed_version."""
+        return ""
+
+    @property
+    def display_available_version(self) -> str:
+        """Return display_available_version."""
+        return str(self.last_version or self.last_commit or "")
+
+    @property
+    def can_download(self) -> bool:
+        """Return True if we can download."""
+        if self.homeassistant is not None and self.releases:
+            return version_left_higher_or_equal_then_right(
+                self.hacs.core.ha_version.string,
+                self.homeassistant,
+            )
+        return True
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the data to seed a full repository with."""
+        return {
+            key: getattr(self, key)
+            for key in self.__slots__
+            if key not in ("hacs", "change_listener", "manifest")
+        }
+
+    def update_data(self, data: dict, action: bool = False) -> None:
+        """Update data or manifest values of the repository."""
+        manifest = None
+        for key, value in data.items():
+            if key in MANIFEST_DEFAULTS:
+                if manifest is None:
+                    manifest = dict(self.manifest)
+                if value == MANIFEST_DEFAULTS[key]:
+                    manifest.pop(key, None)
+                else:
+                    manifest[key] = value
+            elif key in ("hacs", "change_listener", "manifest") or key not in self.__slots__:
+                continue
+            elif key == "last_fetched" and isinstance(value, float):
+                self.last_fetched = datetime.fromtimestamp(value, UTC)
+            elif key == "id":
+                self.id = str(value)
+            elif key == "topics" and not action:
+                self.topics = [topic for topic in value if topic not in TOPIC_FILTER]
+            else:
+                setattr(self, key, value)
+
+        if manifest is not None:
+            self.manifest = manifest
+
+    def remove(self) -> None:
+        """Run remove tasks."""
+        if self.hacs.repositories.is_registered(repository_id=str(self.id)):
+            self.logger.info("%s Starting removal", self.string)
+            self.hacs.repositories.unregister(self)
+
+
 class HacsRepository:
     """HacsRepository."""
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, and let HacsRepositories follow changes to listed ones."""
+        object.__setattr__(self, name, value)
+        if (
+            name in LISTED_REPOSITORY_ATTRIBUTES
+            and (data := self.__dict__.get("data")) is not None
+            and (listener := data.__dict__.get("change_listener")) is not None
+        ):
+            listener(name)
+
     def __init__(self, hacs: HacsBase) -> None:
         """Set up HacsRepository."""
         self.hacs = hacs
@@ -316,7 +565,6 @@ class HacsRepository:
         self.releases = RepositoryReleases()
         self.pending_restart = False
         self.tree = []
-        self.treefiles = []
         self.ref = None
         self.logger = LOGGER
 
@@ -329,6 +577,17 @@ class HacsRepository:
         """Return a string representation of the repository."""
         return f"<{self.data.category.title()} {self.data.full_name}>"
 
+    @property
+    def tree(self) -> list[Any]:
+        """Return the repository tree."""
+        return self._tree
+
+    @tree.setter
+    def tree(self, tree: list[Any]) -> None:
+        """Set the repository tree, and index it."""
+        self._tree = tree
+        self.tree_index = RepositoryTreeIndex(tree or [])
+
     @property
     def display_name(self) -> str:
         """Return display name."""
@@ -464,7 +723,7 @@ class HacsRepository:
     async def validate_repository(self) -> None:
         """Validate."""
 
-    @concurrent(concurrenttasks=10, backoff_time=5)
+    @concurrent()
     async def update_repository(self, ignore_issues=False, force=False) -> None:
         """Update the repository"""
 
@@ -477,7 +736,7 @@ class HacsRepository:
         await self.common_update_data(ignore_issues=ignore_issues)
 
         # Get the content of hacs.json
-        if RepositoryFile.HACS_JSON in [x.filename for x in self.tree]:
+        if self.tree_index.has_filename(RepositoryFile.HACS_JSON):
             if manifest := await self.async_get_hacs_json():
                 self.repository_manifest = HacsManifest.from_dict(manifest)
                 self.data.update_data(
@@ -506,7 +765,7 @@ class HacsRepository:
             self.data.last_updated = self.repository_object.attributes.get("pushed_at", 0)
             self.data.last_fetched = datetime.now(UTC)
 
-    @concurrent(concurrenttasks=10, backoff_time=5)
+    @concurrent()
     async def common_update(self, ignore_issues=False, force=False, skip_releases=False) -> bool:
         """Common information update steps of the repository."""
         self.logger.debug("%s Getting repository information", self.string)
@@ -540,7 +799,7 @@ class HacsRepository:
             self.data.last_commit = self.repository_object.last_commit
 
         # Get the content of hacs.json
-        if RepositoryFile.HACS_JSON in [x.filename for x in self.tree]:
+        if self.tree_index.has_filename(RepositoryFile.HACS_JSON):
             if manifest := await self.async_get_hacs_json():
                 self.repository_manifest = HacsManifest.from_dict(manifest)
                 self.data.update_data(
@@ -591,29 +850,12 @@ class HacsRepository:
                 validate.errors.append(f"Failed to download {content['url']}")
                 return
 
-            temp_dir = await self.hacs.hass.async_add_executor_job(tempfile.mkdtemp)
-            temp_file = f"{temp_dir}/{self.repository_manifest.filename}"
-
-            result = await self.hacs.async_save_file(temp_file, filecontent)
-
             def _extract_zip_file():
-                with zipfile.ZipFile(temp_file, "r") as zip_file:
+                with zipfile.ZipFile(BytesIO(filecontent), "r") as zip_file:
                     zip_file.extractall(self.content.path.local)
 
             await self.hacs.hass.async_add_executor_job(_extract_zip_file)
-
-            def cleanup_temp_dir():
-                """Cleanup temp_dir."""
-                if os.path.exists(temp_dir):
-                    self.logger.debug("%s Cleaning up %s", self.string, temp_dir)
-                    shutil.rmtree(temp_dir)
-
-            if result:
-                self.logger.info("%s Download of %s completed", self.string, content["name"])
-                await self.hacs.hass.async_add_executor_job(cleanup_temp_dir)
-                return
-
-            validate.errors.append(f"[{content['name']}] was not downloaded")
+            self.logger.info("%s Download of %s completed", self.string, content["name"])
         # lgtm [py/catch-base-exception] pylint: disable=broad-except
         except BaseException:
             validate.errors.append("Download was not completed")
@@ -676,14 +918,8 @@ class HacsRepository:
         if filecontent is None:
             raise HacsException(f"[{self}] Failed to download zipball")
 
-        temp_dir = await self.hacs.hass.async_add_executor_job(tempfile.mkdtemp)
-        temp_file = f"{temp_dir}/{self.repository_manifest.filename}"
-        result = await self.hacs.async_save_file(temp_file, filecontent)
-        if not result:
-            raise HacsException("Could not save ZIP file")
-
         def _extract_zip_file():
-            with zipfile.ZipFile(temp_file, "r") as zip_file:
+            with zipfile.ZipFile(BytesIO(filecontent), "r") as zip_file:
                 extractable = []
                 for path in zip_file.filelist:
                     filename = "/".join(path.filename.split("/")[1:])
@@ -702,25 +938,19 @@ class HacsRepository:
                 zip_file.extractall(self.content.path.local, extractable)
 
         await self.hacs.hass.async_add_executor_job(_extract_zip_file)
-
-        def cleanup_temp_dir():
-            """Cleanup temp_dir."""
-            if os.path.exists(temp_dir):
-                self.logger.debug("%s Cleaning up %s", self.string, temp_dir)
-                shutil.rmtree(temp_dir)
-
-        await self.hacs.hass.async_add_executor_job(cleanup_temp_dir)
         self.logger.info("%s Content was extracted to %s", self.string, self.content.path.local)
 
     async def async_get_hacs_json(self, ref: str = None) -> dict[str, Any] | None:
         """Get the content of the hacs.json file."""
+        ref = ref or self.version_to_download()
         try:
             response = await self.hacs.async_github_api_method(
                 method=self.hacs.githubapi.repos.contents.get,
                 raise_exception=False,
+                cache_key=f"contents/{self.data.full_name}/{ref}/{RepositoryFile.HACS_JSON}",
                 repository=self.data.full_name,
                 path=RepositoryFile.HACS_JSON,
-                **{"params": {"ref": ref or self.version_to_download()}},
+                **{"params": {"ref": ref}},
             )
             if response:
                 return json_loads(decode_content(response.data.content))
@@ -742,7 +972,7 @@ class HacsRepository:
                 name,
             )
 
-        info_files = [filename for filename in _info_file_variants() if filename in self.treefiles]
+        info_files = [filename for filename in _info_file_variants() if filename in self.tree_index]
 
         if not info_files:
             return ""
@@ -754,6 +984,7 @@ class HacsRepository:
         if self.hacs.repositories.is_registered(repository_id=str(self.data.id)):
             self.logger.info("%s Starting removal", self.string)
             self.hacs.repositories.unregister(self)
+        self.hacs.release_notes.remove(self.data.id)
 
     async def uninstall(self) -> None:
         """Run uninstall tasks."""
@@ -763,6 +994,7 @@ class HacsRepository:
         self.data.installed = False
         await self._async_post_uninstall()
         await async_remove_store(self.hacs.hass, f"hacs/{self.data.id}.hacs")
+        self.hacs.release_notes.remove(self.data.id)
 
         self.data.installed_version = None
         self.data.installed_commit = None
@@ -836,7 +1068,7 @@ class HacsRepository:
     async def async_pre_registration(self) -> None:
         """Run pre registration steps."""
 
-    @concurrent(concurrenttasks=10)
+    @concurrent()
     async def async_registration(self, ref=None) -> None:
         """Run registration steps."""
         await self.async_pre_registration()
@@ -878,19 +1110,19 @@ class HacsRepository:
         await self._async_pre_install()
         self.hacs.async_dispatch(
             HacsDispatchEvent.REPOSITORY_DOWNLOAD_PROGRESS,
-            {"repository": self.data.full_name, "progress": 30},
+            {"repository": self.data.full_name, "repository_id": self.data.id, "progress": 30},
         )
         self.logger.info("%s Running installation steps", self.string)
         await self.async_install_repository(version=version)
         self.hacs.async_dispatch(
             HacsDispatchEvent.REPOSITORY_DOWNLOAD_PROGRESS,
-            {"repository": self.data.full_name, "progress": 90},
+            {"repository": self.data.full_name, "repository_id": self.data.id, "progress": 90},
         )
         self.logger.info("%s Installation steps completed", self.string)
         await self._async_post_install()
         self.hacs.async_dispatch(
             HacsDispatchEvent.REPOSITORY_DOWNLOAD_PROGRESS,
-            {"repository": self.data.full_name, "progress": False},
+            {"repository": self.data.full_name, "repository_id": self.data.id, "progress": False},
         )
 
     async def async_post_installation(self) -> None:
@@ -935,7 +1167,7 @@ class HacsRepository:
 
         self.hacs.async_dispatch(
             HacsDispatchEvent.REPOSITORY_DOWNLOAD_PROGRESS,
-            {"repository": self.data.full_name, "progress": 40},
+            {"repository": self.data.full_name, "repository_id": self.data.id, "progress": 40},
         )
 
         if self.repository_manifest.persistent_directory:
@@ -947,7 +1179,7 @@ class HacsRepository:
                     hacs=self.hacs,
                     local_path=f"{
                         self.content.path.local}/{self.repository_manifest.persistent_directory}",
-                    backup_path=tempfile.gettempdir() + "/hacs_persistent_directory/",
+                    backup_path=f"{backup_root(self.hacs)}/persistent_directory/",
                 )
                 await self.hacs.hass.async_add_executor_job(persistent_directory.create)
 
@@ -961,7 +1193,7 @@ class HacsRepository:
 
         self.hacs.async_dispatch(
             HacsDispatchEvent.REPOSITORY_DOWNLOAD_PROGRESS,
-            {"repository": self.data.full_name, "progress": 50},
+            {"repository": self.data.full_name, "repository_id": self.data.id, "progress": 50},
         )
 
         if self.repository_manifest.zip_release and self.repository_manifest.filename:
@@ -971,7 +1203,7 @@ class HacsRepository:
 
         self.hacs.async_dispatch(
             HacsDispatchEvent.REPOSITORY_DOWNLOAD_PROGRESS,
-            {"repository": self.data.full_name, "progress": 70},
+            {"repository": self.data.full_name, "repository_id": self.data.id, "progress": 70},
         )
 
         if self.validate.errors:
@@ -984,7 +1216,7 @@ class HacsRepository:
 
         self.hacs.async_dispatch(
             HacsDispatchEvent.REPOSITORY_DOWNLOAD_PROGRESS,
-            {"repository": self.data.full_name, "progress": 80},
+            {"repository": self.data.full_name, "repository_id": self.data.id, "progress": 80},
         )
 
         if self.data.installed and not self.content.single:
@@ -1009,6 +1241,7 @@ class HacsRepository:
     ) -> tuple[AIOGitHubAPIRepository, Any | None]:
         """Return a repository object."""
         try:
+            self.hacs.telemetry.github_call("AIOGitHubAPI.get_repo")
             repository = await self.hacs.github.get_repo(self.data.full_name, etag)
             return repository, self.hacs.github.client.last_response.etag
         except AIOGitHubAPINotModifiedException as exception:
@@ -1019,21 +1252,35 @@ class HacsRepository:
     def update_filenames(self) -> None:
         """Get the filename to target."""
 
-    async def get_tree(self, ref: str):
-        """Return the repository tree."""
-        if self.repository_object is None:
-            raise HacsException("No repository_object")
+    async def get_tree(self, ref: str) -> list[AIOGitHubAPIRepositoryTreeContent]:
+        """Return the repository tree, replayed from the cache if it did not change."""
         try:
-            tree = await self.repository_object.get_tree(ref)
-            return tree
-        except (ValueError, AIOGitHubAPIException) as exception:
-            raise HacsException(exception) from exception
+            response = await self.hacs.async_github_api_method(
+                method=self.hacs.githubapi.repos.git.get_tree,
+                repository=self.data.full_name,
+                tree_sha=ref,
+                params={"recursive": "1"},
+                cache_key=f"tree/{self.data.full_name}/{ref}",
+            )
+        except HacsException as exception:
+            if exception.args and isinstance(exception.args[0], GitHubNotFoundException):
+                raise HacsException(
+                    f"GitHub returned 404 for the tree of {self.data.full_name} at {ref}"
+                ) from exception
+            raise
+        return [
+            AIOGitHubAPIRepositoryTreeContent(
+                {"path": entry.path, "type": entry.type}, self.data.full_name, ref
+            )
+            for entry in response.data.tree or []
+        ]
 
     async def get_releases(self, prerelease=False, returnlimit=5) -> list[GitHubReleaseModel]:
         """Return the repository releases."""
         response = await self.hacs.async_github_api_method(
             method=self.hacs.githubapi.repos.releases.list,
             repository=self.data.full_name,
+            cache_key=f"releases/{self.data.full_name}",
         )
         releases = []
         for release in response.data or []:
@@ -1122,6 +1369,7 @@ class HacsRepository:
                     ]
                     self.releases.objects = filtered_releases
                     self.data.published_tags = [x.tag_name for x in filtered_releases]
+                    self.hacs.release_notes.render(self)
 
             except HacsException:
                 self.data.releases = False
@@ -1146,9 +1394,6 @@ class HacsRepository:
             self.tree = await self.get_tree(self.ref)
             if not self.tree:
                 raise HacsException("No files in tree")
-            self.treefiles = []
-            for treefile in self.tree:
-                self.treefiles.append(treefile.full_path)
         except (AIOGitHubAPIException, HacsException) as exception:
             if (
                 not retry
@@ -1172,7 +1417,6 @@ class HacsRepository:
     def gather_files_to_download(self) -> list[FileInformation]:
         """Return a list of file objects to be downloaded."""
         files = []
-        tree = self.tree
         ref = f"{self.ref}".replace("tags/", "")
         releaseobjects = self.releases.objects
         category = self.data.category
@@ -1189,25 +1433,21 @@ class HacsRepository:
                 return files
 
         if self.content.single:
-            for treefile in tree:
-                if treefile.filename == self.data.file_name:
-                    files.append(
-                        FileInformation(
-                            treefile.download_url, treefile.full_path, treefile.filename
-                        )
-                    )
+            for treefile in self.tree_index.with_filename(self.data.file_name):
+                files.append(
+                    FileInformation(treefile.download_url, treefile.full_path, treefile.filename)
+                )
             return files
 
         if category == "plugin":
-            for treefile in tree:
-                if treefile.path in ["", "dist"]:
+            # Only the root, and the dist directory when the content is there, can have files
+            directories = ("", "dist") if remotelocation else ("",)
+            for directory in directories:
+                for treefile in self.tree_index.in_directory(directory):
                     if remotelocation == "dist" and not treefile.filename.startswith("dist"):
                         continue
-                    if not remotelocation:
-                        if not treefile.filename.endswith(".js"):
-                            continue
-                        if treefile.path != "":
-                            continue
+                    if not remotelocation and not treefile.filename.endswith(".js"):
+                        continue
                     if not treefile.is_directory:
                         files.append(
                             FileInformation(
@@ -1217,16 +1457,22 @@ class HacsRepository:
             if files:
                 return files
 
-        if self.repository_manifest.content_in_root:
-            if not self.repository_manifest.filename:
-                if category == "theme":
-                    tree = filter_content_return_one_of_type(self.tree, "", "yaml", "full_path")
+        if (
+            self.repository_manifest.content_in_root
+            and not self.repository_manifest.filename
+            and category == "theme"
+        ):
+            tree = filter_content_return_one_of_type(self.tree, "", "yaml", "full_path")
+            paths = (
+                path for path in tree if path.full_path.startswith(self.content.path.remote)
+            )
+        else:
+            paths = self.tree_index.with_prefix(self.content.path.remote)
 
-        for path in tree:
+        for path in paths:
             if path.is_directory:
                 continue
-            if path.full_path.startswith(self.content.path.remote):
-                files.append(FileInformation(path.download_url, path.full_path, path.filename))
+            files.append(FileInformation(path.download_url, path.full_path, path.filename))
         return files
 
     async def release_contents(self, version: str | None = None) -> list[FileInformation] | None:
@@ -1248,18 +1494,12 @@ class HacsRepository:
             for asset in release.data.get("assets", [])
         ]
 
-    @concurrent(concurrenttasks=10)
+    @concurrent(HacsConcurrencyResource.DOWNLOAD)
     async def dowload_repository_content(self, content: FileInformation) -> None:
         """Download content."""
         try:
             self.logger.debug("%s Downloading %s", self.string, content.name)
 
-            filecontent = await self.hacs.async_download_file(content.download_url)
-
-            if filecontent is None:
-                self.validate.errors.append(f"[{content.name}] was not downloaded.")
-                return
-
             # Save the content of the file.
             if self.content.single or content.path is None:
                 local_directory = self.content.path.local
@@ -1279,7 +1519,7 @@ class HacsRepository:
 
             local_file_path = (f"{local_directory}/{content.name}").replace("//", "/")
 
-            result = await self.hacs.async_save_file(local_file_path, filecontent)
+            result = await self.hacs.async_download_to_file(content.download_url, local_file_path)
             if result:
                 self.logger.info("%s Download of %s completed", self.string, content.name)
                 return
@@ -1301,6 +1541,40 @@ class HacsRepository:
 
         device_registry.async_remove_device(device_id=device.id)
 
+    def update_from_status(self, status: dict[str, Any]) -> bool:
+        """Update from a batched GraphQL status, return True if a full update is needed."""
+        last_version = None
+        prerelease = None
+        releases = False
+        for release in (status.get("releases") or {}).get("nodes") or []:
+            if release["isDraft"]:
+                continue
+            releases = True
+            if not release["isPrerelease"]:
+                last_version = release["tagName"]
+                break
+            if prerelease is None:
+                prerelease = release["tagName"]
+
+        branch = status.get("defaultBranchRef") or {}
+        last_commit = ((branch.get("target") or {}).get("oid") or "")[0:7] or None
+
+        self.data.stargazers_count = status.get("stargazerCount", self.data.stargazers_count)
+        self.data.last_updated = status.get("pushedAt") or self.data.last_updated
+
+        if (
+            status.get("isArchived", False) != self.data.archived
+            or branch.get("name") != self.data.default_branch
+            or releases != self.data.releases
+            or (releases and last_version != self.data.last_version)
+            or (releases and prerelease != self.data.prerelease)
+            or (not releases and last_commit != self.data.last_commit)
+        ):
+            return True
+
+        self.data.last_fetched = datetime.now(UTC)
+        return False
+
     def version_to_download(self) -> str:
         """Determine which version to download."""
         if self.data.last_version is not None:
@@ -1409,6 +1683,7 @@ class HacsRepository:
             raise HacsException(f"This version requires HACS {
                 target_manifest.hacs} or newer.")
 
+    @user_initiated
     async def async_download_repository(self, *, ref: str | None = None, **_) -> None:
         """Download the content of a repository."""
         await self._ensure_download_capabilities(ref)
@@ -1416,7 +1691,7 @@ class HacsRepository:
         if self.display_version_or_commit == "version":
             self.hacs.async_dispatch(
                 HacsDispatchEvent.REPOSITORY_DOWNLOAD_PROGRESS,
-                {"repository": self.data.full_name, "progress": 10},
+                {"repository": self.data.full_name, "repository_id": self.data.id, "progress": 10},
             )
             if not ref:
                 await self.update_repository(force=True)
@@ -1426,7 +1701,7 @@ class HacsRepository:
             self.force_branch = ref is not None
             self.hacs.async_dispatch(
                 HacsDispatchEvent.REPOSITORY_DOWNLOAD_PROGRESS,
-                {"repository": self.data.full_name, "progress": 20},
+                {"repository": self.data.full_name, "repository_id": self.data.id, "progress": 20},
             )
 
         try:
@@ -1441,7 +1716,11 @@ class HacsRepository:
             self.force_branch = False
             self.hacs.async_dispatch(
                 HacsDispatchEvent.REPOSITORY_DOWNLOAD_PROGRESS,
-                {"repository": self.data.full_name, "progress": False},
+                {
+                    "repository": self.data.full_name,
+                    "repository_id": self.data.id,
+                    "progress": False,
+                },
             )
 
     async def async_get_releases(self, *, first: int = 30) -> list[GitHubReleaseModel]:
@@ -77,12 +77,14 @@ class HacsIntegrationRepository(HacsRepository):
             self.content.path.remote = ""
 
         if self.content.path.remote == "custom_components":
-            name = get_first_directory_in_directory(self.tree, "custom_components")
+            name = get_first_directory_in_directory(
+                self.tree_index.with_prefix("custom_components"), "custom_components"
+            )
             if name is None:
                 if (
-                    "repository.json" in self.treefiles
-                    or "repository.yaml" in self.treefiles
-                    or "repository.yml" in self.treefiles
+                    "repository.json" in self.tree_index
+                    or "repository.yaml" in self.tree_index
+                    or "repository.yml" in self.tree_index
                 ):
                     raise AddonRepositoryException()
                 raise HacsException(
@@ -119,7 +121,7 @@ class HacsIntegrationRepository(HacsRepository):
                     self.logger.error("%s %s", self.string, error)
         return self.validate.success
 
-    @concurrent(concurrenttasks=10, backoff_time=5)
+    @concurrent()
     async def update_repository(self, ignore_issues=False, force=False):
         """Update."""
         if not await self.common_update(ignore_issues, force) and not force:
@@ -129,7 +131,9 @@ class HacsIntegrationRepository(HacsRepository):
             self.content.path.remote = ""
 
         if self.content.path.remote == "custom_components":
-            name = get_first_directory_in_directory(self.tree, "custom_components")
+            name = get_first_directory_in_directory(
+                self.tree_index.with_prefix("custom_components"), "custom_components"
+            )
             self.content.path.remote = f"custom_components/{name}"
 
         # Get the content of manifest.json
@@ -180,7 +184,7 @@ class HacsIntegrationRepository(HacsRepository):
             else f"{self.content.path.remote}/{RepositoryFile.MAINIFEST_JSON}"
         )
 
-        if not manifest_path in (x.full_path for x in self.tree):
+        if manifest_path not in self.tree_index:
             raise HacsException(f"No {RepositoryFile.MAINIFEST_JSON} file found '{manifest_path}'")
 
         response = await self.hacs.async_github_api_method(
@@ -200,7 +204,7 @@ class HacsIntegrationRepository(HacsRepository):
             else f"{self.content.path.remote}/{RepositoryFile.MAINIFEST_JSON}"
         )
 
-        if manifest_path not in (x.full_path for x in self.tree):
+        if manifest_path not in self.tree_index:
             raise HacsException(f"No {RepositoryFile.MAINIFEST_JSON} file found '{manifest_path}'")
 
         self.logger.debug("%s Getting manifest.json for version=%s", self.string, version)
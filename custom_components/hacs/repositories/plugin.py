@@ -5,8 +5,10 @@ from __future__ import annotations
 import re
 from typing import TYPE_CHECKING
 
-from ..enums import HacsCategory, HacsDispatchEvent
+from ..enums import HacsCategory, HacsConcurrencyResource, HacsDispatchEvent
 from ..exceptions import HacsException
+from ..utils.assets import build_assets
+from ..utils.concurrency import get_concurrency_controller
 from ..utils.decorator import concurrent
 from ..utils.json import json_loads
 from .base import HacsRepository
@@ -14,8 +16,6 @@ from .base import HacsRepository
 HACSTAG_REPLACER = re.compile(r"\D+")
 
 if TYPE_CHECKING:
-    from homeassistant.components.lovelace.resources import ResourceStorageCollection
-
     from ..base import HacsBase
 
 
@@ -62,13 +62,14 @@ class HacsPluginRepository(HacsRepository):
     async def async_post_installation(self):
         """Run post installation steps."""
         await self.hacs.async_setup_frontend_endpoint_plugin()
+        await self.async_build_assets()
         await self.update_dashboard_resources()
 
     async def async_post_uninstall(self):
         """Run post uninstall steps."""
         await self.remove_dashboard_resources()
 
-    @concurrent(concurrenttasks=10, backoff_time=5)
+    @concurrent()
     async def update_repository(self, ignore_issues=False, force=False):
         """Update."""
         if not await self.common_update(ignore_issues, force) and not force:
@@ -135,7 +136,7 @@ class HacsPluginRepository(HacsRepository):
                         self.content.path.remote = "release"
                         return
 
-        all_paths = {x.full_path for x in self.tree}
+        all_paths = self.tree_index
         for filename in valid_filenames:
             if filename in all_paths:
                 self.data.file_name = filename
@@ -146,14 +147,36 @@ class HacsPluginRepository(HacsRepository):
                 self.content.path.remote = "dist"
                 return
 
+    async def async_build_assets(self) -> None:
+        """Compress and fingerprint the downloaded files."""
+        try:
+            async with get_concurrency_controller(HacsConcurrencyResource.FILESYSTEM).slot():
+                manifest = await self.hacs.hass.async_add_executor_job(
+                    build_assets, self.content.path.local
+                )
+        except OSError as exception:
+            self.data.content_hash = None
+            self.logger.warning("%s Could not prepare the files - %s", self.string, exception)
+            return
+
+        filename = (self.data.file_name or "").split("/")[-1]
+        self.data.content_hash = manifest["files"].get(filename, {}).get("hash")
+
     def generate_dashboard_resource_hacstag(self) -> str:
-        """Get the HACS tag used by dashboard resources."""
+        """Get the HACS tag used by dashboard resources.
+
+        The content hash of the file is added when known, so the tag changes
+        with the content even when the version does not.
+        """
         version = (
             self.display_installed_version
             or self.data.selected_tag
             or self.display_available_version
         )
-        return f"{self.data.id}{HACSTAG_REPLACER.sub('', version)}"
+        hacstag = f"{self.data.id}{HACSTAG_REPLACER.sub('', version)}"
+        if self.data.content_hash:
+            return f"{hacstag}-{self.data.content_hash}"
+        return hacstag
 
     def generate_dashboard_resource_namespace(self) -> str:
         """Get the dashboard resource namespace."""
@@ -170,77 +193,10 @@ class HacsPluginRepository(HacsRepository):
             f"?hacstag={self.generate_dashboard_resource_hacstag()}"
         )
 
-    def _get_resource_handler(self) -> ResourceStorageCollection | None:
-        """Get the resource handler."""
-        resources: ResourceStorageCollection | None
-        if not (hass_data := self.hacs.hass.data):
-            self.logger.error("%s Can not access the hass data", self.string)
-            return
-
-        if (lovelace_data := hass_data.get("lovelace")) is None:
-            self.logger.warning("%s Can not access the lovelace integration data", self.string)
-            return
-
-        if self.hacs.core.ha_version > "2025.1.99":
-            # Changed to 2025.2.0
-            # Changed in https://github.com/home-assistant/core/pull/136313
-            resources = lovelace_data.resources
-        else:
-            resources = lovelace_data.get("resources")
-
-        if resources is None:
-            self.logger.warning("%s Can not access the dashboard resources", self.string)
-            return
-
-        if not hasattr(resources, "store") or resources.store is None:
-            self.logger.info("%s YAML mode detected, can not update resources", self.string)
-            return
-
-        if resources.store.key != "lovelace_resources" or resources.store.version != 1:
-            self.logger.warning("%s Can not use the dashboard resources", self.string)
-            return
-
-        return resources
-
     async def update_dashboard_resources(self) -> None:
-        """Update dashboard resources."""
-        if not (resources := self._get_resource_handler()):
-            return
-
-        if not resources.loaded:
-            await resources.async_load()
-
-        namespace = self.generate_dashboard_resource_namespace()
-        url = self.generate_dashboard_resource_url()
-
-        for entry in resources.async_items():
-            if (entry_url := entry["url"]).startswith(namespace):
-                if entry_url != url:
-                    self.logger.info(
-                        "%s Updating existing dashboard resource from %s to %s",
-                        self.string,
-                        entry_url,
-                        url,
-                    )
-                    await resources.async_update_item(entry["id"], {"url": url})
-                return
-
-        # Nothing was updated, add the resource
-        self.logger.info("%s Adding dashboard resource %s", self.string, url)
-        await resources.async_create_item({"res_type": "module", "url": url})
+        """Schedule the dashboard resource for the plugin to be added or updated."""
+        self.hacs.dashboard_resources.async_schedule_update(self)
 
     async def remove_dashboard_resources(self) -> None:
-        """Remove dashboard resources."""
-        if not (resources := self._get_resource_handler()):
-            return
-
-        if not resources.loaded:
-            await resources.async_load()
-
-        namespace = self.generate_dashboard_resource_namespace()
-
-        for entry in resources.async_items():
-            if entry["url"].startswith(namespace):
-                self.logger.info("%s Removing dashboard resource %s", self.string, entry["url"])
-                await resources.async_delete_item(entry["id"])
-                return
+        """Schedule the dashboard resource for the plugin to be removed."""
+        self.hacs.dashboard_resources.async_schedule_removal(self)
@@ -43,8 +43,8 @@ class HacsPythonScriptRepository(HacsRepository):
             self.content.path.remote = ""
 
         compliant = False
-        for treefile in self.treefiles:
-            if treefile.startswith(f"{self.content.path.remote}") and treefile.endswith(".py"):
+        for treefile in self.tree_index.with_prefix(f"{self.content.path.remote}"):
+            if treefile.full_path.endswith(".py"):
                 compliant = True
                 break
         if not compliant:
@@ -67,7 +67,7 @@ class HacsPythonScriptRepository(HacsRepository):
         if self.hacs.system.action:
             await self.hacs.validation.async_run_repository_checks(self)
 
-    @concurrent(concurrenttasks=10, backoff_time=5)
+    @concurrent()
     async def update_repository(self, ignore_issues=False, force=False):
         """Update."""
         if not await self.common_update(ignore_issues, force) and not force:
@@ -78,8 +78,8 @@ class HacsPythonScriptRepository(HacsRepository):
             self.content.path.remote = ""
 
         compliant = False
-        for treefile in self.treefiles:
-            if treefile.startswith(f"{self.content.path.remote}") and treefile.endswith(".py"):
+        for treefile in self.tree_index.with_prefix(f"{self.content.path.remote}"):
+            if treefile.full_path.endswith(".py"):
                 compliant = True
                 break
         if not compliant:
@@ -104,8 +104,6 @@ class HacsPythonScriptRepository(HacsRepository):
 
     def update_filenames(self) -> None:
         """Get the filename to target."""
-        for treefile in self.tree:
-            if treefile.full_path.startswith(
-                self.content.path.remote
-            ) and treefile.full_path.endswith(".py"):
+        for treefile in self.tree_index.with_prefix(self.content.path.remote):
+            if treefile.full_path.endswith(".py"):
                 self.data.file_name = treefile.filename
@@ -49,7 +49,7 @@ class HacsTemplateRepository(HacsRepository):
             not self.data.file_name
             or "/" in self.data.file_name
             or not self.data.file_name.endswith(".jinja")
-            or self.data.file_name not in self.treefiles
+            or self.data.file_name not in self.tree_index
         ):
             raise HacsException(
                 f"{self.string} Repository structure for {self.ref.replace('tags/','')} is not compliant"
@@ -83,7 +83,7 @@ class HacsTemplateRepository(HacsRepository):
         except HomeAssistantError as exception:
             self.logger.exception("%s %s", self.string, exception)
 
-    @concurrent(concurrenttasks=10, backoff_time=5)
+    @concurrent()
     async def update_repository(self, ignore_issues=False, force=False):
         """Update."""
         if not await self.common_update(ignore_issues, force) and not force:
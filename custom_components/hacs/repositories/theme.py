@@ -44,8 +44,8 @@ class HacsThemeRepository(HacsRepository):
 
         # Custom step 1: Validate content.
         compliant = False
-        for treefile in self.treefiles:
-            if treefile.startswith("themes/") and treefile.endswith(".yaml"):
+        for treefile in self.tree_index.with_prefix("themes/"):
+            if treefile.full_path.endswith(".yaml"):
                 compliant = True
                 break
         if not compliant:
@@ -84,7 +84,7 @@ class HacsThemeRepository(HacsRepository):
         """Run post uninstall steps."""
         await self._reload_frontend_themes()
 
-    @concurrent(concurrenttasks=10, backoff_time=5)
+    @concurrent()
     async def update_repository(self, ignore_issues=False, force=False):
         """Update."""
         if not await self.common_update(ignore_issues, force) and not force:
@@ -112,8 +112,6 @@ class HacsThemeRepository(HacsRepository):
 
     def update_filenames(self) -> None:
         """Get the filename to target."""
-        for treefile in self.tree:
-            if treefile.full_path.startswith(
-                self.content.path.remote
-            ) and treefile.full_path.endswith(".yaml"):
+        for treefile in self.tree_index.with_prefix(self.content.path.remote):
+            if treefile.full_path.endswith(".yaml"):
                 self.data.file_name = treefile.filename
@@ -59,14 +59,8 @@ class HacsRepositoryPreReleaseSwitchEntity(HacsRepositoryEntity, SwitchEntity):
         self.repository.data.show_beta = value
 
         # As this value is directly affecting what data points is in use by other entities
-        # we need to update all entities to reflect the change
-        # Do force an update of the entities we need to clear the last fetched data
-        # since that is used to limit state updates
-        # Once we have signaled the update we can restore the last fetched data
-        _last_fetch = self.repository.data.last_fetched
-        self.repository.data.last_fetched = None
-        self.coordinator.async_update_listeners()
-        self.repository.data.last_fetched = _last_fetch  # Restore last fetched
+        # we need to update the entities of the repository to reflect the change
+        self.coordinator.async_update_repository_listeners((self.repository.data.id,))
 
         # Write the HACS data and update the entity state
         await self.hacs.data.async_write()
@@ -44,8 +44,13 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
         "Stage": hacs.stage,
         "Available Repositories": len(hacs.repositories.list_all),
         "Downloaded Repositories": len(hacs.repositories.list_downloaded),
+        "GitHub API Calls Since Start": hacs.telemetry.github_calls_total,
+        "Downloaded Since Start": f"{hacs.telemetry.downloaded_bytes / 1024 / 1024:.1f} MB",
     }
 
+    if stages := hacs.telemetry.startup_stages:
+        data["Startup Duration"] = f"{sum(stages.values()):.1f} s"
+
     if hacs.system.disabled:
         data["Disabled"] = hacs.system.disabled_reason
 
@@ -15,6 +15,7 @@ from .const import DOMAIN
 from .entity import HacsRepositoryEntity
 from .enums import HacsCategory, HacsDispatchEvent
 from .exceptions import HacsException
+from .utils.dispatch import repository_signal
 
 
 async def async_setup_entry(
@@ -94,30 +95,22 @@ class HacsRepositoryUpdateEntity(HacsRepositoryEntity, UpdateEntity):
         if self.repository.pending_restart:
             return None
 
-        if self.latest_version not in self.repository.data.published_tags:
-            releases = await self.repository.get_releases(
-                prerelease=self.repository.data.show_beta,
-                returnlimit=self.hacs.configuration.release_limit,
-            )
-            if releases:
-                self.repository.data.releases = True
-                self.repository.releases.objects = releases
-                self.repository.data.published_tags = [x.tag_name for x in releases]
-                self.repository.data.last_version = next(iter(self.repository.data.published_tags))
-
-        release_notes = ""
-        # Compile release notes from installed version up to the latest
-        if self.installed_version in self.repository.data.published_tags:
-            for release in self.repository.releases.objects:
-                if release.tag_name == self.installed_version:
-                    break
-                release_notes += f"# {release.tag_name}"
-                if release.tag_name != release.name:
-                    release_notes += f"  - {release.name}"
-                release_notes += f"\n\n{release.body}"
-                release_notes += "\n\n---\n\n"
-        elif any(self.repository.releases.objects):
-            release_notes += self.repository.releases.objects[0].body
+        release_notes = self.hacs.release_notes.get(self.repository)
+        if release_notes is None:
+            if self.latest_version not in self.repository.data.published_tags:
+                releases = await self.repository.get_releases(
+                    prerelease=self.repository.data.show_beta,
+                    returnlimit=self.hacs.configuration.release_limit,
+                )
+                if releases:
+                    self.repository.data.releases = True
+                    self.repository.releases.objects = releases
+                    self.repository.data.published_tags = [x.tag_name for x in releases]
+                    self.repository.data.last_version = next(
+                        iter(self.repository.data.published_tags)
+                    )
+
+            release_notes = self.hacs.release_notes.render(self.repository) or ""
 
         if self.repository.pending_update:
             if self.repository.data.category == HacsCategory.INTEGRATION:
@@ -131,7 +124,7 @@ class HacsRepositoryUpdateEntity(HacsRepositoryEntity, UpdateEntity):
                     " clear the frontend cache after updating.</ha-alert>\n\n"
                 )
 
-        return release_notes.replace("\n#", "\n\n#")
+        return release_notes
 
     async def async_added_to_hass(self) -> None:
         """Register for status events."""
@@ -139,7 +132,9 @@ class HacsRepositoryUpdateEntity(HacsRepositoryEntity, UpdateEntity):
         self.async_on_remove(
             async_dispatcher_connect(
                 self.hass,
-                HacsDispatchEvent.REPOSITORY_DOWNLOAD_PROGRESS,
+                repository_signal(
+                    HacsDispatchEvent.REPOSITORY_DOWNLOAD_PROGRESS, self.repository.data.id
+                ),
                 self._update_download_progress,
             )
         )
@@ -147,8 +142,6 @@ class HacsRepositoryUpdateEntity(HacsRepositoryEntity, UpdateEntity):
     @callback
     def _update_download_progress(self, data: dict) -> None:
         """Update the download progress."""
-        if data["repository"] != self.repository.data.full_name:
-            return
         self._update_in_progress(progress=data["progress"])
 
     @callback
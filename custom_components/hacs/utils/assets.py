@@ -0,0 +1,76 @@
+"""Precompressed and fingerprinted static assets for plugins."""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import os
+from typing import Any
+
+from homeassistant.helpers.json import json_bytes
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+ASSETS_MANIFEST = "hacs_assets.json"
+
+# Files worth serving compressed, other files are only fingerprinted
+COMPRESSIBLE_EXTENSIONS = (".css", ".html", ".js", ".json", ".map", ".mjs", ".svg", ".txt")
+
+# Length of the content hash used as fingerprint
+FINGERPRINT_LENGTH = 12
+
+_SKIPPED_EXTENSIONS = (".br", ".gz", ".hacs-download", ".tmp")
+
+
+def _is_fresh(source: str, variant: str) -> bool:
+    """Return True if a compressed variant is newer than its source."""
+    try:
+        return os.path.getmtime(variant) >= os.path.getmtime(source)
+    except OSError:
+        return False
+
+
+def _write_variant(path: str, content: bytes) -> None:
+    """Write a compressed variant and move it in place."""
+    with open(f"{path}.tmp", "wb") as file_handler:
+        file_handler.write(content)
+    os.replace(f"{path}.tmp", path)
+
+
+def build_assets(directory: str) -> dict[str, Any]:
+    """Compress and fingerprint the files in a plugin directory, and write the manifest.
+
+    Variants that are newer than their source are kept as is.
+    This is blocking and should run in the executor.
+    """
+    files: dict[str, dict[str, Any]] = {}
+    for root, _, filenames in os.walk(directory):
+        for filename in sorted(filenames):
+            if filename == ASSETS_MANIFEST or filename.endswith(_SKIPPED_EXTENSIONS):
+                continue
+            path = os.path.join(root, filename)
+            with open(path, "rb") as file_handler:
+                content = file_handler.read()
+
+            encodings = []
+            if filename.endswith(COMPRESSIBLE_EXTENSIONS):
+                if brotli is not None:
+                    if not _is_fresh(path, f"{path}.br"):
+                        _write_variant(f"{path}.br", brotli.compress(content))
+                    encodings.append("br")
+                if not _is_fresh(path, f"{path}.gz"):
+                    _write_variant(f"{path}.gz", gzip.compress(content, mtime=0))
+                encodings.append("gzip")
+
+            files[os.path.relpath(path, directory).replace(os.sep, "/")] = {
+                "hash": hashlib.sha256(content).hexdigest()[:FINGERPRINT_LENGTH],
+                "size": len(content),
+                "encodings": encodings,
+            }
+
+    manifest = {"files": files}
+    _write_variant(os.path.join(directory, ASSETS_MANIFEST), json_bytes(manifest))
+    return manifest
@@ -2,10 +2,9 @@
 
 from __future__ import annotations
 
+import errno
 import os
 import shutil
-import tempfile
-from time import sleep
 from typing import TYPE_CHECKING
 
 from .path import is_safe
@@ -15,7 +14,51 @@ if TYPE_CHECKING:
     from ..repositories.base import HacsRepository
 
 
-DEFAULT_BACKUP_PATH = f"{tempfile.gettempdir()}/hacs_backup/"
+# Relative to the configuration directory, so backups are on the same filesystem
+# as the content and can be moved in place with a rename
+BACKUP_DIRECTORY = ".hacs_backup"
+
+
+def backup_root(hacs: HacsBase) -> str:
+    """Return the directory backups are kept in."""
+    return f"{hacs.core.config_path}/{BACKUP_DIRECTORY}"
+
+
+def _move(src: str, dst: str) -> None:
+    """Move a file or directory.
+
+    A rename when both paths are on the same filesystem, otherwise the content
+    is copied over before the source is removed.
+    """
+    try:
+        os.replace(src, dst)
+        return
+    except OSError as exception:
+        if exception.errno != errno.EXDEV:
+            raise
+
+    if os.path.isfile(src):
+        shutil.copy2(src, dst)
+        os.remove(src)
+    else:
+        shutil.copytree(src, dst)
+        shutil.rmtree(src)
+
+
+def _remove(path: str) -> None:
+    """Remove a file or directory if it exists."""
+    if os.path.isdir(path) and not os.path.islink(path):
+        shutil.rmtree(path)
+    elif os.path.lexists(path):
+        os.remove(path)
+
+
+def remove_backups(hacs: HacsBase) -> None:
+    """Remove backups left behind by an earlier run.
+
+    This is blocking and should run in the executor.
+    """
+    _remove(backup_root(hacs))
 
 
 class Backup:
@@ -25,18 +68,17 @@ class Backup:
         self,
         hacs: HacsBase,
         local_path: str | None = None,
-        backup_path: str = DEFAULT_BACKUP_PATH,
+        backup_path: str | None = None,
         repository: HacsRepository | None = None,
     ) -> None:
         """Initialize."""
         self.hacs = hacs
         self.repository = repository
         self.local_path = local_path or repository.content.path.local
-        self.backup_path = backup_path
+        self.backup_path = backup_path or f"{backup_root(hacs)}/content/"
         if repository:
             self.backup_path = (
-                tempfile.gettempdir()
-                + f"/hacs_persistent_{repository.data.category}/"
+                f"{backup_root(hacs)}/persistent_{repository.data.category}/"
                 + repository.data.name
             )
         self.backup_path_full = f"{self.backup_path}{self.local_path.split('/')[-1]}"
@@ -47,29 +89,17 @@ class Backup:
             return False
         if not is_safe(self.hacs, self.local_path):
             return False
-        if os.path.exists(self.backup_path):
-            shutil.rmtree(self.backup_path)
-
-            # Wait for the folder to be removed
-            while os.path.exists(self.backup_path):
-                sleep(0.1)
+        _remove(self.backup_path)
         os.makedirs(self.backup_path, exist_ok=True)
         return True
 
     def create(self) -> None:
-        """Create a backup in /tmp"""
+        """Create a backup by moving the content out of the way."""
         if not self._init_backup_dir():
             return
 
         try:
-            if os.path.isfile(self.local_path):
-                shutil.copyfile(self.local_path, self.backup_path_full)
-                os.remove(self.local_path)
-            else:
-                shutil.copytree(self.local_path, self.backup_path_full)
-                shutil.rmtree(self.local_path)
-                while os.path.exists(self.local_path):
-                    sleep(0.1)
+            _move(self.local_path, self.backup_path_full)
             self.hacs.log.debug(
                 "Backup for %s, created in %s",
                 self.local_path,
@@ -85,16 +115,13 @@ class Backup:
         if not os.path.exists(self.backup_path_full):
             return
 
-        if os.path.isfile(self.backup_path_full):
-            if os.path.exists(self.local_path):
-                os.remove(self.local_path)
-            shutil.copyfile(self.backup_path_full, self.local_path)
-        else:
-            if os.path.exists(self.local_path):
-                shutil.rmtree(self.local_path)
-                while os.path.exists(self.local_path):
-                    sleep(0.1)
-            shutil.copytree(self.backup_path_full, self.local_path)
+        if os.path.lexists(self.local_path):
+            # Move what is there aside first, so the restore itself is a single rename
+            discarded = f"{self.backup_path_full}.discarded"
+            _remove(discarded)
+            _move(self.local_path, discarded)
+            _remove(discarded)
+        _move(self.backup_path_full, self.local_path)
         self.hacs.log.debug("Restored %s, from backup %s", self.local_path, self.backup_path_full)
 
     def cleanup(self) -> None:
@@ -102,9 +129,5 @@ class Backup:
         if not os.path.exists(self.backup_path):
             return
 
-        shutil.rmtree(self.backup_path)
-
-        # Wait for the folder to be removed
-        while os.path.exists(self.backup_path):
-            sleep(0.1)
+        _remove(self.backup_path)
         self.hacs.log.debug("Backup dir %s cleared", self.backup_path)
@@ -0,0 +1,216 @@
+"""Adaptive concurrency limits for shared resources."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Callable, Coroutine
+from contextvars import ContextVar, Token
+from functools import wraps
+import time
+from types import TracebackType
+from typing import Any
+
+from aiogithubapi import GitHubRatelimitException
+
+from ..const import CONCURRENCY_LIMITS
+from ..enums import HacsConcurrencyResource, HacsQueuePriority
+
+# Resources held by the current task, nested calls for the same resource pass through
+_HELD_RESOURCES: ContextVar[frozenset[str]] = ContextVar("hacs_held_resources", default=frozenset())
+
+# Priority of the current task when it waits for a slot
+_PRIORITY: ContextVar[HacsQueuePriority] = ContextVar(
+    "hacs_priority", default=HacsQueuePriority.BACKGROUND
+)
+
+# Number of samples before latency is used as a congestion signal
+_LATENCY_WARMUP = 5
+
+
+class ConcurrencyController:
+    """AIMD concurrency limit for a resource.
+
+    The limit grows by one for every limit-worth of fast successful calls,
+    and is halved on errors, rate limits or when a call takes far longer
+    than the observed average. Calls only wait when the limit is reached,
+    free slots go to waiting user calls before background ones.
+    """
+
+    def __init__(self, resource: str, *, initial: int, maximum: int, minimum: int = 1) -> None:
+        """Initialize."""
+        self.resource = resource
+        self.minimum = minimum
+        self.maximum = maximum
+        self.limit = float(initial)
+        self.active = 0
+        self.completed = 0
+        self.throttled_count = 0
+        self.average_latency: float | None = None
+        self._samples = 0
+        self._waiters: dict[HacsQueuePriority, deque[asyncio.Future[None]]] = {
+            priority: deque() for priority in HacsQueuePriority
+        }
+
+    @property
+    def metrics(self) -> dict[str, Any]:
+        """Return controller metrics."""
+        return {
+            "limit": int(self.limit),
+            "active": self.active,
+            "waiting": {
+                priority.name.lower(): len(waiters) for priority, waiters in self._waiters.items()
+            },
+            "completed": self.completed,
+            "throttled": self.throttled_count,
+            "average_latency_seconds": (
+                round(self.average_latency, 3) if self.average_latency is not None else None
+            ),
+        }
+
+    async def acquire(self, priority: HacsQueuePriority = HacsQueuePriority.BACKGROUND) -> None:
+        """Wait for a free slot."""
+        if self.active < int(self.limit) and not any(self._waiters.values()):
+            self.active += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        waiters = self._waiters[priority]
+        waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over, pass it on
+                self.active -= 1
+                self._wake()
+            elif waiter in waiters:
+                waiters.remove(waiter)
+            raise
+
+    def release(self, *, latency: float | None, success: bool = True) -> None:
+        """Release a slot and adjust the limit from the outcome of the call.
+
+        Without a latency (a cancelled call) the limit is left as is.
+        """
+        self.active -= 1
+        if latency is None:
+            self._wake()
+            return
+
+        self.completed += 1
+        if not success:
+            self._decrease()
+        elif (
+            self.average_latency is not None
+            and self._samples >= _LATENCY_WARMUP
+            and latency > self.average_latency * 3
+        ):
+            self._decrease()
+        else:
+            self.limit = min(self.maximum, self.limit + 1 / self.limit)
+
+        if success:
+            self._samples += 1
+            self.average_latency = (
+                latency
+                if self.average_latency is None
+                else self.average_latency * 0.9 + latency * 0.1
+            )
+
+        self._wake()
+
+    def throttled(self) -> None:
+        """Register a rate limit signal from the resource."""
+        self.throttled_count += 1
+        self._decrease()
+
+    def _decrease(self) -> None:
+        """Multiplicative decrease."""
+        self.limit = max(self.minimum, self.limit / 2)
+
+    def _wake(self) -> None:
+        """Hand free slots to waiting calls, in order of priority."""
+        for waiters in self._waiters.values():
+            while waiters and self.active < int(self.limit):
+                waiter = waiters.popleft()
+                if not waiter.done():
+                    self.active += 1
+                    waiter.set_result(None)
+
+    def slot(self) -> ConcurrencySlot:
+        """Return a context manager holding a slot for one call."""
+        return ConcurrencySlot(self)
+
+
+class ConcurrencySlot:
+    """A slot held in a controller for the duration of a call."""
+
+    __slots__ = ("controller", "passthrough", "started", "token")
+
+    def __init__(self, controller: ConcurrencyController) -> None:
+        """Initialize."""
+        self.controller = controller
+        self.passthrough = False
+        self.started = 0.0
+        self.token: Token[frozenset[str]] | None = None
+
+    async def __aenter__(self) -> ConcurrencySlot:
+        """Acquire the slot, passing through if this task already holds one."""
+        held = _HELD_RESOURCES.get()
+        if self.controller.resource in held:
+            self.passthrough = True
+            return self
+        await self.controller.acquire(_PRIORITY.get())
+        self.token = _HELD_RESOURCES.set(held | {self.controller.resource})
+        self.started = time.monotonic()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Release the slot, reporting how the call went."""
+        if self.passthrough:
+            return
+        _HELD_RESOURCES.reset(self.token)
+        if isinstance(exc, GitHubRatelimitException):
+            self.controller.throttled_count += 1
+        if isinstance(exc, asyncio.CancelledError):
+            self.controller.release(latency=None)
+            return
+        self.controller.release(latency=time.monotonic() - self.started, success=exc is None)
+
+
+def user_initiated(func: Callable[..., Coroutine[Any, Any, Any]]) -> Callable:
+    """Run a coroutine function with user priority for the slots it waits for."""
+
+    @wraps(func)
+    async def _wrapper(*args: Any, **kwargs: Any) -> Any:
+        token = _PRIORITY.set(HacsQueuePriority.USER)
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            _PRIORITY.reset(token)
+
+    return _wrapper
+
+
+_CONTROLLERS: dict[str, ConcurrencyController] = {}
+
+
+def get_concurrency_controller(resource: HacsConcurrencyResource) -> ConcurrencyController:
+    """Return the shared controller for a resource."""
+    if (controller := _CONTROLLERS.get(resource)) is None:
+        initial, maximum = CONCURRENCY_LIMITS[resource]
+        controller = _CONTROLLERS[resource] = ConcurrencyController(
+            resource, initial=initial, maximum=maximum
+        )
+    return controller
+
+
+def concurrency_metrics() -> dict[str, dict[str, Any]]:
+    """Return metrics for all controllers in use."""
+    return {resource: controller.metrics for resource, controller in _CONTROLLERS.items()}
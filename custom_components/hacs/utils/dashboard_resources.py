@@ -0,0 +1,147 @@
+"""Batched updates of the dashboard resources for plugins."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
+from homeassistant.helpers.debounce import Debouncer
+
+from ..const import URL_BASE
+from .logger import LOGGER
+
+if TYPE_CHECKING:
+    from homeassistant.components.lovelace.resources import ResourceStorageCollection
+
+    from ..base import HacsBase
+    from ..repositories.plugin import HacsPluginRepository
+
+# Seconds to wait for more changes before the resources are updated
+SYNC_COOLDOWN = 2
+
+
+def resource_namespace(url: str) -> str | None:
+    """Return the HACS namespace of a resource URL, None for other resources."""
+    if not url.startswith(f"{URL_BASE}/"):
+        return None
+    name = url[len(URL_BASE) + 1 :].split("?", 1)[0].split("/", 1)[0]
+    return f"{URL_BASE}/{name}"
+
+
+class DashboardResourceSync:
+    """Collect resource changes for plugins and apply them together.
+
+    Installs and upgrades that happen close together are applied in one pass
+    over the resource collection, which is indexed by namespace once per pass.
+    """
+
+    def __init__(self, hacs: HacsBase) -> None:
+        """Initialize."""
+        self.hacs = hacs
+        self._pending: dict[str, HacsPluginRepository] = {}
+        self._removed: set[str] = set()
+        self._debouncer: Debouncer | None = None
+
+    @callback
+    def async_schedule_update(self, repository: HacsPluginRepository) -> None:
+        """Schedule the resource for a plugin to be added or updated."""
+        namespace = repository.generate_dashboard_resource_namespace()
+        self._removed.discard(namespace)
+        self._pending[namespace] = repository
+        self._async_schedule()
+
+    @callback
+    def async_schedule_removal(self, repository: HacsPluginRepository) -> None:
+        """Schedule the resource for a plugin to be removed."""
+        namespace = repository.generate_dashboard_resource_namespace()
+        self._pending.pop(namespace, None)
+        self._removed.add(namespace)
+        self._async_schedule()
+
+    @callback
+    def _async_schedule(self) -> None:
+        """Schedule a sync after the cooldown."""
+        if self._debouncer is None:
+            self._debouncer = Debouncer(
+                self.hacs.hass,
+                LOGGER,
+                cooldown=SYNC_COOLDOWN,
+                immediate=False,
+                function=self.async_sync,
+            )
+        self._debouncer.async_schedule_call()
+
+    async def async_flush(self) -> None:
+        """Apply pending changes now."""
+        if self._debouncer is not None:
+            self._debouncer.async_cancel()
+        if self._pending or self._removed:
+            await self.async_sync()
+
+    def _get_resource_handler(self) -> ResourceStorageCollection | None:
+        """Get the resource handler."""
+        resources: ResourceStorageCollection | None
+        if not (hass_data := self.hacs.hass.data):
+            LOGGER.error("<DashboardResourceSync> Can not access the hass data")
+            return
+
+        if (lovelace_data := hass_data.get("lovelace")) is None:
+            LOGGER.warning("<DashboardResourceSync> Can not access the lovelace integration data")
+            return
+
+        if self.hacs.core.ha_version > "2025.1.99":
+            # Changed to 2025.2.0
+            # Changed in https://github.com/home-assistant/core/pull/136313
+            resources = lovelace_data.resources
+        else:
+            resources = lovelace_data.get("resources")
+
+        if resources is None:
+            LOGGER.warning("<DashboardResourceSync> Can not access the dashboard resources")
+            return
+
+        if not hasattr(resources, "store") or resources.store is None:
+            LOGGER.info("<DashboardResourceSync> YAML mode detected, can not update resources")
+            return
+
+        if resources.store.key != "lovelace_resources" or resources.store.version != 1:
+            LOGGER.warning("<DashboardResourceSync> Can not use the dashboard resources")
+            return
+
+        return resources
+
+    async def async_sync(self) -> None:
+        """Apply the pending changes to the dashboard resources."""
+        pending, self._pending = self._pending, {}
+        removed, self._removed = self._removed, set()
+        if not pending and not removed:
+            return
+
+        if not (resources := self._get_resource_handler()):
+            return
+
+        if not resources.loaded:
+            await resources.async_load()
+
+        index: dict[str, dict] = {}
+        for entry in resources.async_items():
+            if (namespace := resource_namespace(entry["url"])) is not None:
+                index.setdefault(namespace, entry)
+
+        for namespace in removed:
+            if (entry := index.get(namespace)) is not None:
+                LOGGER.info("<DashboardResourceSync> Removing dashboard resource %s", entry["url"])
+                await resources.async_delete_item(entry["id"])
+
+        for namespace, repository in pending.items():
+            url = repository.generate_dashboard_resource_url()
+            if (entry := index.get(namespace)) is None:
+                LOGGER.info("<DashboardResourceSync> Adding dashboard resource %s", url)
+                await resources.async_create_item({"res_type": "module", "url": url})
+            elif entry["url"] != url:
+                LOGGER.info(
+                    "<DashboardResourceSync> Updating existing dashboard resource from %s to %s",
+                    entry["url"],
+                    url,
+                )
+                await resources.async_update_item(entry["id"], {"url": url})
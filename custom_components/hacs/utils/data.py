@@ -12,9 +12,10 @@ from homeassistant.exceptions import HomeAssistantError
 from ..base import HacsBase
 from ..const import HACS_REPOSITORY_ID
 from ..enums import HacsDisabledReason, HacsDispatchEvent
-from ..repositories.base import TOPIC_FILTER, HacsManifest, HacsRepository
+from ..repositories.base import TOPIC_FILTER, HacsManifest, HacsRepository, RepositoryStub
 from .logger import LOGGER
 from .path import is_safe
+from .release_notes import RELEASE_NOTES_STORE
 from .store import async_load_from_store, async_save_to_store
 
 EXPORTED_BASE_DATA = (
@@ -39,6 +40,7 @@ EXPORTED_REPOSITORY_DATA = EXPORTED_BASE_DATA + (
 EXPORTED_DOWNLOADED_REPOSITORY_DATA = EXPORTED_REPOSITORY_DATA + (
     ("archived", False),
     ("config_flow", False),
+    ("content_hash", None),
     ("default_branch", None),
     ("first_install", False),
     ("installed_commit", None),
@@ -87,13 +89,21 @@ class HacsData:
         )
         await self._async_store_experimental_content_and_repos()
         await self._async_store_content_and_repos()
+        self.hacs.http_cache.async_store_data_v2()
+        await async_save_to_store(
+            self.hacs.hass,
+            RELEASE_NOTES_STORE,
+            self.hacs.release_notes.to_dict(
+                repository.data.id for repository in self.hacs.repositories.iter_downloaded()
+            ),
+        )
 
     async def _async_store_content_and_repos(self, _=None):  # bb: ignore
         """Store the main repos file and each repo that is out of date."""
         # Repositories
         self.content = {}
-        for repository in self.hacs.repositories.list_all:
-            if repository.data.category in self.hacs.common.categories:
+        for category in self.hacs.common.categories:
+            for repository in self.hacs.repositories.iter_category(category):
                 self.async_store_repository_data(repository)
 
         await async_save_to_store(self.hacs.hass, "repositories", self.content)
@@ -104,14 +114,14 @@ class HacsData:
         """Store the main repos file and each repo that is out of date."""
         # Repositories
         self.content = {}
-        for repository in self.hacs.repositories.list_all:
-            if repository.data.category in self.hacs.common.categories:
+        for category in self.hacs.common.categories:
+            for repository in self.hacs.repositories.iter_category(category):
                 self.async_store_experimental_repository_data(repository)
 
         await async_save_to_store(self.hacs.hass, "data", {"repositories": self.content})
 
     @callback
-    def async_store_repository_data(self, repository: HacsRepository) -> dict:
+    def async_store_repository_data(self, repository: HacsRepository | RepositoryStub) -> dict:
         """Store the repository data."""
         data = {"repository_manifest": repository.repository_manifest.manifest}
 
@@ -131,7 +141,9 @@ class HacsData:
         self.content[str(repository.data.id)] = data
 
     @callback
-    def async_store_experimental_repository_data(self, repository: HacsRepository) -> None:
+    def async_store_experimental_repository_data(
+        self, repository: HacsRepository | RepositoryStub
+    ) -> None:
         """Store the experimental repository data for non downloaded repositories."""
         data = {}
         self.content.setdefault(repository.data.category, [])
@@ -180,6 +192,11 @@ class HacsData:
             self.hacs.disable_hacs(HacsDisabledReason.RESTORE)
             return False
 
+        try:
+            await self.hacs.http_cache.async_restore(self.hacs.hass)
+        except HomeAssistantError:
+            pass
+
         if not hacs and not repositories:
             # Assume new install
             self.hacs.status.new = True
@@ -221,6 +238,10 @@ class HacsData:
                     continue
                 self.async_restore_repository(entry, repo_data)
 
+            self.hacs.release_notes.restore(
+                await async_load_from_store(self.hacs.hass, RELEASE_NOTES_STORE)
+            )
+
             self.logger.info("<HacsData restore> Restore done")
         except (
             # lgtm [py/catch-base-exception] pylint: disable=broad-except
@@ -235,7 +256,10 @@ class HacsData:
     async def register_unknown_repositories(
         self, repositories: dict[str, dict[str, Any]], category: str | None = None
     ):
-        """Registry any unknown repositories."""
+        """Registry any unknown repositories.
+
+        Repositories that are not downloaded are registered as catalogue stubs.
+        """
         for repo_idx, (entry, repo_data) in enumerate(repositories.items()):
             # async_register_repository is awaited in a loop
             # since its unlikely to ever suspend at startup
@@ -250,6 +274,7 @@ class HacsData:
                 category=repo_data.get("category", category),
                 check=False,
                 repository_id=entry,
+                stub=entry != HACS_REPOSITORY_ID and not repo_data.get("installed", False),
             )
             if repo_idx % 100 == 0:
                 # yield to avoid blocking the event loop
@@ -258,7 +283,7 @@ class HacsData:
     @callback
     def async_restore_repository(self, entry: str, repository_data: dict[str, Any]):
         """Restore repository."""
-        repository: HacsRepository | None = None
+        repository: HacsRepository | RepositoryStub | None = None
         if full_name := repository_data.get("full_name"):
             repository = self.hacs.repositories.get_by_full_name(full_name)
         if not repository:
@@ -272,6 +297,10 @@ class HacsData:
             self.logger.warning("<HacsData async_restore_repository> duplicate IDs %s", exception)
             return
 
+        if isinstance(repository, RepositoryStub):
+            self.async_restore_repository_stub(repository, repository_data)
+            return
+
         # Restore repository attributes
         repository.data.authors = repository_data.get("authors", [])
         repository.data.description = repository_data.get("description", "")
@@ -300,6 +329,7 @@ class HacsData:
         repository.data.installed_version = repository_data.get("version_installed")
         repository.data.installed_commit = repository_data.get("installed_commit")
         repository.data.manifest_name = repository_data.get("manifest_name")
+        repository.data.content_hash = repository_data.get("content_hash")
 
         if last_fetched := repository_data.get("last_fetched"):
             repository.data.last_fetched = datetime.fromtimestamp(last_fetched, UTC)
@@ -321,3 +351,37 @@ class HacsData:
         if entry == HACS_REPOSITORY_ID:
             repository.data.installed_version = self.hacs.version
             repository.data.installed = True
+
+    @callback
+    def async_restore_repository_stub(
+        self, repository: RepositoryStub, repository_data: dict[str, Any]
+    ) -> None:
+        """Restore a catalogue stub."""
+        repository.authors = repository_data.get("authors", [])
+        repository.description = repository_data.get("description", "")
+        repository.downloads = repository_data.get("downloads", 0)
+        repository.last_updated = repository_data.get("last_updated", 0)
+        repository.etag_repository = repository_data.get("etag_repository")
+        repository.topics = [
+            topic for topic in repository_data.get("topics", []) if topic not in TOPIC_FILTER
+        ]
+        repository.domain = repository_data.get("domain")
+        repository.stargazers_count = repository_data.get(
+            "stargazers_count"
+        ) or repository_data.get("stars", 0)
+        repository.releases = repository_data.get("releases", False)
+        repository.new = repository_data.get("new", False)
+        repository.last_version = repository_data.get("last_version")
+        repository.prerelease = repository_data.get("prerelease")
+        repository.last_commit = repository_data.get("last_commit")
+        repository.manifest_name = repository_data.get("manifest_name")
+
+        if last_fetched := repository_data.get("last_fetched"):
+            repository.last_fetched = datetime.fromtimestamp(last_fetched, UTC)
+
+        repository.manifest = HacsManifest.from_dict(
+            repository_data.get("manifest") or repository_data.get("repository_manifest") or {}
+        ).manifest
+
+        if repository.prerelease == repository.last_version:
+            repository.prerelease = None
@@ -2,41 +2,24 @@
 
 from __future__ import annotations
 
-import asyncio
 from collections.abc import Coroutine
 from functools import wraps
-from typing import TYPE_CHECKING, Any
+from typing import Any
 
-from ..const import DEFAULT_CONCURRENT_BACKOFF_TIME, DEFAULT_CONCURRENT_TASKS
-
-if TYPE_CHECKING:
-    from ..base import HacsBase
+from ..enums import HacsConcurrencyResource
+from .concurrency import get_concurrency_controller
 
 
 def concurrent(
-    concurrenttasks: int = DEFAULT_CONCURRENT_TASKS,
-    backoff_time: int = DEFAULT_CONCURRENT_BACKOFF_TIME,
+    resource: HacsConcurrencyResource = HacsConcurrencyResource.GITHUB,
 ) -> Coroutine[Any, Any, None]:
-    """Return a modified function."""
-
-    max_concurrent = asyncio.Semaphore(concurrenttasks)
+    """Return a modified function, limited by the shared controller of the resource."""
 
     def inner_function(function) -> Coroutine[Any, Any, None]:
         @wraps(function)
         async def wrapper(*args, **kwargs) -> None:
-            hacs: HacsBase = getattr(args[0], "hacs", None)
-
-            async with max_concurrent:
-                result = await function(*args, **kwargs)
-                if (
-                    hacs is None
-                    or hacs.queue is None
-                    or hacs.queue.has_pending_tasks
-                    or "update" not in function.__name__
-                ):
-                    await asyncio.sleep(backoff_time)
-
-                return result
+            async with get_concurrency_controller(resource).slot():
+                return await function(*args, **kwargs)
 
         return wrapper
 
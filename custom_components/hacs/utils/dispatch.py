@@ -0,0 +1,10 @@
+"""Dispatcher signal helpers."""
+
+from __future__ import annotations
+
+from ..enums import HacsDispatchEvent
+
+
+def repository_signal(signal: HacsDispatchEvent, repository_id: str | int) -> str:
+    """Return the signal for events of a single repository."""
+    return f"{signal}_{repository_id}"
@@ -0,0 +1,87 @@
+"""Download sinks used by the streaming downloader."""
+
+from __future__ import annotations
+
+import gzip
+from io import BytesIO
+import os
+from typing import BinaryIO
+
+TEMP_SUFFIX = ".hacs-download"
+
+
+class MemoryDownloadWriter(BytesIO):
+    """Collect a download in memory."""
+
+    def reset(self) -> None:
+        """Discard what has been written so far."""
+        self.seek(0)
+        self.truncate()
+
+
+class FileDownloadWriter:
+    """Write a download to a temporary file, and move it in place when complete.
+
+    When gzip_copy is set a .gz copy is compressed from the same chunks,
+    so the file is never read back from disk.
+    All methods are blocking and should run in the executor.
+    """
+
+    def __init__(self, path: str, *, gzip_copy: bool = False) -> None:
+        """Initialize."""
+        self.path = path
+        self.gzip_copy = gzip_copy
+        self._file: BinaryIO | None = None
+        self._gzip_file: BinaryIO | None = None
+        self._gzip: gzip.GzipFile | None = None
+
+    def _targets(self) -> list[str]:
+        """Return the final paths written by the writer."""
+        return [self.path, f"{self.path}.gz"] if self.gzip_copy else [self.path]
+
+    def open(self) -> None:
+        """Open the temporary files."""
+        self._file = open(f"{self.path}{TEMP_SUFFIX}", "wb")  # pylint: disable=consider-using-with
+        if self.gzip_copy:
+            self._gzip_file = open(  # pylint: disable=consider-using-with
+                f"{self.path}.gz{TEMP_SUFFIX}", "wb"
+            )
+            self._gzip = gzip.GzipFile(
+                filename=os.path.basename(self.path), mode="wb", fileobj=self._gzip_file
+            )
+
+    def write(self, data: bytes) -> None:
+        """Write a chunk."""
+        self._file.write(data)
+        if self._gzip is not None:
+            self._gzip.write(data)
+
+    def reset(self) -> None:
+        """Discard what has been written so far."""
+        self.close()
+        self.open()
+
+    def close(self) -> None:
+        """Close the temporary files."""
+        if self._gzip is not None:
+            self._gzip.close()
+            self._gzip = None
+        for handler in (self._file, self._gzip_file):
+            if handler is not None:
+                handler.close()
+        self._file = self._gzip_file = None
+
+    def commit(self) -> None:
+        """Move the complete download in place."""
+        self.close()
+        for target in self._targets():
+            os.replace(f"{target}{TEMP_SUFFIX}", target)
+
+    def abort(self) -> None:
+        """Remove the temporary files."""
+        self.close()
+        for target in self._targets():
+            try:
+                os.remove(f"{target}{TEMP_SUFFIX}")
+            except FileNotFoundError:
+                pass
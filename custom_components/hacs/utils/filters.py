@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import Any
 
 
@@ -36,7 +37,7 @@ def filter_content_return_one_of_type(
     return contents
 
 
-def get_first_directory_in_directory(content: list[str | Any], dirname: str) -> str | None:
+def get_first_directory_in_directory(content: Iterable[Any], dirname: str) -> str | None:
     """Return the first directory in dirname or None."""
     directory = None
     for path in content:
@@ -17,3 +17,54 @@ query ($owner: String!, $name: String!, $first: Int!) {
   }
 }
 """
+
+REPOSITORIES_STATUS_BATCH_SIZE = 50
+
+_REPOSITORY_STATUS_FIELDS = """
+    isArchived
+    stargazerCount
+    pushedAt
+    defaultBranchRef {
+      name
+      target {
+        oid
+      }
+    }
+    releases(first: $releases, orderBy: {field: CREATED_AT, direction: DESC}) {
+      nodes {
+        tagName
+        isDraft
+        isPrerelease
+      }
+    }
+"""
+
+
+def get_repositories_status(
+    full_names: list[str], releases: int = 30
+) -> tuple[str, dict[str, str | int]]:
+    """Return a query and variables for the status of multiple repositories.
+
+    Each repository is aliased as r<index>, matching the order of full_names.
+    """
+    definitions = ["$releases: Int!"]
+    selections = []
+    variables = {"releases": releases}
+    for index, full_name in enumerate(full_names):
+        owner, name = full_name.split("/", 1)
+        variables[f"o{index}"] = owner
+        variables[f"n{index}"] = name
+        definitions.append(f"$o{index}: String!, $n{index}: String!")
+        selections.append(
+            f"r{index}: repository(owner: $o{index}, name: $n{index}) {{{_REPOSITORY_STATUS_FIELDS}}}"
+        )
+
+    query = f"""
+query ({", ".join(definitions)}) {{
+  rateLimit {{
+    cost
+  }}
+  {"\n  ".join(selections)}
+}}
+"""
+    return query, variables
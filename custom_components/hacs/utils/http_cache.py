@@ -0,0 +1,156 @@
+"""HTTP validator and response cache."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from aiogithubapi import GitHubContentsModel, GitHubGitTreeModel, GitHubReleaseModel
+
+from .store import async_load_from_store, get_store_for_key
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.storage import Store
+
+HTTP_CACHE_STORE = "http_cache"
+
+# Maximum number of GitHub responses kept, the least recently used are dropped first
+GITHUB_CACHE_LIMIT = 500
+
+# Seconds to collect changed GitHub responses before they are written
+HTTP_CACHE_SAVE_DELAY = 180
+
+_CACHEABLE_MODELS = {
+    model.__name__: model
+    for model in (GitHubContentsModel, GitHubGitTreeModel, GitHubReleaseModel)
+}
+
+# Fields of the cached models that are read from a replayed response
+_REPLAYED_FIELDS = {
+    GitHubContentsModel.__name__: ("type", "encoding", "name", "path", "content"),
+    GitHubGitTreeModel.__name__: ("tree",),
+    GitHubReleaseModel.__name__: (
+        "tag_name",
+        "name",
+        "draft",
+        "prerelease",
+        "published_at",
+        "body",
+        "assets",
+    ),
+}
+# Fields of the nested entries that are read from a replayed response
+_REPLAYED_ENTRY_FIELDS = {
+    "assets": ("name", "download_count", "browser_download_url"),
+    "tree": ("path", "type"),
+}
+
+
+def _replayed_fields(model: str, raw: dict[str, Any]) -> dict[str, Any]:
+    """Return the fields of a raw response that are read from a replay."""
+    data = {field: raw[field] for field in _REPLAYED_FIELDS[model] if field in raw}
+    for field, entry_fields in _REPLAYED_ENTRY_FIELDS.items():
+        if data.get(field):
+            data[field] = [
+                {entry_field: entry.get(entry_field) for entry_field in entry_fields}
+                for entry in data[field]
+            ]
+    return data
+
+
+class CachedGitHubResponse:
+    """Replay of a GitHub response that was not modified."""
+
+    __slots__ = ("data", "etag")
+
+    headers = None
+
+    def __init__(self, data: Any, etag: str) -> None:
+        """Initialize."""
+        self.data = data
+        self.etag = etag
+
+
+class HacsHttpCache:
+    """ETags and body hashes for data-v2 endpoints, and the replayed fields of GitHub responses."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.data_v2: dict[str, dict[str, Any]] = {}
+        self.github: dict[str, dict[str, Any]] = {}
+        self._stored_data_v2: dict[str, dict[str, Any]] = {}
+        self._store: Store | None = None
+
+    def github_etag(self, key: str) -> str | None:
+        """Return the ETag of a cached GitHub response."""
+        if (entry := self.github.get(key)) is not None:
+            return entry["etag"]
+        return None
+
+    def github_replay(self, key: str) -> CachedGitHubResponse | None:
+        """Return the cached GitHub response for a key."""
+        if (entry := self.github.pop(key, None)) is None:
+            return None
+        self.github[key] = entry
+        model = _CACHEABLE_MODELS[entry["model"]]
+        if entry["list"]:
+            return CachedGitHubResponse([model(item) for item in entry["data"]], entry["etag"])
+        return CachedGitHubResponse(model(entry["data"]), entry["etag"])
+
+    def github_store(self, key: str, response: Any) -> None:
+        """Store a GitHub response if its content can be replayed."""
+        if not (etag := getattr(response, "etag", None)):
+            return
+
+        data = response.data
+        items = data if (is_list := isinstance(data, list)) else [data]
+        if not items or (model := type(items[0]).__name__) not in _CACHEABLE_MODELS:
+            return
+
+        replayed = [
+            _replayed_fields(model, item._raw_data)  # pylint: disable=protected-access
+            for item in items
+        ]
+        self.github.pop(key, None)
+        self.github[key] = {
+            "etag": etag,
+            "model": model,
+            "list": is_list,
+            "data": replayed if is_list else replayed[0],
+        }
+        while len(self.github) > GITHUB_CACHE_LIMIT:
+            del self.github[next(iter(self.github))]
+
+        self._async_schedule_save()
+
+    def _async_schedule_save(self) -> None:
+        """Write the cache once changes have settled."""
+        if self._store is not None:
+            self._store.async_delay_save(self.to_dict, HTTP_CACHE_SAVE_DELAY)
+
+    def async_store_data_v2(self) -> None:
+        """Store the current validators of the category endpoints.
+
+        Called once the repositories they describe are stored, so a restored
+        validator is never newer than the restored repositories.
+        """
+        self._stored_data_v2 = {
+            endpoint: validator
+            for endpoint, validator in self.data_v2.items()
+            if "repositories" in validator
+        }
+        self._async_schedule_save()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the content to store."""
+        return {"data_v2": self._stored_data_v2, "github": self.github}
+
+    async def async_restore(self, hass: HomeAssistant) -> None:
+        """Restore stored content, changes are written on their own delay from now on."""
+        self._store = get_store_for_key(hass, HTTP_CACHE_STORE)
+        stored = await async_load_from_store(hass, HTTP_CACHE_STORE)
+        self._stored_data_v2 = stored.get("data_v2", {})
+        self.data_v2.update(self._stored_data_v2)
+        for key, entry in stored.get("github", {}).items():
+            if entry.get("model") in _CACHEABLE_MODELS:
+                self.github[key] = entry
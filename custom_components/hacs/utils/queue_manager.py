@@ -3,80 +3,164 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
 from collections.abc import Coroutine
 import time
+from typing import Any
 
 from homeassistant.core import HomeAssistant
 
+from ..const import DEFAULT_CONCURRENT_TASKS
 from ..exceptions import HacsExecutionStillInProgress
 from .logger import LOGGER
 
 _LOGGER = LOGGER
 
 
+class RateLimitBucket:
+    """Token bucket following the GitHub rate limit response headers.
+
+    A token is one queued task, which is estimated to cost `cost` requests.
+    `reserve` requests are kept back for everything that does not run in the queue.
+    """
+
+    def __init__(self, *, reserve: int = 1000, cost: int = 10) -> None:
+        """Initialize."""
+        self.reserve = reserve
+        self.cost = cost
+        self.remaining: int | None = None
+        self.reset: float = 0
+
+    @property
+    def available(self) -> int | None:
+        """Return the number of tasks that can run, None if the limit is unknown."""
+        if self.remaining is None or time.time() >= self.reset:
+            return None
+        return max(0, (self.remaining - self.reserve) // self.cost)
+
+    def update(self, remaining: int | str | None, reset: float | str | None) -> None:
+        """Update the bucket from the reported rate limit."""
+        try:
+            self.remaining = int(remaining)
+            self.reset = float(reset)
+        except (TypeError, ValueError):
+            return
+
+    def consume(self) -> None:
+        """Take a token for a task, until the next response corrects the estimate."""
+        if self.remaining is not None:
+            self.remaining -= self.cost
+
+
 class QueueManager:
     """The QueueManager class."""
 
-    def __init__(self, hass: HomeAssistant) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        *,
+        max_concurrency: int = DEFAULT_CONCURRENT_TASKS,
+    ) -> None:
         self.hass = hass
-        self.queue: list[Coroutine] = []
+        self.max_concurrency = max_concurrency
+        self.rate_limit = RateLimitBucket()
         self.running = False
+        self._tasks: deque[tuple[Coroutine, float]] = deque()
+        self._executed = 0
+        self._failed = 0
+        self._wait_time = 0.0
+        self._throughput = 0.0
 
     @property
     def pending_tasks(self) -> int:
         """Return a count of pending tasks in the queue."""
-        return len(self.queue)
+        return len(self._tasks)
 
     @property
     def has_pending_tasks(self) -> bool:
         """Return a count of pending tasks in the queue."""
-        return self.pending_tasks != 0
+        return bool(self._tasks)
+
+    @property
+    def metrics(self) -> dict[str, Any]:
+        """Return queue metrics."""
+        return {
+            "pending": len(self._tasks),
+            "executed": self._executed,
+            "failed": self._failed,
+            "average_wait_seconds": (
+                round(self._wait_time / self._executed, 3) if self._executed else 0
+            ),
+            "throughput_per_second": round(self._throughput, 3),
+            "rate_limit_available": self.rate_limit.available,
+        }
 
     def clear(self) -> None:
         """Clear the queue."""
-        self.queue = []
+        while self._tasks:
+            task, _ = self._tasks.popleft()
+            task.close()
 
     def add(self, task: Coroutine) -> None:
         """Add a task to the queue."""
-        self.queue.append(task)
+        self._tasks.append((task, time.monotonic()))
+
+    def _next_task(self) -> Coroutine | None:
+        """Return the next task, in the order they were added."""
+        if not self._tasks:
+            return None
+        task, queued = self._tasks.popleft()
+        self._wait_time += time.monotonic() - queued
+        return task
 
     async def execute(self, number_of_tasks: int | None = None) -> None:
         """Execute the tasks in the queue."""
         if self.running:
             _LOGGER.debug("<QueueManager> Execution is already running")
             raise HacsExecutionStillInProgress
-        if len(self.queue) == 0:
+        if not self.has_pending_tasks:
             _LOGGER.debug("<QueueManager> The queue is empty")
             return
 
-        self.running = True
-
-        _LOGGER.debug("<QueueManager> Checking out tasks to execute")
-        local_queue = []
-
+        budget = self.pending_tasks
         if number_of_tasks:
-            for task in self.queue[:number_of_tasks]:
-                local_queue.append(task)
-        else:
-            for task in self.queue:
-                local_queue.append(task)
-
-        _LOGGER.debug("<QueueManager> Starting queue execution for %s tasks", len(local_queue))
-        start = time.time()
-        result = await asyncio.gather(*local_queue, return_exceptions=True)
-        for entry in result:
-            if isinstance(entry, Exception):
-                _LOGGER.error("<QueueManager> %s", entry)
-        end = time.time() - start
-
-        for task in local_queue:
-            self.queue.remove(task)
+            budget = min(budget, number_of_tasks)
+        if (available := self.rate_limit.available) is not None:
+            budget = min(budget, available)
+        if budget == 0:
+            _LOGGER.debug("<QueueManager> The rate limit does not allow any tasks to run")
+            return
+
+        self.running = True
+        _LOGGER.debug("<QueueManager> Starting queue execution for %s tasks", budget)
+        executed = 0
+
+        async def _worker() -> None:
+            nonlocal budget, executed
+            while budget > 0 and (task := self._next_task()) is not None:
+                budget -= 1
+                self.rate_limit.consume()
+                try:
+                    await task
+                except Exception as exception:  # pylint: disable=broad-except
+                    self._failed += 1
+                    _LOGGER.error("<QueueManager> %s", exception)
+                executed += 1
+                self._executed += 1
+
+        start = time.monotonic()
+        try:
+            await asyncio.gather(*(_worker() for _ in range(min(budget, self.max_concurrency))))
+        finally:
+            self.running = False
+
+        end = time.monotonic() - start
+        self._throughput = executed / end if end else 0
 
         _LOGGER.debug(
             "<QueueManager> Queue execution finished for %s tasks finished in %.2f seconds",
-            len(local_queue),
+            executed,
             end,
         )
         if self.has_pending_tasks:
-            _LOGGER.debug("<QueueManager> %s tasks remaining in the queue", len(self.queue))
-        self.running = False
+            _LOGGER.debug("<QueueManager> %s tasks remaining in the queue", self.pending_tasks)
@@ -0,0 +1,82 @@
+"""Rendered release notes for downloaded repositories."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+from aiogithubapi import GitHubReleaseModel
+
+if TYPE_CHECKING:
+    from ..repositories.base import HacsRepository
+
+RELEASE_NOTES_STORE = "release_notes"
+
+
+def render_release_notes(releases: list[GitHubReleaseModel], installed_version: str) -> str:
+    """Compile release notes from the installed version up to the latest."""
+    parts: list[str] = []
+    if any(release.tag_name == installed_version for release in releases):
+        for release in releases:
+            if release.tag_name == installed_version:
+                break
+            parts.append(f"# {release.tag_name}")
+            if release.tag_name != release.name:
+                parts.append(f"  - {release.name}")
+            parts.append(f"\n\n{release.body}\n\n---\n\n")
+    elif releases:
+        parts.append(releases[0].body or "")
+
+    return "".join(parts).replace("\n#", "\n\n#")
+
+
+class HacsReleaseNotesCache:
+    """Release notes per repository, for the installed and latest version they were rendered for."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.entries: dict[str, dict[str, str]] = {}
+
+    def get(self, repository: HacsRepository) -> str | None:
+        """Return the notes if they match the installed and latest version."""
+        if (entry := self.entries.get(str(repository.data.id))) is None:
+            return None
+        if (
+            entry["installed"] != repository.display_installed_version
+            or entry["latest"] != repository.display_available_version
+        ):
+            return None
+        return entry["notes"]
+
+    def render(self, repository: HacsRepository) -> str | None:
+        """Render and cache notes from the releases the repository already has."""
+        if not repository.data.installed or not repository.releases.objects:
+            return None
+        if (notes := self.get(repository)) is not None:
+            return notes
+
+        notes = render_release_notes(
+            repository.releases.objects, repository.display_installed_version
+        )
+        self.entries[str(repository.data.id)] = {
+            "installed": repository.display_installed_version,
+            "latest": repository.display_available_version,
+            "notes": notes,
+        }
+        return notes
+
+    def remove(self, repository_id: str) -> None:
+        """Remove the notes for a repository."""
+        self.entries.pop(str(repository_id), None)
+
+    def to_dict(self, repository_ids: Iterable[str]) -> dict[str, Any]:
+        """Return the content to store, for repositories that are still downloaded."""
+        return {
+            repository_id: entry
+            for repository_id in map(str, repository_ids)
+            if (entry := self.entries.get(repository_id)) is not None
+        }
+
+    def restore(self, data: dict[str, Any]) -> None:
+        """Restore stored content."""
+        self.entries.update(data)
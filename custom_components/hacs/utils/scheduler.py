@@ -0,0 +1,212 @@
+"""Scheduling of the recurring HACS tasks."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+import random
+import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HassJob, callback
+from homeassistant.helpers import instance_id
+from homeassistant.helpers.event import async_call_later
+
+from .logger import LOGGER
+from .store import async_load_from_store, async_save_to_store
+
+if TYPE_CHECKING:
+    from ..base import HacsBase
+
+SCHEDULER_STORE = "scheduler"
+
+# Intervals are stretched or shortened by up to this fraction per run
+JITTER = 0.1
+
+# Overdue work is spread over this many seconds after startup
+STARTUP_SPREAD = 60
+
+# Last runs of tasks with shorter intervals are not persisted
+PERSIST_MIN_INTERVAL = timedelta(hours=1)
+
+# The event loop counts as idle when sleeps overshoot by less than the threshold
+IDLE_PROBE_INTERVAL = 0.5
+IDLE_LAG_THRESHOLD = 0.05
+IDLE_PROBES = 3
+IDLE_MAX_WAIT = 120
+
+
+@dataclass(slots=True)
+class ScheduledTask:
+    """A recurring task."""
+
+    name: str
+    job: Callable[[], Awaitable[Any]]
+    interval: timedelta
+    startup: bool = False
+
+    @property
+    def persisted(self) -> bool:
+        """Return True if the last run of the task is persisted."""
+        return self.interval >= PERSIST_MIN_INTERVAL
+
+
+class HacsScheduler:
+    """Run recurring tasks with per instance jitter, remembering when they last ran.
+
+    Tasks are rescheduled when a run finishes, so runs never overlap. Startup
+    tasks that are due are left to async_run_if_due, other tasks are scheduled
+    from their last run, or spread over the first minute when they are overdue.
+    """
+
+    def __init__(self, hacs: HacsBase) -> None:
+        """Initialize."""
+        self.hacs = hacs
+        self.tasks: dict[str, ScheduledTask] = {}
+        self.last_runs: dict[str, float] = {}
+        self.next_runs: dict[str, float] = {}
+        self._unsubs: dict[str, Callable[[], None]] = {}
+        self._rng = random.Random()
+        self._running = False
+
+    @property
+    def metrics(self) -> dict[str, dict[str, str | None]]:
+        """Return the last and next run of every task."""
+
+        def _iso(timestamp: float | None) -> str | None:
+            if timestamp is None:
+                return None
+            return datetime.fromtimestamp(timestamp, UTC).isoformat()
+
+        return {
+            name: {
+                "last_run": _iso(self.last_runs.get(name)),
+                "next_run": _iso(self.next_runs.get(name)),
+            }
+            for name in self.tasks
+        }
+
+    @callback
+    def async_add(
+        self,
+        name: str,
+        job: Callable[[], Awaitable[Any]],
+        interval: timedelta,
+        *,
+        startup: bool = False,
+    ) -> None:
+        """Add a recurring task, startup tasks are also run at startup when they are due."""
+        self.tasks[name] = ScheduledTask(name, job, interval, startup)
+
+    async def async_start(self) -> None:
+        """Restore the last runs, and schedule the tasks."""
+        self._running = True
+        # Seeded per instance, so instances restarted together do not run in step
+        self._rng.seed(await instance_id.async_get(self.hacs.hass))
+        stored = await async_load_from_store(self.hacs.hass, SCHEDULER_STORE)
+        self.last_runs = {
+            name: last_run
+            for name, last_run in (stored.get("last_runs") or {}).items()
+            if name in self.tasks and self.tasks[name].persisted
+        }
+
+        now = time.time()
+        for task in self.tasks.values():
+            if task.startup and self.is_due(task.name):
+                continue
+            if (last_run := self.last_runs.get(task.name)) is None:
+                delay = self._jittered(task.interval)
+            else:
+                delay = max(
+                    last_run + self._jittered(task.interval) - now,
+                    self._rng.uniform(0, STARTUP_SPREAD),
+                )
+            self._async_schedule(task, delay)
+
+    @callback
+    def async_stop(self) -> None:
+        """Cancel scheduled runs."""
+        self._running = False
+        for unsub in self._unsubs.values():
+            unsub()
+        self._unsubs.clear()
+        self.next_runs.clear()
+
+    def is_due(self, name: str) -> bool:
+        """Return True if the task did not run within its interval."""
+        if (last_run := self.last_runs.get(name)) is None:
+            return True
+        return time.time() - last_run >= self.tasks[name].interval.total_seconds()
+
+    async def async_run_if_due(self, name: str) -> bool:
+        """Run a task if it is due, return True if it ran."""
+        if not self.is_due(name):
+            LOGGER.debug("<HacsScheduler> Skipping %s, it ran recently", name)
+            return False
+        await self.async_run(name)
+        return True
+
+    async def async_run(self, name: str) -> None:
+        """Run a task now, and schedule the next run."""
+        task = self.tasks[name]
+        if (unsub := self._unsubs.pop(name, None)) is not None:
+            unsub()
+        self.next_runs.pop(name, None)
+        try:
+            await task.job()
+        except Exception as exception:  # pylint: disable=broad-except
+            LOGGER.exception("<HacsScheduler> Task %s failed - %s", name, exception)
+        finally:
+            self.last_runs[name] = time.time()
+            self._async_schedule(task, self._jittered(task.interval))
+
+        if task.persisted:
+            await async_save_to_store(
+                self.hacs.hass,
+                SCHEDULER_STORE,
+                {
+                    "last_runs": {
+                        name: last_run
+                        for name, last_run in self.last_runs.items()
+                        if self.tasks[name].persisted
+                    }
+                },
+            )
+
+    async def async_wait_for_idle(self) -> None:
+        """Wait until the event loop is idle, and for this instance's share of the spread."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + IDLE_MAX_WAIT
+        quiet = 0
+        while quiet < IDLE_PROBES and loop.time() < deadline:
+            started = loop.time()
+            await asyncio.sleep(IDLE_PROBE_INTERVAL)
+            lag = loop.time() - started - IDLE_PROBE_INTERVAL
+            quiet = quiet + 1 if lag < IDLE_LAG_THRESHOLD else 0
+
+        if not self.hacs.status.new:
+            await asyncio.sleep(self._rng.uniform(0, STARTUP_SPREAD))
+
+    def _jittered(self, interval: timedelta) -> float:
+        """Return the interval in seconds, with jitter."""
+        return interval.total_seconds() * (1 + self._rng.uniform(-JITTER, JITTER))
+
+    @callback
+    def _async_schedule(self, task: ScheduledTask, delay: float) -> None:
+        """Schedule the next run of a task."""
+        if not self._running:
+            return
+
+        @callback
+        def _async_run(_: datetime) -> None:
+            self._unsubs.pop(task.name, None)
+            self.hacs.hass.async_create_background_task(
+                self.async_run(task.name), f"hacs_scheduled_{task.name}"
+            )
+
+        self.next_runs[task.name] = time.time() + delay
+        self._unsubs[task.name] = async_call_later(
+            self.hacs.hass, delay, HassJob(_async_run, cancel_on_shutdown=True)
+        )
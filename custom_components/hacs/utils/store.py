@@ -1,5 +1,8 @@
 """Storage handers."""
 
+import os
+import time
+
 from homeassistant.helpers.json import JSONEncoder
 from homeassistant.helpers.storage import Store
 from homeassistant.util import json as json_util
@@ -7,12 +10,13 @@ from homeassistant.util import json as json_util
 from ..const import VERSION_STORAGE
 from ..exceptions import HacsException
 from .logger import LOGGER
+from .telemetry import get_telemetry
 
 _LOGGER = LOGGER
 
 
 class HACSStore(Store):
-    """A subclass of Store that allows multiple loads in the executor."""
+    """A subclass of Store that allows multiple loads in the executor, and reports writes."""
 
     def load(self):
         """Load the data from disk if version matches."""
@@ -31,6 +35,18 @@ class HACSStore(Store):
             return None
         return data["data"]
 
+    async def _async_write_data(self, path: str, data: dict) -> None:
+        """Write the data, delayed saves included, and record the write."""
+        started = time.monotonic()
+        size = await self.hass.async_add_executor_job(self._write_data_and_get_size, path, data)
+        if (telemetry := get_telemetry(self.hass)) is not None:
+            telemetry.store_write(self.key, size, time.monotonic() - started)
+
+    def _write_data_and_get_size(self, path: str, data: dict) -> int:
+        """Write the data and return the size of the file, in the same executor job."""
+        self._write_data(path, data)
+        return os.path.getsize(path)
+
 
 def get_store_key(key):
     """Return the key to use with homeassistant.helpers.storage.Storage."""
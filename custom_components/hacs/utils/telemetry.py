@@ -0,0 +1,125 @@
+"""Timings and counters for where HACS spends time and API quota."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from functools import wraps
+import time
+from typing import TYPE_CHECKING, Any
+
+from ..const import DOMAIN
+
+if TYPE_CHECKING:
+    from homeassistant.components.websocket_api import ActiveConnection
+    from homeassistant.core import HomeAssistant
+
+
+class HacsTelemetry:
+    """Instrumentation for a running HACS instance."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.startup_stages: dict[str, float] = {}
+        self.github_calls: Counter[str] = Counter()
+        self.downloaded_bytes = 0
+        self.downloads = 0
+        self.store_writes: dict[str, dict[str, float]] = {}
+        self.websocket_commands: dict[str, dict[str, float]] = {}
+
+    @property
+    def github_calls_total(self) -> int:
+        """Return the number of GitHub API calls."""
+        return self.github_calls.total()
+
+    @property
+    def metrics(self) -> dict[str, Any]:
+        """Return all recorded values."""
+        return {
+            "startup_stages_seconds": {
+                stage: round(duration, 3) for stage, duration in self.startup_stages.items()
+            },
+            "github_calls_total": self.github_calls_total,
+            "github_calls": dict(self.github_calls.most_common()),
+            "downloads": self.downloads,
+            "downloaded_bytes": self.downloaded_bytes,
+            "store_writes": self.store_writes,
+            "websocket_commands": self.websocket_commands,
+        }
+
+    @contextmanager
+    def startup_stage(self, stage: str) -> Iterator[None]:
+        """Record the duration of a startup stage."""
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.startup_stages[stage] = time.monotonic() - started
+
+    def github_call(self, endpoint: str) -> None:
+        """Count a call to the GitHub API."""
+        self.github_calls[endpoint] += 1
+
+    def download(self, size: int) -> None:
+        """Count a finished download."""
+        self.downloads += 1
+        self.downloaded_bytes += size
+
+    def store_write(self, key: str, size: int, duration: float) -> None:
+        """Record a write to a store file."""
+        entry = self.store_writes.setdefault(key, {"count": 0, "bytes": 0, "seconds": 0.0})
+        entry["count"] += 1
+        entry["bytes"] = size
+        entry["seconds"] = round(entry["seconds"] + duration, 3)
+
+    def websocket_command(self, command: str, duration: float) -> None:
+        """Record the time a websocket command took."""
+        entry = self.websocket_commands.setdefault(
+            command, {"count": 0, "average_seconds": 0.0, "max_seconds": 0.0}
+        )
+        entry["count"] += 1
+        entry["average_seconds"] = round(
+            entry["average_seconds"] + (duration - entry["average_seconds"]) / entry["count"], 4
+        )
+        entry["max_seconds"] = round(max(entry["max_seconds"], duration), 4)
+
+
+def get_telemetry(hass: HomeAssistant) -> HacsTelemetry | None:
+    """Return the telemetry of the loaded HACS instance."""
+    if (hacs := hass.data.get(DOMAIN)) is None:
+        return None
+    return hacs.telemetry
+
+
+def measure_websocket_command(func: Callable) -> Callable:
+    """Record how long a websocket command handler takes."""
+
+    def _record(hass: HomeAssistant, msg: dict[str, Any], started: float) -> None:
+        if (telemetry := get_telemetry(hass)) is not None:
+            telemetry.websocket_command(msg["type"], time.monotonic() - started)
+
+    if asyncio.iscoroutinefunction(func):
+
+        @wraps(func)
+        async def _async_wrapper(
+            hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+        ) -> None:
+            started = time.monotonic()
+            try:
+                await func(hass, connection, msg)
+            finally:
+                _record(hass, msg, started)
+
+        return _async_wrapper
+
+    @wraps(func)
+    def _wrapper(hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]) -> None:
+        started = time.monotonic()
+        try:
+            func(hass, connection, msg)
+        finally:
+            _record(hass, msg, started)
+
+    return _wrapper
@@ -0,0 +1,62 @@
+"""Index of a repository tree."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+
+class RepositoryTreeIndex:
+    """Lookups in a repository tree without scanning it.
+
+    Paths are kept in a dict for membership tests, in a sorted list for
+    prefix queries, and in buckets per directory and per filename.
+    """
+
+    __slots__ = ("_by_directory", "_by_filename", "_by_path", "_sorted_paths")
+
+    def __init__(self, tree: Iterable[Any]) -> None:
+        """Initialize."""
+        self._by_path: dict[str, Any] = {}
+        self._by_directory: dict[str, list[Any]] = {}
+        self._by_filename: dict[str, list[Any]] = {}
+        for treefile in tree:
+            full_path = treefile.full_path
+            directory, _, filename = full_path.rpartition("/")
+            self._by_path[full_path] = treefile
+            self._by_directory.setdefault(directory, []).append(treefile)
+            self._by_filename.setdefault(filename, []).append(treefile)
+        self._sorted_paths = sorted(self._by_path)
+
+    def __contains__(self, path: str) -> bool:
+        """Return True if the path is in the tree."""
+        return path in self._by_path
+
+    def __len__(self) -> int:
+        """Return the number of entries in the tree."""
+        return len(self._by_path)
+
+    def get(self, path: str) -> Any | None:
+        """Return the tree entry for a path."""
+        return self._by_path.get(path)
+
+    def has_filename(self, filename: str) -> bool:
+        """Return True if a file with this name is anywhere in the tree."""
+        return filename in self._by_filename
+
+    def with_filename(self, filename: str) -> list[Any]:
+        """Return the entries with this name, anywhere in the tree."""
+        return self._by_filename.get(filename, [])
+
+    def in_directory(self, directory: str) -> list[Any]:
+        """Return the direct entries of a directory, "" is the root."""
+        return self._by_directory.get(directory, [])
+
+    def with_prefix(self, prefix: str) -> Iterator[Any]:
+        """Return the entries with a path starting with the prefix, in path order."""
+        paths = self._sorted_paths
+        index = bisect_left(paths, prefix)
+        while index < len(paths) and paths[index].startswith(prefix):
+            yield self._by_path[paths[index]]
+            index += 1
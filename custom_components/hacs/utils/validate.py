@@ -128,6 +128,60 @@ V2_COMMON_DATA_JSON_SCHEMA = {
     vol.Optional("topics"): [str],
 }
 
+_V2_OPTIONAL_INT_KEYS = ("downloads", "open_issues", "stargazers_count")
+_V2_OPTIONAL_STR_KEYS = ("etag_releases", "last_commit", "last_version", "prerelease")
+
+
+def fast_check_repo_data(required_str_keys: tuple[str, ...]) -> Callable[[Any], bool]:
+    """Return a hand written check for fetched V2 repo data.
+
+    It returns True only for data the V2 schema accepts, anything else should
+    go through the voluptuous validator, which also explains what is wrong.
+    """
+    required_str_keys = ("etag_repository", "full_name", "last_updated", *required_str_keys)
+
+    def check(data: Any) -> bool:
+        if not isinstance(data, dict):
+            return False
+        if "last_commit" not in data and "last_version" not in data:
+            return False
+        for key in required_str_keys:
+            if not isinstance(data.get(key), str):
+                return False
+        if "description" not in data or not (
+            data["description"] is None or isinstance(data["description"], str)
+        ):
+            return False
+        if not isinstance(data.get("last_fetched"), (int, float)):
+            return False
+        for key in _V2_OPTIONAL_STR_KEYS:
+            if key in data and not isinstance(data[key], str):
+                return False
+        for key in _V2_OPTIONAL_INT_KEYS:
+            if key in data and not isinstance(data[key], int):
+                return False
+        if "topics" in data and not (
+            isinstance(data["topics"], list)
+            and all(isinstance(topic, str) for topic in data["topics"])
+        ):
+            return False
+        if not isinstance(manifest := data.get("manifest"), dict):
+            return False
+        if "name" in manifest and not isinstance(manifest["name"], str):
+            return False
+        if "country" in manifest and not (
+            manifest["country"] is False
+            or (
+                isinstance(manifest["country"], list)
+                and all(isinstance(country, str) for country in manifest["country"])
+            )
+        ):
+            return False
+        return True
+
+    return check
+
+
 V2_INTEGRATION_DATA_JSON_SCHEMA = {
     **V2_COMMON_DATA_JSON_SCHEMA,
     vol.Required("domain"): str,
@@ -149,6 +203,12 @@ VALIDATE_FETCHED_V2_REPO_DATA = {
     for category, schema in _V2_REPO_SCHEMAS.items()
 }
 
+# Fast path for VALIDATE_FETCHED_V2_REPO_DATA
+FAST_CHECK_FETCHED_V2_REPO_DATA = {
+    category: fast_check_repo_data(("domain", "manifest_name") if category == "integration" else ())
+    for category in _V2_REPO_SCHEMAS
+}
+
 # Used when validating repos when generating data, fails on extra keys
 VALIDATE_GENERATED_V2_REPO_DATA = {
     category: vol.Schema({str: validate_repo_data(schema, vol.PREVENT_EXTRA)})
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable, Callable
+from functools import cached_property
 from typing import TYPE_CHECKING, Any
 
 from ..exceptions import HacsException
@@ -15,6 +18,82 @@ class ValidationException(HacsException):
     """Raise when there is a validation issue."""
 
 
+class ValidationFetchCache:
+    """Content fetched for a repository, shared by the validators checking it.
+
+    Concurrent requests for the same content wait for the same fetch.
+    Content that does not depend on the repository is kept in the shared
+    dict, which outlives the repository.
+    """
+
+    def __init__(
+        self,
+        repository: HacsRepository,
+        shared: dict[str, asyncio.Task] | None = None,
+    ) -> None:
+        """Initialize."""
+        self.repository = repository
+        self._fetched: dict[str, asyncio.Task] = {}
+        self._shared = shared if shared is not None else {}
+
+    @staticmethod
+    def _get(
+        store: dict[str, asyncio.Task], key: str, fetch: Callable[[], Awaitable[Any]]
+    ) -> asyncio.Task:
+        """Return the fetch for a key, starting it if needed."""
+        if (task := store.get(key)) is None:
+            task = store[key] = asyncio.ensure_future(fetch())
+        return task
+
+    @cached_property
+    def filenames(self) -> set[str]:
+        """Return the filenames in the root of the repository tree."""
+        return {treefile.filename for treefile in self.repository.tree}
+
+    @cached_property
+    def filenames_lower(self) -> set[str]:
+        """Return the lowercased filenames in the root of the repository tree."""
+        return {filename.lower() for filename in self.filenames}
+
+    async def async_get_hacs_json(self) -> dict[str, Any] | None:
+        """Return the content of the hacs.json file."""
+        return await self._get(
+            self._fetched,
+            "hacs_json",
+            lambda: self.repository.async_get_hacs_json(self.repository.ref),
+        )
+
+    async def async_get_integration_manifest(self) -> dict[str, Any] | None:
+        """Return the content of the manifest.json file."""
+        return await self._get(
+            self._fetched,
+            "integration_manifest",
+            lambda: self.repository.get_integration_manifest(version=self.repository.ref),
+        )
+
+    async def async_get_info_file_contents(self) -> str:
+        """Return the content of the information file."""
+        return await self._get(
+            self._fetched,
+            "info_file",
+            lambda: self.repository.async_get_info_file_contents(version=self.repository.ref),
+        )
+
+    async def async_get_url_json(self, url: str) -> Any:
+        """Return the JSON content of a URL that is the same for all repositories."""
+
+        async def _fetch() -> Any:
+            response = await self.repository.hacs.session.get(url)
+            return await response.json()
+
+        try:
+            return await self._get(self._shared, url, _fetch)
+        except Exception:
+            # Do not keep failures around for the next repository
+            self._shared.pop(url, None)
+            raise
+
+
 class ActionValidationBase:
     """Base class for action validation."""
 
@@ -22,9 +101,14 @@ class ActionValidationBase:
     allow_fork: bool = True
     more_info: str = "https://hacs.xyz/docs/publish/action"
 
-    def __init__(self, repository: HacsRepository) -> None:
+    def __init__(
+        self,
+        repository: HacsRepository,
+        fetched: ValidationFetchCache | None = None,
+    ) -> None:
         self.hacs = repository.hacs
         self.repository = repository
+        self.fetched = fetched or ValidationFetchCache(repository)
         self.failed = False
 
     @property
@@ -1,22 +1,12 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-
 from custom_components.hacs.enums import HacsCategory
 
 from .base import ActionValidationBase, ValidationException
 
-if TYPE_CHECKING:
-    from ..repositories.base import HacsRepository
-
 URL = "https://brands.home-assistant.io/domains.json"
 
 
-async def async_setup_validator(repository: HacsRepository) -> Validator:
-    """Set up this validator."""
-    return Validator(repository=repository)
-
-
 class Validator(ActionValidationBase):
     """Validate the repository."""
 
@@ -25,9 +15,7 @@ class Validator(ActionValidationBase):
 
     async def async_validate(self) -> None:
         """Validate the repository."""
-
-        response = await self.hacs.session.get(URL)
-        content = await response.json()
+        content = await self.fetched.async_get_url_json(URL)
 
         if self.repository.data.domain not in content["custom"]:
             raise ValidationException(
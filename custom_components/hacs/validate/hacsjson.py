@@ -4,16 +4,11 @@ from voluptuous.error import Invalid
 from voluptuous.humanize import humanize_error
 
 from ..enums import HacsCategory, RepositoryFile
-from ..repositories.base import HacsManifest, HacsRepository
+from ..repositories.base import HacsManifest
 from ..utils.validate import HACS_MANIFEST_JSON_SCHEMA
 from .base import ActionValidationBase, ValidationException
 
 
-async def async_setup_validator(repository: HacsRepository) -> Validator:
-    """Set up this validator."""
-    return Validator(repository=repository)
-
-
 class Validator(ActionValidationBase):
     """Validate the repository."""
 
@@ -21,10 +16,10 @@ class Validator(ActionValidationBase):
 
     async def async_validate(self) -> None:
         """Validate the repository."""
-        if RepositoryFile.HACS_JSON not in [x.filename for x in self.repository.tree]:
+        if RepositoryFile.HACS_JSON not in self.fetched.filenames:
             raise ValidationException(f"The repository has no '{RepositoryFile.HACS_JSON}' file")
 
-        content = await self.repository.async_get_hacs_json(self.repository.ref)
+        content = await self.fetched.async_get_hacs_json()
         try:
             hacsjson = HacsManifest.from_dict(HACS_MANIFEST_JSON_SCHEMA(content))
         except Invalid as exception:
@@ -1,21 +1,11 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-
 from ..enums import HacsCategory
 from .base import ActionValidationBase, ValidationException
 
-if TYPE_CHECKING:
-    from ..repositories.base import HacsRepository
-
 IGNORED = ["-shield", "img.shields.io", "buymeacoffee.com"]
 
 
-async def async_setup_validator(repository: HacsRepository) -> Validator:
-    """Set up this validator."""
-    return Validator(repository=repository)
-
-
 class Validator(ActionValidationBase):
     """Validate the repository."""
 
@@ -24,7 +14,7 @@ class Validator(ActionValidationBase):
 
     async def async_validate(self) -> None:
         """Validate the repository."""
-        info = await self.repository.async_get_info_file_contents(version=self.repository.ref)
+        info = await self.fetched.async_get_info_file_contents()
         for line in info.split("\n"):
             if "<img" in line or "![" in line:
                 if [ignore for ignore in IGNORED if ignore in line]:
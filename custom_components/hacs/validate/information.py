@@ -1,17 +1,7 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-
 from .base import ActionValidationBase, ValidationException
 
-if TYPE_CHECKING:
-    from ..repositories.base import HacsRepository
-
-
-async def async_setup_validator(repository: HacsRepository) -> Validator:
-    """Set up this validator."""
-    return Validator(repository=repository)
-
 
 class Validator(ActionValidationBase):
     """Validate the repository."""
@@ -20,7 +10,7 @@ class Validator(ActionValidationBase):
 
     async def async_validate(self) -> None:
         """Validate the repository."""
-        filenames = [x.filename.lower() for x in self.repository.tree]
+        filenames = self.fetched.filenames_lower
         if "readme" in filenames:
             pass
         elif "readme.md" in filenames:
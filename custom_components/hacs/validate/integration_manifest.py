@@ -9,15 +9,9 @@ from ..utils.validate import INTEGRATION_MANIFEST_JSON_SCHEMA
 from .base import ActionValidationBase, ValidationException
 
 if TYPE_CHECKING:
-    from ..repositories.base import HacsRepository
     from ..repositories.integration import HacsIntegrationRepository
 
 
-async def async_setup_validator(repository: HacsRepository) -> Validator:
-    """Set up this validator."""
-    return Validator(repository=repository)
-
-
 class Validator(ActionValidationBase):
     """Validate the repository."""
 
@@ -27,12 +21,12 @@ class Validator(ActionValidationBase):
 
     async def async_validate(self) -> None:
         """Validate the repository."""
-        if RepositoryFile.MAINIFEST_JSON not in [x.filename for x in self.repository.tree]:
+        if RepositoryFile.MAINIFEST_JSON not in self.fetched.filenames:
             raise ValidationException(
                 f"The repository has no '{RepositoryFile.MAINIFEST_JSON}' file"
             )
 
-        content = await self.repository.get_integration_manifest(version=self.repository.ref)
+        content = await self.fetched.async_get_integration_manifest()
         try:
             INTEGRATION_MANIFEST_JSON_SCHEMA(content)
         except Invalid as exception:
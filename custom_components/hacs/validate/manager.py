@@ -8,12 +8,26 @@ import os
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from .base import ActionValidationBase, ValidationFetchCache
+
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
     from ..base import HacsBase
     from ..repositories.base import HacsRepository
-    from .base import ActionValidationBase
+
+
+def _discover_validators() -> dict[str, type[ActionValidationBase]]:
+    """Import the validator modules and return their validator classes by slug."""
+    validator_modules = (
+        module.stem
+        for module in Path(__file__).parent.glob("*.py")
+        if module.name not in ("base.py", "__init__.py", "manager.py")
+    )
+    return {
+        module: import_module(f"{__package__}.{module}").Validator
+        for module in sorted(validator_modules)
+    }
 
 
 class ValidationManager:
@@ -24,35 +38,37 @@ class ValidationManager:
         self.hacs = hacs
         self.hass = hass
         self._validators: dict[str, ActionValidationBase] = {}
+        self._validator_classes: dict[str, type[ActionValidationBase]] | None = None
+        self._shared_fetches: dict[str, asyncio.Task] = {}
 
     @property
     def validators(self) -> list[ActionValidationBase]:
         """Return all list of all tasks."""
         return list(self._validators.values())
 
-    async def async_load(self, repository: HacsRepository) -> None:
-        """Load all tasks."""
-        self._validators = {}
-        validator_files = Path(__file__).parent
-        validator_modules = (
-            module.stem
-            for module in validator_files.glob("*.py")
-            if module.name not in ("base.py", "__init__.py", "manager.py")
-        )
+    async def _async_get_validators(
+        self, repository: HacsRepository
+    ) -> dict[str, ActionValidationBase]:
+        """Return validators for a repository, the validator modules are only discovered once."""
+        if self._validator_classes is None:
+            self._validator_classes = await self.hass.async_add_executor_job(_discover_validators)
 
-        async def _load_module(module: str) -> None:
-            task_module = import_module(f"{__package__}.{module}")
-            if task := await task_module.async_setup_validator(repository=repository):
-                self._validators[task.slug] = task
+        fetched = ValidationFetchCache(repository, self._shared_fetches)
+        return {
+            slug: validator_class(repository, fetched)
+            for slug, validator_class in self._validator_classes.items()
+        }
 
-        await asyncio.gather(*[_load_module(task) for task in validator_modules])
+    async def async_load(self, repository: HacsRepository) -> None:
+        """Load all tasks."""
+        self._validators = await self._async_get_validators(repository)
 
     async def async_run_repository_checks(self, repository: HacsRepository) -> None:
         """Run all validators for a repository."""
         if not self.hacs.system.action:
             return
 
-        await self.async_load(repository)
+        repository_validators = await self._async_get_validators(repository)
 
         is_pull_from_fork = (
             not os.getenv("INPUT_REPOSITORY")
@@ -61,7 +77,7 @@ class ValidationManager:
 
         validators = [
             validator
-            for validator in self.validators or []
+            for validator in repository_validators.values()
             if (
                 (not validator.categories or repository.data.category in validator.categories)
                 and validator.slug not in os.getenv("INPUT_IGNORE", "").split(" ")
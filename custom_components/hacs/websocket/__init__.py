@@ -10,6 +10,7 @@ from homeassistant.helpers.dispatcher import async_dispatcher_connect
 import voluptuous as vol
 
 from ..const import DOMAIN
+from ..utils.telemetry import measure_websocket_command
 from .critical import hacs_critical_acknowledge, hacs_critical_list
 from .repositories import (
     hacs_repositories_add,
@@ -97,6 +98,7 @@ async def hacs_subscribe(
 )
 @websocket_api.require_admin
 @websocket_api.async_response
+@measure_websocket_command
 async def hacs_info(
     hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
@@ -9,6 +9,7 @@ import homeassistant.helpers.config_validation as cv
 import voluptuous as vol
 
 from ..utils.store import async_load_from_store, async_save_to_store
+from ..utils.telemetry import measure_websocket_command
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -21,6 +22,7 @@ if TYPE_CHECKING:
 )
 @websocket_api.require_admin
 @websocket_api.async_response
+@measure_websocket_command
 async def hacs_critical_list(
     hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
@@ -43,6 +45,7 @@ async def hacs_critical_list(
 )
 @websocket_api.require_admin
 @websocket_api.async_response
+@measure_websocket_command
 async def hacs_critical_acknowledge(
     hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
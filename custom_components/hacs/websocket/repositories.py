@@ -6,18 +6,98 @@ import sys
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components import websocket_api
+from homeassistant.components.websocket_api.messages import construct_result_message
+from homeassistant.core import callback
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.json import json_bytes
 import voluptuous as vol
 
 from custom_components.hacs.utils import regex
 
 from ..const import DOMAIN
 from ..enums import HacsDispatchEvent
+from ..utils.concurrency import user_initiated
+from ..utils.telemetry import measure_websocket_command
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
     from ..base import HacsBase
+    from ..repositories.base import HacsRepository, RepositoryStub
+
+
+class RepositoryListCache:
+    """Pre-encoded hacs/repositories/list payloads, materialised per category."""
+
+    def __init__(self, hacs: HacsBase) -> None:
+        """Initialize."""
+        self.hacs = hacs
+        self._categories: dict[str, tuple[int, bytes]] = {}
+
+    @callback
+    def async_clear(self) -> None:
+        """Drop all cached payloads."""
+        self._categories.clear()
+
+    @callback
+    def async_get_payload(self, categories: list[str] | set[str]) -> bytes:
+        """Return the JSON encoded listing for the categories.
+
+        A cached category is encoded again once the generation of its
+        repositories has changed.
+        """
+        parts = []
+        for category in categories:
+            generation = self.hacs.repositories.generation(category)
+            cached = self._categories.get(category)
+            if cached is None or cached[0] != generation:
+                cached = self._categories[category] = (
+                    generation,
+                    self._encode_category(category),
+                )
+            if cached[1]:
+                parts.append(cached[1])
+        return b"[" + b",".join(parts) + b"]"
+
+    def _encode_category(self, category: str) -> bytes:
+        """Encode the listing entries of a category."""
+        return b",".join(
+            json_bytes(self._repository_entry(repo))
+            for repo in self.hacs.repositories.iter_category(category)
+            if not repo.ignored_by_country_configuration
+            and repo.data.last_fetched
+        )
+
+    def _repository_entry(self, repo: HacsRepository | RepositoryStub) -> dict[str, Any]:
+        """Return the listing entry of a repository."""
+        return {
+            "authors": repo.data.authors,
+            "available_version": repo.display_available_version,
+            "installed_version": repo.display_installed_version,
+            "config_flow": repo.data.config_flow,
+            "can_download": repo.can_download,
+            "category": repo.data.category,
+            "country": repo.repository_manifest.country,
+            "custom": not self.hacs.repositories.is_default(str(repo.data.id)),
+            "description": repo.data.description,
+            "domain": repo.data.domain,
+            "downloads": repo.data.downloads,
+            "file_name": repo.data.file_name,
+            "full_name": repo.data.full_name,
+            "hide": repo.data.hide,
+            "homeassistant": repo.repository_manifest.homeassistant,
+            "id": repo.data.id,
+            "installed": repo.data.installed,
+            "last_updated": repo.data.last_updated,
+            "local_path": repo.content.path.local,
+            "name": repo.display_name,
+            "new": repo.data.new,
+            "pending_upgrade": repo.pending_update,
+            "stars": repo.data.stargazers_count,
+            "state": repo.state,
+            "status": repo.display_status,
+            "topics": repo.data.topics,
+        }
 
 
 @websocket_api.websocket_command(
@@ -28,6 +108,7 @@ if TYPE_CHECKING:
 )
 @websocket_api.require_admin
 @websocket_api.async_response
+@measure_websocket_command
 async def hacs_repositories_list(
     hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
@@ -36,42 +117,11 @@ async def hacs_repositories_list(
     """List repositories."""
     hacs: HacsBase = hass.data.get(DOMAIN)
     connection.send_message(
-        websocket_api.result_message(
+        construct_result_message(
             msg["id"],
-            [
-                {
-                    "authors": repo.data.authors,
-                    "available_version": repo.display_available_version,
-                    "installed_version": repo.display_installed_version,
-                    "config_flow": repo.data.config_flow,
-                    "can_download": repo.can_download,
-                    "category": repo.data.category,
-                    "country": repo.repository_manifest.country,
-                    "custom": not hacs.repositories.is_default(str(repo.data.id)),
-                    "description": repo.data.description,
-                    "domain": repo.data.domain,
-                    "downloads": repo.data.downloads,
-                    "file_name": repo.data.file_name,
-                    "full_name": repo.data.full_name,
-                    "hide": repo.data.hide,
-                    "homeassistant": repo.repository_manifest.homeassistant,
-                    "id": repo.data.id,
-                    "installed": repo.data.installed,
-                    "last_updated": repo.data.last_updated,
-                    "local_path": repo.content.path.local,
-                    "name": repo.display_name,
-                    "new": repo.data.new,
-                    "pending_upgrade": repo.pending_update,
-                    "stars": repo.data.stargazers_count,
-                    "state": repo.state,
-                    "status": repo.display_status,
-                    "topics": repo.data.topics,
-                }
-                for repo in hacs.repositories.list_all
-                if repo.data.category in msg.get("categories", hacs.common.categories)
-                and not repo.ignored_by_country_configuration
-                and repo.data.last_fetched
-            ],
+            hacs.repositories_list_cache.async_get_payload(
+                msg.get("categories", hacs.common.categories)
+            ),
         )
     )
 
@@ -85,6 +135,7 @@ async def hacs_repositories_list(
 )
 @websocket_api.require_admin
 @websocket_api.async_response
+@measure_websocket_command
 async def hacs_repositories_clear_new(
     hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
@@ -98,8 +149,8 @@ async def hacs_repositories_clear_new(
         repository.data.new = False
 
     else:
-        for repo in hacs.repositories.list_all:
-            if repo.data.new and repo.data.category in msg.get("categories", []):
+        for repo in list(hacs.repositories.iter_new()):
+            if repo.data.category in msg.get("categories", []):
                 hacs.log.debug(
                     "Clearing new flag from '%s'",
                     repo.data.full_name,
@@ -117,6 +168,7 @@ async def hacs_repositories_clear_new(
 )
 @websocket_api.require_admin
 @websocket_api.async_response
+@measure_websocket_command
 async def hacs_repositories_removed(
     hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
@@ -140,6 +192,8 @@ async def hacs_repositories_removed(
 )
 @websocket_api.require_admin
 @websocket_api.async_response
+@measure_websocket_command
+@user_initiated
 async def hacs_repositories_add(
     hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
@@ -201,6 +255,7 @@ async def hacs_repositories_add(
 )
 @websocket_api.require_admin
 @websocket_api.async_response
+@measure_websocket_command
 async def hacs_repositories_remove(
     hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
@@ -11,6 +11,8 @@ import voluptuous as vol
 from ..const import DOMAIN
 from ..enums import HacsDispatchEvent
 from ..exceptions import HacsException
+from ..utils.concurrency import user_initiated
+from ..utils.telemetry import measure_websocket_command
 from ..utils.version import version_left_higher_then_right
 
 if TYPE_CHECKING:
@@ -27,6 +29,8 @@ if TYPE_CHECKING:
 )
 @websocket_api.require_admin
 @websocket_api.async_response
+@measure_websocket_command
+@user_initiated
 async def hacs_repository_info(
     hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
@@ -35,7 +39,7 @@ async def hacs_repository_info(
     """Return information about a repository."""
     hacs: HacsBase = hass.data.get(DOMAIN)
     repository_id = msg["repository_id"]
-    repository = hacs.repositories.get_by_id(repository_id)
+    repository = hacs.repositories.get_by_id(repository_id, promote=True)
     if repository is None:
         connection.send_error(
             msg["id"],
@@ -106,6 +110,7 @@ async def hacs_repository_info(
 )
 @websocket_api.require_admin
 @websocket_api.async_response
+@measure_websocket_command
 async def hacs_repository_ignore(
     hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
@@ -139,6 +144,7 @@ async def hacs_repository_ignore(
 )
 @websocket_api.require_admin
 @websocket_api.async_response
+@measure_websocket_command
 async def hacs_repository_state(
     hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
@@ -146,7 +152,7 @@ async def hacs_repository_state(
 ) -> None:
     """Set the state of a repository"""
     hacs: HacsBase = hass.data.get(DOMAIN)
-    repository = hacs.repositories.get_by_id(msg["repository"])
+    repository = hacs.repositories.get_by_id(msg["repository"], promote=True)
 
     repository.state = msg["state"]
 
@@ -163,6 +169,8 @@ async def hacs_repository_state(
 )
 @websocket_api.require_admin
 @websocket_api.async_response
+@measure_websocket_command
+@user_initiated
 async def hacs_repository_version(
     hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
@@ -170,7 +178,7 @@ async def hacs_repository_version(
 ) -> None:
     """Set the version of a repository"""
     hacs: HacsBase = hass.data.get(DOMAIN)
-    repository = hacs.repositories.get_by_id(msg["repository"])
+    repository = hacs.repositories.get_by_id(msg["repository"], promote=True)
 
     if msg["version"] == repository.data.default_branch:
         repository.data.selected_tag = None
@@ -193,6 +201,8 @@ async def hacs_repository_version(
 )
 @websocket_api.require_admin
 @websocket_api.async_response
+@measure_websocket_command
+@user_initiated
 async def hacs_repository_beta(
     hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
@@ -200,7 +210,7 @@ async def hacs_repository_beta(
 ) -> None:
     """Show or hide beta versions of a repository"""
     hacs: HacsBase = hass.data.get(DOMAIN)
-    repository = hacs.repositories.get_by_id(msg["repository"])
+    repository = hacs.repositories.get_by_id(msg["repository"], promote=True)
 
     repository.data.show_beta = msg["show_beta"]
 
@@ -220,6 +230,7 @@ async def hacs_repository_beta(
 )
 @websocket_api.require_admin
 @websocket_api.async_response
+@measure_websocket_command
 async def hacs_repository_download(
     hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
@@ -227,7 +238,7 @@ async def hacs_repository_download(
 ) -> None:
     """Set the version of a repository"""
     hacs: HacsBase = hass.data.get(DOMAIN)
-    repository = hacs.repositories.get_by_id(msg["repository"])
+    repository = hacs.repositories.get_by_id(msg["repository"], promote=True)
 
     try:
         was_installed = repository.data.installed
@@ -251,6 +262,8 @@ async def hacs_repository_download(
 )
 @websocket_api.require_admin
 @websocket_api.async_response
+@measure_websocket_command
+@user_initiated
 async def hacs_repository_remove(
     hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
@@ -258,7 +271,7 @@ async def hacs_repository_remove(
 ) -> None:
     """Remove a repository."""
     hacs: HacsBase = hass.data.get(DOMAIN)
-    repository = hacs.repositories.get_by_id(msg["repository"])
+    repository = hacs.repositories.get_by_id(msg["repository"], promote=True)
 
     repository.data.new = False
     try:
@@ -279,6 +292,8 @@ async def hacs_repository_remove(
 )
 @websocket_api.require_admin
 @websocket_api.async_response
+@measure_websocket_command
+@user_initiated
 async def hacs_repository_refresh(
     hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
@@ -286,12 +301,14 @@ async def hacs_repository_refresh(
 ) -> None:
     """Refresh a repository."""
     hacs: HacsBase = hass.data.get(DOMAIN)
-    repository = hacs.repositories.get_by_id(msg["repository"])
+    repository = hacs.repositories.get_by_id(msg["repository"], promote=True)
 
     await repository.update_repository(ignore_issues=True, force=True)
     await hacs.data.async_write()
     # Update state of update entity
-    hacs.coordinators[repository.data.category].async_update_listeners()
+    hacs.coordinators[repository.data.category].async_update_repository_listeners(
+        (repository.data.id,)
+    )
 
     connection.send_message(websocket_api.result_message(msg["id"], {}))
 
@@ -304,6 +321,7 @@ async def hacs_repository_refresh(
 )
 @websocket_api.require_admin
 @websocket_api.async_response
+@measure_websocket_command
 async def hacs_repository_release_notes(
     hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
@@ -311,7 +329,7 @@ async def hacs_repository_release_notes(
 ) -> None:
     """Return release notes."""
     hacs: HacsBase = hass.data.get(DOMAIN)
-    repository = hacs.repositories.get_by_id(msg["repository"])
+    repository = hacs.repositories.get_by_id(msg["repository"], promote=True)
 
     connection.send_message(
         websocket_api.result_message(
@@ -338,6 +356,8 @@ async def hacs_repository_release_notes(
 )
 @websocket_api.require_admin
 @websocket_api.async_response
+@measure_websocket_command
+@user_initiated
 async def hacs_repository_releases(
     hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
@@ -345,7 +365,7 @@ async def hacs_repository_releases(
 ) -> None:
     """Return releases."""
     hacs: HacsBase = hass.data.get(DOMAIN)
-    repository = hacs.repositories.get_by_id(msg["repository_id"])
+    repository = hacs.repositories.get_by_id(msg["repository_id"], promote=True)
     try:
         releases = await repository.async_get_releases()
     except Exception as exception:
@@ -0,0 +1 @@
+"""Offline benchmarks for HACS, against a local stand-in for GitHub and data-v2."""
@@ -0,0 +1,111 @@
+"""Run the HACS benchmarks.
+
+From the configuration directory:
+
+    python -m tools.hacs_benchmark --repositories 10000 --output bench_output.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from dataclasses import asdict
+import json
+import logging
+import resource
+import sys
+from typing import Any
+
+from .benchmarks import BENCHMARKS, BenchmarkOptions, async_run_benchmarks
+
+
+def _parse_arguments() -> argparse.Namespace:
+    """Parse the command line."""
+    defaults = BenchmarkOptions()
+    parser = argparse.ArgumentParser(prog="python -m tools.hacs_benchmark")
+    parser.add_argument(
+        "benchmarks", nargs="*", metavar="BENCHMARK", help=f"one of {', '.join(BENCHMARKS)}"
+    )
+    parser.add_argument("--repositories", type=int, default=defaults.repositories)
+    parser.add_argument("--custom-repositories", type=int, default=defaults.custom_repositories)
+    parser.add_argument("--installs", type=int, default=defaults.installs)
+    parser.add_argument("--rounds", type=int, default=defaults.rounds)
+    parser.add_argument("--file-size", type=int, default=defaults.file_size)
+    parser.add_argument(
+        "--files-per-repository", type=int, default=defaults.files_per_repository
+    )
+    parser.add_argument(
+        "--latency", type=float, default=defaults.latency, help="seconds added per request"
+    )
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc round")
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--compare", help="show the change against a previous JSON result")
+    parser.add_argument("--verbose", action="store_true", help="show HACS logging")
+    arguments = parser.parse_args()
+    if unknown := set(arguments.benchmarks) - set(BENCHMARKS):
+        parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+    return arguments
+
+
+def _format_results(
+    results: dict[str, dict[str, Any]], baseline: dict[str, dict[str, Any]] | None
+) -> str:
+    """Return the results as a table."""
+    lines = [
+        f"{'benchmark':<16}{'median s':>12}{'min s':>10}{'peak MB':>10}{'change':>10}  details"
+    ]
+    for name, result in results.items():
+        change = ""
+        if baseline and (previous := baseline.get(name)) and previous["median_seconds"]:
+            ratio = result["median_seconds"] / previous["median_seconds"] - 1
+            change = f"{ratio:+.1%}"
+        details = ", ".join(
+            f"{key}={value}"
+            for key, value in result.items()
+            if key not in ("median_seconds", "min_seconds", "max_seconds", "peak_memory_mb")
+        )
+        lines.append(
+            f"{name:<16}{result['median_seconds']:>12.4f}{result['min_seconds']:>10.4f}"
+            f"{result['peak_memory_mb'] or '-':>10}{change:>10}  {details}"
+        )
+    return "\n".join(lines)
+
+
+def main() -> int:
+    """Run the benchmarks and print the results."""
+    arguments = _parse_arguments()
+    logging.basicConfig(level=logging.DEBUG if arguments.verbose else logging.CRITICAL)
+    options = BenchmarkOptions(
+        repositories=arguments.repositories,
+        custom_repositories=arguments.custom_repositories,
+        installs=arguments.installs,
+        rounds=arguments.rounds,
+        file_size=arguments.file_size,
+        files_per_repository=arguments.files_per_repository,
+        latency=arguments.latency,
+        memory=not arguments.no_memory,
+    )
+
+    results = asyncio.run(async_run_benchmarks(options, arguments.benchmarks))
+
+    baseline = None
+    if arguments.compare:
+        with open(arguments.compare, encoding="utf-8") as file_handler:
+            baseline = json.load(file_handler)["results"]
+
+    print(_format_results(results, baseline))
+    max_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"\nmax RSS {max_rss_mb:.0f} MB")
+
+    if arguments.output:
+        with open(arguments.output, "w", encoding="utf-8") as file_handler:
+            json.dump(
+                {"options": asdict(options), "max_rss_mb": round(max_rss_mb), "results": results},
+                file_handler,
+                indent=2,
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,345 @@
+"""Benchmarks of the HACS hot paths against the fake server."""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+import json
+import pathlib
+import statistics
+import tempfile
+import time
+import tracemalloc
+from typing import Any
+
+from aiogithubapi import GitHub, GitHubAPI
+from aiogithubapi.const import ACCEPT_HEADERS
+from aiohttp import ClientSession
+from awesomeversion import AwesomeVersion
+from homeassistant.const import __version__ as HAVERSION
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import issue_registry
+
+from custom_components.hacs.base import HacsBase
+from custom_components.hacs.const import DOMAIN
+from custom_components.hacs.data_client import HacsDataClient
+from custom_components.hacs.enums import HacsCategory, HacsStage, LovelaceMode
+from custom_components.hacs.utils.data import HacsData
+from custom_components.hacs.utils.queue_manager import QueueManager
+
+from .catalogue import FakeCatalogue
+from .fake_server import FakeHacsServer
+
+HACS_MANIFEST = pathlib.Path(__file__).parents[2] / "custom_components/hacs/manifest.json"
+
+
+@dataclass
+class BenchmarkResult:
+    """Timings and resource use of one benchmark."""
+
+    name: str
+    seconds: list[float] = field(default_factory=list)
+    peak_memory_mb: float | None = None
+    extra: dict[str, Any] = field(default_factory=dict)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the result as a dict."""
+        return {
+            "median_seconds": round(statistics.median(self.seconds), 4),
+            "min_seconds": round(min(self.seconds), 4),
+            "max_seconds": round(max(self.seconds), 4),
+            "rounds": len(self.seconds),
+            "peak_memory_mb": self.peak_memory_mb,
+            **self.extra,
+        }
+
+
+@dataclass
+class BenchmarkOptions:
+    """Options for a benchmark run."""
+
+    repositories: int = 10_000
+    custom_repositories: int = 50
+    installs: int = 20
+    rounds: int = 5
+    file_size: int = 4096
+    files_per_repository: int = 5
+    latency: float = 0.0
+    memory: bool = True
+
+
+class BenchmarkContext:
+    """A fake server, a HomeAssistant instance and a HACS instance around them."""
+
+    def __init__(self, options: BenchmarkOptions) -> None:
+        """Initialize."""
+        self.options = options
+        self.catalogue = FakeCatalogue(
+            options.repositories,
+            custom_repositories=options.custom_repositories,
+            file_size=options.file_size,
+            files_per_repository=options.files_per_repository,
+        )
+        self.server = FakeHacsServer(self.catalogue, latency=options.latency)
+        self.hacs_version = AwesomeVersion(json.loads(HACS_MANIFEST.read_text())["version"])
+        self.session: ClientSession | None = None
+
+    @asynccontextmanager
+    async def async_hacs(self, config_dir: str | None = None):
+        """Yield a HACS instance set up like the integration does, without the frontend."""
+        with tempfile.TemporaryDirectory(prefix="hacs-bench-") as temporary_dir:
+            hass = HomeAssistant(config_dir or temporary_dir)
+            await issue_registry.async_load(hass)
+            hacs = self._create_hacs(hass)
+            try:
+                yield hacs
+            finally:
+                await hass.async_block_till_done()
+                await hass.async_stop(force=True)
+
+    def _create_hacs(self, hass: HomeAssistant) -> HacsBase:
+        """Create a HACS instance."""
+        hass.data[DOMAIN] = hacs = HacsBase()
+        hacs.enable_hacs()
+        client_name = f"HACS/{self.hacs_version}"
+        hacs.hass = hass
+        hacs.version = self.hacs_version
+        hacs.session = self.session
+        hacs.queue = QueueManager(hass=hass)
+        hacs.data = HacsData(hacs=hacs)
+        hacs.data_client = HacsDataClient(
+            session=self.session, client_name=client_name, cache=hacs.http_cache
+        )
+        hacs.configuration.token = "bench"
+        hacs.configuration.appdaemon = True
+        hacs.core.config_path = hass.config.path()
+        hacs.core.ha_version = AwesomeVersion(HAVERSION)
+        hacs.core.lovelace_mode = LovelaceMode.STORAGE
+        hacs.github = GitHub(
+            hacs.configuration.token,
+            self.session,
+            headers={"User-Agent": client_name, "Accept": ACCEPT_HEADERS["preview"]},
+        )
+        hacs.githubapi = GitHubAPI(
+            token=hacs.configuration.token, session=self.session, client_name=client_name
+        )
+        hacs.system.running = True
+        for category in self.catalogue.categories:
+            hacs.enable_hacs_category(HacsCategory(category))
+        return hacs
+
+    async def async_start(self) -> None:
+        """Start the fake server."""
+        await self.server.start()
+        self.session = self.server.client_session()
+
+    async def async_stop(self) -> None:
+        """Stop the fake server."""
+        if self.session is not None:
+            await self.session.close()
+        await self.server.stop()
+
+
+async def _measure(
+    context: BenchmarkContext,
+    name: str,
+    setup: Callable[[], Any],
+    run: Callable[[Any], Awaitable[dict[str, Any] | None]],
+) -> BenchmarkResult:
+    """Run a benchmark for the configured rounds, and once more under tracemalloc."""
+    result = BenchmarkResult(name)
+    rounds = context.options.rounds + (1 if context.options.memory else 0)
+    for round_number in range(rounds):
+        traced = context.options.memory and round_number == rounds - 1
+        async with setup() as state:
+            context.server.reset_counters()
+            if traced:
+                tracemalloc.start()
+            started = time.perf_counter()
+            extra = await run(state)
+            duration = time.perf_counter() - started
+            if traced:
+                result.peak_memory_mb = round(tracemalloc.get_traced_memory()[1] / 1e6, 2)
+                tracemalloc.stop()
+            else:
+                result.seconds.append(duration)
+                result.extra.update(extra or {})
+                result.extra["requests"] = context.server.requests.total()
+                result.extra["bytes_received"] = context.server.bytes_sent
+    return result
+
+
+async def bench_startup_cold(context: BenchmarkContext) -> BenchmarkResult:
+    """Restore an empty store and load every category catalogue."""
+
+    async def run(hacs: HacsBase) -> dict[str, Any]:
+        hacs.set_stage(HacsStage.STARTUP)
+        await hacs.data.restore()
+        await hacs.async_get_all_category_repositories()
+        return {"repositories": len(hacs.repositories.list_all)}
+
+    return await _measure(context, "startup_cold", context.async_hacs, run)
+
+
+@asynccontextmanager
+async def _with_stored_catalogue(context: BenchmarkContext):
+    """Yield a config dir with the stores written after a cold start."""
+    with tempfile.TemporaryDirectory(prefix="hacs-bench-store-") as config_dir:
+        async with context.async_hacs(config_dir) as hacs:
+            hacs.set_stage(HacsStage.STARTUP)
+            await hacs.data.restore()
+            await hacs.async_get_all_category_repositories()
+            await hacs.data.async_write(force=True)
+        yield config_dir
+
+
+async def bench_startup_warm(context: BenchmarkContext) -> BenchmarkResult:
+    """Restore a populated store, the catalogue fetches are answered with 304."""
+
+    @asynccontextmanager
+    async def setup():
+        async with _with_stored_catalogue(context) as config_dir:
+            async with context.async_hacs(config_dir) as hacs:
+                yield hacs
+
+    async def run(hacs: HacsBase) -> dict[str, Any]:
+        hacs.set_stage(HacsStage.STARTUP)
+        await hacs.data.restore()
+        await hacs.async_get_all_category_repositories()
+        return {"repositories": len(hacs.repositories.list_all)}
+
+    return await _measure(context, "startup_warm", setup, run)
+
+
+async def bench_restore(context: BenchmarkContext) -> BenchmarkResult:
+    """Run HacsData.restore on a populated store."""
+
+    @asynccontextmanager
+    async def setup():
+        async with _with_stored_catalogue(context) as config_dir:
+            async with context.async_hacs(config_dir) as hacs:
+                yield hacs
+
+    async def run(hacs: HacsBase) -> dict[str, Any]:
+        await hacs.data.restore()
+        return {"repositories": len(hacs.repositories.list_all)}
+
+    return await _measure(context, "restore", setup, run)
+
+
+async def bench_listing(context: BenchmarkContext) -> BenchmarkResult:
+    """Build the hacs/repositories/list payload for all categories, cold then warm."""
+
+    @asynccontextmanager
+    async def setup():
+        async with context.async_hacs() as hacs:
+            await hacs.async_get_all_category_repositories()
+            yield hacs
+
+    async def run(hacs: HacsBase) -> dict[str, Any]:
+        categories = sorted(hacs.common.categories)
+        hacs.repositories_list_cache.async_clear()
+        started = time.perf_counter()
+        payload = hacs.repositories_list_cache.async_get_payload(categories)
+        cold = time.perf_counter() - started
+        started = time.perf_counter()
+        hacs.repositories_list_cache.async_get_payload(categories)
+        warm = time.perf_counter() - started
+        return {
+            "cold_seconds": round(cold, 4),
+            "warm_seconds": round(warm, 6),
+            "payload_bytes": len(payload),
+        }
+
+    return await _measure(context, "listing", setup, run)
+
+
+async def bench_install(context: BenchmarkContext) -> BenchmarkResult:
+    """Install integrations from the catalogue, both plain files and zip releases."""
+    full_names = [
+        repository.full_name
+        for repository in context.catalogue.by_category["integration"][
+            : context.options.installs
+        ]
+    ]
+
+    @asynccontextmanager
+    async def setup():
+        async with context.async_hacs() as hacs:
+            await hacs.async_get_all_category_repositories()
+            yield hacs
+
+    async def run(hacs: HacsBase) -> dict[str, Any]:
+        started = time.perf_counter()
+        for full_name in full_names:
+            repository = hacs.repositories.get_by_full_name(full_name, promote=True)
+            await repository.async_install()
+        duration = time.perf_counter() - started
+        return {
+            "installs": len(full_names),
+            "installs_per_second": round(len(full_names) / duration, 2),
+            "downloaded_mb_per_second": round(
+                hacs.telemetry.downloaded_bytes / 1e6 / duration, 2
+            ),
+            "github_calls": hacs.telemetry.github_calls_total,
+        }
+
+    return await _measure(context, "install", setup, run)
+
+
+async def bench_update_custom(context: BenchmarkContext) -> BenchmarkResult:
+    """Check downloaded custom repositories when a tenth of them published a release."""
+    custom = context.catalogue.custom
+
+    @asynccontextmanager
+    async def setup():
+        async with context.async_hacs() as hacs:
+            for repository in custom:
+                await hacs.async_register_repository(
+                    repository.full_name, HacsCategory.INTEGRATION
+                )
+                if registered := hacs.repositories.get_by_full_name(repository.full_name):
+                    registered.data.installed = True
+                    registered.data.installed_version = registered.data.last_version
+            context.catalogue.publish(custom[::10])
+            yield hacs
+
+    async def run(hacs: HacsBase) -> dict[str, Any]:
+        await hacs.async_update_downloaded_custom_repositories()
+        await hacs.queue.execute()
+        return {
+            "custom_repositories": len(custom),
+            "pending_updates": sum(
+                1
+                for repository in hacs.repositories.iter_downloaded()
+                if repository.pending_update
+            ),
+        }
+
+    return await _measure(context, "update_custom", setup, run)
+
+
+BENCHMARKS: dict[str, Callable[[BenchmarkContext], Awaitable[BenchmarkResult]]] = {
+    "startup_cold": bench_startup_cold,
+    "startup_warm": bench_startup_warm,
+    "restore": bench_restore,
+    "listing": bench_listing,
+    "install": bench_install,
+    "update_custom": bench_update_custom,
+}
+
+
+async def async_run_benchmarks(
+    options: BenchmarkOptions, selected: list[str] | None = None
+) -> dict[str, dict[str, Any]]:
+    """Run the selected benchmarks, all of them by default."""
+    context = BenchmarkContext(options)
+    await context.async_start()
+    try:
+        results = {}
+        for name in selected or BENCHMARKS:
+            results[name] = (await BENCHMARKS[name](context)).as_dict()
+        return results
+    finally:
+        await context.async_stop()
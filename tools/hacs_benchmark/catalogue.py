@@ -0,0 +1,356 @@
+"""Synthetic HACS catalogue and repository contents for the fake server."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from functools import cached_property
+import hashlib
+import io
+import json
+import random
+import time
+from typing import Any
+import zipfile
+
+# Share of the catalogue per category, roughly matching the real default lists
+CATEGORY_SHARE = {
+    "integration": 0.45,
+    "plugin": 0.30,
+    "theme": 0.12,
+    "appdaemon": 0.06,
+    "python_script": 0.04,
+    "template": 0.03,
+}
+
+# Every nth integration is published as a zip release asset instead of plain files
+ZIP_RELEASE_EVERY = 4
+
+TOPICS = ("automation", "climate", "energy", "lights", "media", "sensor", "ui", "weather")
+
+
+def _sha(*parts: Any) -> str:
+    """Return a stable 40 character hex digest for the parts."""
+    return hashlib.sha1("/".join(map(str, parts)).encode()).hexdigest()
+
+
+def _iso(timestamp: float) -> str:
+    """Return a GitHub style timestamp."""
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(timestamp))
+
+
+@dataclass(slots=True)
+class FakeRepository:
+    """A repository in the synthetic catalogue."""
+
+    id: int
+    category: str
+    owner: str
+    name: str
+    file_size: int
+    files_per_repository: int
+    revision: int = 0
+    stars: int = 0
+    topics: list[str] = field(default_factory=list)
+    updated: float = 0.0
+    custom: bool = False
+    _files: dict[str, bytes] | None = None
+
+    @property
+    def full_name(self) -> str:
+        """Return owner/name."""
+        return f"{self.owner}/{self.name}"
+
+    @property
+    def domain(self) -> str:
+        """Return the integration domain."""
+        return f"bench_{self.id}"
+
+    @property
+    def version(self) -> str:
+        """Return the latest release tag."""
+        return f"v1.{self.revision}.0"
+
+    @property
+    def commit(self) -> str:
+        """Return the head commit of the default branch."""
+        return _sha(self.full_name, self.revision)
+
+    @property
+    def zip_release(self) -> bool:
+        """Return True if the repository is published as a zip release asset."""
+        return self.category == "integration" and self.id % ZIP_RELEASE_EVERY == 0
+
+    @property
+    def zip_filename(self) -> str:
+        """Return the name of the zip release asset."""
+        return f"{self.domain}.zip"
+
+    @property
+    def plugin_filename(self) -> str:
+        """Return the name of the plugin file."""
+        return f"{self.name}.js"
+
+    def bump(self, now: float) -> None:
+        """Publish a new release."""
+        self.revision += 1
+        self.updated = now
+        self._files = None
+
+    def hacs_manifest(self) -> dict[str, Any]:
+        """Return the hacs.json content."""
+        manifest: dict[str, Any] = {"name": f"Bench {self.category} {self.id}"}
+        if self.zip_release:
+            manifest["zip_release"] = True
+            manifest["filename"] = self.zip_filename
+        if self.category == "plugin":
+            manifest["filename"] = self.plugin_filename
+        return manifest
+
+    def _payload(self, path: str) -> bytes:
+        """Return deterministic filler content of the configured size."""
+        seed = f"# {self.full_name} {self.version} {path}\n".encode()
+        return (seed * (self.file_size // len(seed) + 1))[: self.file_size]
+
+    def files(self) -> dict[str, bytes]:
+        """Return the files in the default branch and the latest release."""
+        if self._files is not None:
+            return self._files
+
+        files = {"hacs.json": json.dumps(self.hacs_manifest()).encode(), "README.md": b"# Bench"}
+        extra = max(self.files_per_repository - 1, 0)
+        if self.category == "integration":
+            base = f"custom_components/{self.domain}"
+            files[f"{base}/manifest.json"] = json.dumps(
+                {
+                    "domain": self.domain,
+                    "name": f"Bench {self.id}",
+                    "codeowners": [f"@{self.owner}"],
+                    "documentation": f"https://github.com/{self.full_name}",
+                    "issue_tracker": f"https://github.com/{self.full_name}/issues",
+                    "version": self.version.removeprefix("v"),
+                }
+            ).encode()
+            files[f"{base}/__init__.py"] = self._payload("__init__.py")
+            for index in range(1, extra):
+                files[f"{base}/module_{index}.py"] = self._payload(f"module_{index}.py")
+        elif self.category == "plugin":
+            files[f"dist/{self.plugin_filename}"] = self._payload(self.plugin_filename)
+        elif self.category == "theme":
+            files[f"themes/{self.name}.yaml"] = self._payload("theme.yaml")
+        elif self.category == "appdaemon":
+            for index in range(max(extra, 1)):
+                files[f"apps/{self.name}/app_{index}.py"] = self._payload(f"app_{index}.py")
+        elif self.category == "python_script":
+            files[f"python_scripts/{self.name}.py"] = self._payload("script.py")
+        elif self.category == "template":
+            files[f"{self.name}.jinja"] = self._payload("template.jinja")
+
+        self._files = files
+        return files
+
+    def zip_asset(self) -> bytes:
+        """Return the zip release asset with the integration files at the root."""
+        prefix = f"custom_components/{self.domain}/"
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+            for path, content in self.files().items():
+                if path.startswith(prefix):
+                    archive.writestr(path.removeprefix(prefix), content)
+        return buffer.getvalue()
+
+    def catalogue_entry(self) -> dict[str, Any]:
+        """Return the data-v2 data.json entry."""
+        entry: dict[str, Any] = {
+            "description": f"Synthetic {self.category} number {self.id}",
+            "downloads": self.stars * 3,
+            "etag_repository": f'W/"{_sha("etag", self.full_name, self.revision)}"',
+            "full_name": self.full_name,
+            "last_commit": self.commit[:7],
+            "last_fetched": self.updated,
+            "last_updated": _iso(self.updated),
+            "last_version": self.version,
+            "manifest": {"name": f"Bench {self.category} {self.id}"},
+            "open_issues": self.id % 17,
+            "stargazers_count": self.stars,
+            "topics": self.topics,
+        }
+        if self.category == "integration":
+            entry["domain"] = self.domain
+            entry["manifest_name"] = f"Bench {self.id}"
+        return entry
+
+    def api_repository(self) -> dict[str, Any]:
+        """Return the REST representation of the repository."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "full_name": self.full_name,
+            "owner": {"login": self.owner, "type": "User"},
+            "description": f"Synthetic {self.category} number {self.id}",
+            "default_branch": "main",
+            "archived": False,
+            "fork": False,
+            "stargazers_count": self.stars,
+            "open_issues_count": self.id % 17,
+            "pushed_at": _iso(self.updated),
+            "topics": self.topics,
+        }
+
+    def api_releases(self) -> list[dict[str, Any]]:
+        """Return the REST releases, newest first."""
+        releases = []
+        for revision in range(self.revision, max(self.revision - 3, -1), -1):
+            tag = f"v1.{revision}.0"
+            download_base = f"https://github.com/{self.full_name}/releases/download/{tag}"
+            assets = []
+            if self.zip_release:
+                assets.append((self.zip_filename, "application/zip"))
+            if self.category == "plugin":
+                assets.append((self.plugin_filename, "text/javascript"))
+            releases.append(
+                {
+                    "id": self.id * 1000 + revision,
+                    "tag_name": tag,
+                    "name": tag,
+                    "body": f"Release {tag} of {self.full_name}",
+                    "draft": False,
+                    "prerelease": False,
+                    "published_at": _iso(self.updated - (self.revision - revision) * 86400),
+                    "assets": [
+                        {
+                            "name": filename,
+                            "content_type": content_type,
+                            "download_count": self.stars,
+                            "browser_download_url": f"{download_base}/{filename}",
+                        }
+                        for filename, content_type in assets
+                    ],
+                }
+            )
+        return releases
+
+    def api_tree(self) -> list[dict[str, Any]]:
+        """Return the recursive git tree of the latest release."""
+        files = self.files()
+        directories = {
+            path.rsplit("/", index)[0]
+            for path in files
+            for index in range(1, path.count("/") + 1)
+        }
+        tree = [
+            {"path": path, "mode": "040000", "type": "tree", "sha": _sha(self.full_name, path)}
+            for path in sorted(directories)
+        ]
+        tree.extend(
+            {
+                "path": path,
+                "mode": "100644",
+                "type": "blob",
+                "sha": _sha(self.full_name, path, self.revision),
+                "size": len(content),
+            }
+            for path, content in sorted(files.items())
+        )
+        return tree
+
+    def graphql_status(self) -> dict[str, Any]:
+        """Return the batched GraphQL status of the repository."""
+        return {
+            "isArchived": False,
+            "stargazerCount": self.stars,
+            "pushedAt": _iso(self.updated),
+            "defaultBranchRef": {"name": "main", "target": {"oid": self.commit}},
+            "releases": {
+                "nodes": [{"tagName": self.version, "isDraft": False, "isPrerelease": False}]
+            },
+        }
+
+
+class FakeCatalogue:
+    """A deterministic catalogue of synthetic repositories.
+
+    The last custom_repositories repositories are integrations that are not
+    in the data-v2 catalogue, like repositories users add themselves.
+    """
+
+    def __init__(
+        self,
+        repositories: int = 10_000,
+        *,
+        custom_repositories: int = 50,
+        seed: int = 0,
+        file_size: int = 4096,
+        files_per_repository: int = 5,
+    ) -> None:
+        """Initialize."""
+        rng = random.Random(seed)
+        now = time.time()
+        self.by_full_name: dict[str, FakeRepository] = {}
+        self.by_category: dict[str, list[FakeRepository]] = {c: [] for c in CATEGORY_SHARE}
+        self.custom: list[FakeRepository] = []
+        self._encoded: dict[str, bytes] = {}
+
+        categories = list(CATEGORY_SHARE)
+        weights = list(CATEGORY_SHARE.values())
+        for index in range(repositories):
+            custom = index >= repositories - custom_repositories
+            category = "integration" if custom else rng.choices(categories, weights)[0]
+            repository = FakeRepository(
+                id=100_000_000 + index,
+                category=category,
+                owner=f"bench-custom-{index % 97}" if custom else f"bench-owner-{index % 997}",
+                name=f"{category.replace('_', '-')}-{index}",
+                file_size=file_size,
+                files_per_repository=files_per_repository,
+                revision=rng.randrange(0, 20),
+                stars=int(rng.paretovariate(1.2)),
+                topics=rng.sample(TOPICS, rng.randrange(0, 4)),
+                updated=now - rng.randrange(0, 365 * 86400),
+                custom=custom,
+            )
+            self.by_full_name[repository.full_name.lower()] = repository
+            if custom:
+                self.custom.append(repository)
+            else:
+                self.by_category[category].append(repository)
+
+    def __len__(self) -> int:
+        """Return the number of repositories."""
+        return len(self.by_full_name)
+
+    def get(self, owner: str, name: str) -> FakeRepository | None:
+        """Return a repository by owner and name."""
+        return self.by_full_name.get(f"{owner}/{name}".lower())
+
+    @cached_property
+    def categories(self) -> list[str]:
+        """Return the categories with repositories."""
+        return [category for category, repos in self.by_category.items() if repos]
+
+    def data_json(self, category: str) -> bytes:
+        """Return the encoded data.json of a category."""
+        key = f"{category}/data.json"
+        if (encoded := self._encoded.get(key)) is None:
+            encoded = self._encoded[key] = json.dumps(
+                {
+                    str(repository.id): repository.catalogue_entry()
+                    for repository in self.by_category.get(category, [])
+                }
+            ).encode()
+        return encoded
+
+    def repositories_json(self, category: str) -> bytes:
+        """Return the encoded repositories.json of a category."""
+        key = f"{category}/repositories.json"
+        if (encoded := self._encoded.get(key)) is None:
+            encoded = self._encoded[key] = json.dumps(
+                [repository.full_name for repository in self.by_category.get(category, [])]
+            ).encode()
+        return encoded
+
+    def publish(self, repositories: list[FakeRepository]) -> None:
+        """Publish new releases, as upstream would between two checks."""
+        now = time.time()
+        for repository in repositories:
+            repository.bump(now)
+        self._encoded.clear()
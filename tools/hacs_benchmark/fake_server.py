@@ -0,0 +1,265 @@
+"""Local stand-in for data-v2.hacs.xyz, the GitHub API and GitHub downloads."""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+from collections import Counter
+import hashlib
+import json
+import time
+from typing import Any
+import warnings
+
+from aiohttp import ClientSession, web
+from yarl import URL
+
+from .catalogue import FakeCatalogue, FakeRepository
+
+# Hosts HACS talks to, and the path prefix they are served under locally
+UPSTREAM_HOSTS = {
+    "data-v2.hacs.xyz": "/data-v2",
+    "api.github.com": "/api",
+    "github.com": "/web",
+    "raw.githubusercontent.com": "/raw",
+}
+
+RATE_LIMIT = 5000
+
+
+class FakeHacsServer:
+    """Serve a FakeCatalogue the way the real upstream services would.
+
+    Every response carries an ETag and is answered with 304 when the client
+    sends a matching If-None-Match. API responses carry rate limit headers
+    for the core and graphql resources, which are reset with the counters.
+    """
+
+    def __init__(self, catalogue: FakeCatalogue, *, latency: float = 0.0) -> None:
+        """Initialize."""
+        self.catalogue = catalogue
+        self.latency = latency
+        self.requests: Counter[str] = Counter()
+        self.bytes_sent = 0
+        self._used: Counter[str] = Counter()
+        self._reset = int(time.time()) + 3600
+        self._runner: web.AppRunner | None = None
+        self.base_url: URL | None = None
+
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_get("/data-v2/{section}/{filename}", self._data_v2)
+        app.router.add_get("/api/rate_limit", self._rate_limit)
+        app.router.add_post("/api/graphql", self._graphql)
+        app.router.add_get("/api/repos/{owner}/{name}", self._repository)
+        app.router.add_get("/api/repos/{owner}/{name}/releases", self._releases)
+        app.router.add_get("/api/repos/{owner}/{name}/branches/{branch}", self._branch)
+        app.router.add_get("/api/repos/{owner}/{name}/git/trees/{ref:.+}", self._tree)
+        app.router.add_get("/api/repos/{owner}/{name}/contents/{path:.+}", self._contents)
+        app.router.add_get(
+            "/web/{owner}/{name}/releases/download/{tag}/{filename}", self._release_asset
+        )
+        app.router.add_get("/web/{owner}/{name}/archive/{ref:.+}.zip", self._archive)
+        app.router.add_get("/raw/{owner}/{name}/{ref}/{path:.+}", self._raw)
+        self.app = app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> URL:
+        """Start serving, and return the base URL."""
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound_port = site._server.sockets[0].getsockname()[1]  # noqa: SLF001
+        self.base_url = URL.build(scheme="http", host=host, port=bound_port)
+        return self.base_url
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def reset_counters(self) -> None:
+        """Reset request counters and the rate limit."""
+        self.requests.clear()
+        self.bytes_sent = 0
+        self._used.clear()
+
+    def client_session(self) -> ClientSession:
+        """Return a client session that sends upstream requests to this server."""
+        if self.base_url is None:
+            raise RuntimeError("The server is not started")
+        return RedirectingClientSession(self.base_url)
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler: Any) -> web.StreamResponse:
+        """Count requests, add latency, rate limit headers and conditional responses."""
+        route = request.match_info.route.resource
+        self.requests[route.canonical if route is not None else request.path] += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        resource = None
+        if request.path.startswith("/api/"):
+            resource = "graphql" if request.path == "/api/graphql" else "core"
+            self._used[resource] += 1
+
+        response = await handler(request)
+
+        if resource is not None:
+            response.headers.update(self._rate_limit_headers(resource))
+        if isinstance(response, web.Response) and response.body is not None:
+            etag = f'"{hashlib.sha1(response.body).hexdigest()}"'
+            response.headers["ETag"] = etag
+            if request.headers.get("If-None-Match") == etag:
+                return web.Response(status=304, headers=response.headers)
+            self.bytes_sent += len(response.body)
+        return response
+
+    def _rate_limit_headers(self, resource: str) -> dict[str, str]:
+        """Return the rate limit headers of a resource."""
+        return {
+            "X-RateLimit-Limit": str(RATE_LIMIT),
+            "X-RateLimit-Remaining": str(max(RATE_LIMIT - self._used[resource], 0)),
+            "X-RateLimit-Reset": str(self._reset),
+            "X-RateLimit-Used": str(self._used[resource]),
+            "X-RateLimit-Resource": resource,
+        }
+
+    def _get_repository(self, request: web.Request) -> FakeRepository:
+        """Return the requested repository, or raise 404."""
+        repository = self.catalogue.get(request.match_info["owner"], request.match_info["name"])
+        if repository is None:
+            raise web.HTTPNotFound(
+                text=json.dumps({"message": "Not Found"}), content_type="application/json"
+            )
+        return repository
+
+    async def _data_v2(self, request: web.Request) -> web.Response:
+        """Serve data-v2 files."""
+        section = request.match_info["section"]
+        filename = request.match_info["filename"]
+        if section in ("critical", "removed") and filename == "data.json":
+            body = b"[]"
+        elif filename == "data.json":
+            body = self.catalogue.data_json(section)
+        elif filename == "repositories.json":
+            body = self.catalogue.repositories_json(section)
+        else:
+            raise web.HTTPNotFound
+        return web.Response(body=body, content_type="application/json")
+
+    async def _rate_limit(self, _: web.Request) -> web.Response:
+        """Serve the rate limit."""
+        resources = {
+            resource: {
+                "limit": RATE_LIMIT,
+                "used": self._used[resource],
+                "remaining": max(RATE_LIMIT - self._used[resource], 0),
+                "reset": self._reset,
+            }
+            for resource in ("core", "graphql")
+        }
+        return web.json_response({"resources": resources, "rate": resources["core"]})
+
+    async def _graphql(self, request: web.Request) -> web.Response:
+        """Answer batched repository status queries."""
+        payload = await request.json()
+        variables = payload.get("variables") or {}
+        data: dict[str, Any] = {"rateLimit": {"cost": 1}}
+        index = 0
+        while (owner := variables.get(f"o{index}")) is not None:
+            repository = self.catalogue.get(owner, variables[f"n{index}"])
+            data[f"r{index}"] = repository.graphql_status() if repository else None
+            index += 1
+        return web.json_response({"data": data})
+
+    async def _repository(self, request: web.Request) -> web.Response:
+        """Serve a repository."""
+        return web.json_response(self._get_repository(request).api_repository())
+
+    async def _releases(self, request: web.Request) -> web.Response:
+        """Serve the releases of a repository."""
+        return web.json_response(self._get_repository(request).api_releases())
+
+    async def _branch(self, request: web.Request) -> web.Response:
+        """Serve the default branch of a repository."""
+        repository = self._get_repository(request)
+        return web.json_response(
+            {"name": request.match_info["branch"], "commit": {"sha": repository.commit}}
+        )
+
+    async def _tree(self, request: web.Request) -> web.Response:
+        """Serve the recursive tree of a repository."""
+        repository = self._get_repository(request)
+        return web.json_response(
+            {"sha": repository.commit, "tree": repository.api_tree(), "truncated": False}
+        )
+
+    async def _contents(self, request: web.Request) -> web.Response:
+        """Serve a file through the contents API."""
+        repository = self._get_repository(request)
+        path = request.match_info["path"]
+        if (content := repository.files().get(path)) is None:
+            raise web.HTTPNotFound(
+                text=json.dumps({"message": "Not Found"}), content_type="application/json"
+            )
+        ref = request.query.get("ref", "main")
+        return web.json_response(
+            {
+                "type": "file",
+                "encoding": "base64",
+                "name": path.rsplit("/", 1)[-1],
+                "path": path,
+                "size": len(content),
+                "content": base64.b64encode(content).decode(),
+                "download_url": (
+                    f"https://raw.githubusercontent.com/{repository.full_name}/{ref}/{path}"
+                ),
+            }
+        )
+
+    async def _release_asset(self, request: web.Request) -> web.Response:
+        """Serve a release asset."""
+        repository = self._get_repository(request)
+        filename = request.match_info["filename"]
+        if repository.zip_release and filename == repository.zip_filename:
+            return web.Response(body=repository.zip_asset(), content_type="application/zip")
+        if repository.category == "plugin" and filename == repository.plugin_filename:
+            return web.Response(
+                body=repository.files()[f"dist/{filename}"], content_type="text/javascript"
+            )
+        raise web.HTTPNotFound
+
+    async def _archive(self, request: web.Request) -> web.Response:
+        """Serve a zipball of the repository."""
+        repository = self._get_repository(request)
+        return web.Response(body=repository.zip_asset(), content_type="application/zip")
+
+    async def _raw(self, request: web.Request) -> web.Response:
+        """Serve a raw file."""
+        repository = self._get_repository(request)
+        if (content := repository.files().get(request.match_info["path"])) is None:
+            raise web.HTTPNotFound
+        return web.Response(body=content, content_type="application/octet-stream")
+
+
+with warnings.catch_warnings():
+    # aiohttp discourages subclassing ClientSession, this is only used by the harness
+    warnings.simplefilter("ignore", DeprecationWarning)
+
+    class RedirectingClientSession(ClientSession):
+        """A client session that sends requests for upstream hosts to the fake server."""
+
+        ATTRS = ClientSession.ATTRS | frozenset(["_fake_base_url"])
+
+        def __init__(self, base_url: URL, **kwargs: Any) -> None:
+            """Initialize."""
+            super().__init__(**kwargs)
+            self._fake_base_url = base_url
+
+        def _request(self, method: str, str_or_url: Any, **kwargs: Any) -> Any:
+            """Rewrite the URL before the request is made."""
+            url = URL(str_or_url)
+            if (prefix := UPSTREAM_HOSTS.get(url.host or "")) is not None:
+                url = URL(f"{self._fake_base_url}{prefix}{url.raw_path_qs}", encoded=True)
+            return super()._request(method, url, **kwargs)